@@ -33,7 +33,8 @@ import app.models.media
 import app.models.news
 import app.models.people
 import app.models.taxonomy
-import app.models.project 
+import app.models.project
+import app.models.content_version
 
 
 # ВАЖНО: явно подтянуть модули с моделями, чтобы они зарегистрировались в Base.metadata
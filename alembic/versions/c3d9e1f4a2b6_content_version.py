@@ -0,0 +1,81 @@
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "c3d9e1f4a2b6"
+down_revision = "b7856a5f0b01"
+branch_labels = None
+depends_on = None
+
+
+# Таблица -> сущности, чьи публичные ответы зависят от неё (совпадает с тегами app.services.cache)
+TRIGGER_ENTITIES = {
+    "project": ("project",),
+    "project_i18n": ("project",),
+    "project_media": ("project",),
+    "project_style_link": ("project",),
+    "project_type": ("project",),
+    "project_type_i18n": ("project",),
+    "project_style": ("project",),
+    "project_style_i18n": ("project",),
+    "location": ("project",),
+    "location_i18n": ("project",),
+    "news": ("news",),
+    "news_i18n": ("news",),
+    "news_media": ("news",),
+    "person": ("person", "project"),
+    "person_i18n": ("person", "project"),
+    "person_role": ("person", "project"),
+    "person_role_i18n": ("person", "project"),
+    "project_person_role": ("person", "project"),
+    "career": ("career",),
+    "career_i18n": ("career",),
+    "media_asset": ("project", "news", "person"),
+    "media_asset_i18n": ("project", "news", "person"),
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "content_version",
+        sa.Column("entity", sa.String(), nullable=False),
+        sa.Column("version", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("changed_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("entity"),
+    )
+    op.execute(
+        "INSERT INTO content_version (entity) VALUES ('project'), ('news'), ('person'), ('career');"
+    )
+    op.execute(
+        """
+CREATE OR REPLACE FUNCTION bump_content_version() RETURNS trigger AS $$
+DECLARE
+  e text;
+BEGIN
+  FOREACH e IN ARRAY TG_ARGV LOOP
+    INSERT INTO content_version AS cv (entity, version, changed_at)
+    VALUES (e, 1, clock_timestamp())
+    ON CONFLICT (entity) DO UPDATE
+      SET version = cv.version + 1, changed_at = clock_timestamp();
+  END LOOP;
+  RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+"""
+    )
+    for table, entities in TRIGGER_ENTITIES.items():
+        args = ", ".join(f"'{e}'" for e in entities)
+        op.execute(
+            f"""
+CREATE TRIGGER trg_{table}_content_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+FOR EACH STATEMENT EXECUTE FUNCTION bump_content_version({args});
+"""
+        )
+
+
+def downgrade() -> None:
+    for table in TRIGGER_ENTITIES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_content_version ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS bump_content_version();")
+    op.drop_table("content_version")
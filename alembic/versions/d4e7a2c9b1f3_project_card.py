@@ -0,0 +1,144 @@
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "d4e7a2c9b1f3"
+down_revision = "c3d9e1f4a2b6"
+branch_labels = None
+depends_on = None
+
+
+# Таблица -> события, после которых карточки затронутых проектов пересобираются
+SYNC_TRIGGERS = {
+    "project": "INSERT OR UPDATE OF slug, is_published, published_at, order_index, cover_media_id, location_id, type_id",
+    "project_i18n": "INSERT OR DELETE OR UPDATE OF project_id, locale, name, subname, short_description",
+    "media_asset": "UPDATE OF file_path",
+    "media_asset_i18n": "INSERT OR DELETE OR UPDATE",
+    "location_i18n": "INSERT OR DELETE OR UPDATE",
+    "project_type_i18n": "INSERT OR DELETE OR UPDATE",
+}
+
+
+def upgrade() -> None:
+    language_enum = postgresql.ENUM("en", "ru", "tk", name="language_enum", create_type=False)
+
+    op.create_table(
+        "project_card",
+        sa.Column("project_id", sa.UUID(), nullable=False),
+        sa.Column("locale", language_enum, nullable=False),
+        sa.Column("slug", sa.String(), nullable=False),
+        sa.Column("is_published", sa.Boolean(), nullable=False),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("order_index", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("subname", sa.String(), nullable=True),
+        sa.Column("short_description", sa.Text(), nullable=True),
+        sa.Column("cover_path", sa.String(), nullable=True),
+        sa.Column("cover_alt", sa.String(), nullable=True),
+        sa.Column("location_id", sa.UUID(), nullable=True),
+        sa.Column("city", sa.String(), nullable=True),
+        sa.Column("country", sa.String(), nullable=True),
+        sa.Column("type_id", sa.UUID(), nullable=True),
+        sa.Column("type_title", sa.String(), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["project.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id", "locale"),
+    )
+    op.create_index(
+        "ix_project_card_listing",
+        "project_card",
+        ["locale", "is_published", sa.text("order_index DESC"), sa.text("published_at DESC"), "project_id"],
+        unique=False,
+    )
+
+    op.execute(
+        """
+CREATE OR REPLACE FUNCTION refresh_project_card(ids uuid[], only_locale language_enum DEFAULT NULL)
+RETURNS void AS $$
+BEGIN
+  DELETE FROM project_card
+   WHERE project_id = ANY(ids) AND (only_locale IS NULL OR locale = only_locale);
+
+  INSERT INTO project_card (
+    project_id, locale, slug, is_published, published_at, order_index,
+    name, subname, short_description, cover_path, cover_alt,
+    location_id, city, country, type_id, type_title, refreshed_at
+  )
+  SELECT p.id, l.locale, p.slug, p.is_published, p.published_at, p.order_index,
+         pi.name, pi.subname, pi.short_description, ma.file_path, mai.alt_text,
+         p.location_id, li.city, li.country, p.type_id, pti.title, now()
+    FROM project p
+   CROSS JOIN unnest(
+         CASE WHEN only_locale IS NULL THEN enum_range(NULL::language_enum) ELSE ARRAY[only_locale] END
+       ) AS l(locale)
+    LEFT JOIN project_i18n pi ON pi.project_id = p.id AND pi.locale = l.locale
+    LEFT JOIN media_asset ma ON ma.id = p.cover_media_id
+    LEFT JOIN media_asset_i18n mai ON mai.media_asset_id = p.cover_media_id AND mai.locale = l.locale
+    LEFT JOIN location_i18n li ON li.location_id = p.location_id AND li.locale = l.locale
+    LEFT JOIN project_type_i18n pti ON pti.type_id = p.type_id AND pti.locale = l.locale
+   WHERE p.id = ANY(ids);
+END
+$$ LANGUAGE plpgsql;
+"""
+    )
+    op.execute(
+        """
+CREATE OR REPLACE FUNCTION project_card_ids(tbl text, r jsonb) RETURNS uuid[] AS $$
+  SELECT CASE
+    WHEN r IS NULL THEN '{}'::uuid[]
+    WHEN tbl = 'project' THEN ARRAY[(r->>'id')::uuid]
+    WHEN tbl = 'project_i18n' THEN ARRAY[(r->>'project_id')::uuid]
+    WHEN tbl = 'media_asset' THEN ARRAY(SELECT id FROM project WHERE cover_media_id = (r->>'id')::uuid)
+    WHEN tbl = 'media_asset_i18n' THEN ARRAY(SELECT id FROM project WHERE cover_media_id = (r->>'media_asset_id')::uuid)
+    WHEN tbl = 'location_i18n' THEN ARRAY(SELECT id FROM project WHERE location_id = (r->>'location_id')::uuid)
+    WHEN tbl = 'project_type_i18n' THEN ARRAY(SELECT id FROM project WHERE type_id = (r->>'type_id')::uuid)
+    ELSE '{}'::uuid[]
+  END
+$$ LANGUAGE sql STABLE;
+"""
+    )
+    op.execute(
+        """
+CREATE OR REPLACE FUNCTION project_card_sync() RETURNS trigger AS $$
+DECLARE
+  old_r jsonb := CASE WHEN TG_OP <> 'INSERT' THEN to_jsonb(OLD) END;
+  new_r jsonb := CASE WHEN TG_OP <> 'DELETE' THEN to_jsonb(NEW) END;
+  ids uuid[];
+  loc language_enum;
+BEGIN
+  ids := project_card_ids(TG_TABLE_NAME, old_r) || project_card_ids(TG_TABLE_NAME, new_r);
+  IF cardinality(ids) = 0 THEN
+    RETURN NULL;
+  END IF;
+  -- Изменение перевода затрагивает только свою локаль
+  IF TG_TABLE_NAME LIKE '%\\_i18n' AND (old_r IS NULL OR new_r IS NULL OR old_r->>'locale' = new_r->>'locale') THEN
+    loc := coalesce(new_r->>'locale', old_r->>'locale')::language_enum;
+  END IF;
+  PERFORM refresh_project_card(ARRAY(SELECT DISTINCT unnest(ids)), loc);
+  RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+"""
+    )
+    for table, events in SYNC_TRIGGERS.items():
+        op.execute(
+            f"""
+CREATE TRIGGER trg_{table}_project_card
+AFTER {events} ON {table}
+FOR EACH ROW EXECUTE FUNCTION project_card_sync();
+"""
+        )
+
+    # Начальное заполнение
+    op.execute("SELECT refresh_project_card(ARRAY(SELECT id FROM project));")
+
+
+def downgrade() -> None:
+    for table in SYNC_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_project_card ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS project_card_sync();")
+    op.execute("DROP FUNCTION IF EXISTS project_card_ids(text, jsonb);")
+    op.execute("DROP FUNCTION IF EXISTS refresh_project_card(uuid[], language_enum);")
+    op.drop_index("ix_project_card_listing", table_name="project_card")
+    op.drop_table("project_card")
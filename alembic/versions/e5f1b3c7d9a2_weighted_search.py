@@ -0,0 +1,172 @@
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e5f1b3c7d9a2"
+down_revision = "d4e7a2c9b1f3"
+branch_labels = None
+depends_on = None
+
+
+# Вес полей: A — название, B — подзаголовок и краткое описание, C — полный текст.
+# Существующие строки миграция не переписывает: после неё запускается
+#   python -m tools.reindex_search
+# (пакетами, без долгих блокировок). До окончания переиндексации старые строки
+# остаются в 'simple' и находятся хуже.
+SEARCH_FUNCTIONS = (
+    """
+CREATE OR REPLACE FUNCTION search_config(language_enum) RETURNS regconfig AS $$
+  SELECT CASE $1
+    WHEN 'ru' THEN 'pg_catalog.russian'::regconfig
+    WHEN 'en' THEN 'pg_catalog.english'::regconfig
+    ELSE 'pg_catalog.simple'::regconfig
+  END
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+""",
+    """
+CREATE OR REPLACE FUNCTION project_i18n_search_vector(
+  locale language_enum, name text, subname text, client_name text,
+  short_description text, full_description text
+) RETURNS tsvector AS $$
+  SELECT
+    setweight(to_tsvector(search_config(locale), coalesce(name, '')), 'A') ||
+    setweight(to_tsvector(search_config(locale),
+      coalesce(subname, '') || ' ' || coalesce(client_name, '') || ' ' || coalesce(short_description, '')), 'B') ||
+    setweight(to_tsvector(search_config(locale), coalesce(full_description, '')), 'C')
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+""",
+    """
+CREATE OR REPLACE FUNCTION news_i18n_search_vector(
+  locale language_enum, title text, short_description text, full_description text
+) RETURNS tsvector AS $$
+  SELECT
+    setweight(to_tsvector(search_config(locale), coalesce(title, '')), 'A') ||
+    setweight(to_tsvector(search_config(locale), coalesce(short_description, '')), 'B') ||
+    setweight(to_tsvector(search_config(locale), coalesce(full_description, '')), 'C')
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+""",
+    """
+CREATE OR REPLACE FUNCTION set_project_i18n_tsv() RETURNS trigger AS $$
+BEGIN
+  NEW.search_vector := project_i18n_search_vector(
+    NEW.locale, NEW.name, NEW.subname, NEW.client_name, NEW.short_description, NEW.full_description
+  );
+  RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+""",
+    """
+CREATE OR REPLACE FUNCTION set_news_i18n_tsv() RETURNS trigger AS $$
+BEGIN
+  NEW.search_vector := news_i18n_search_vector(
+    NEW.locale, NEW.title, NEW.short_description, NEW.full_description
+  );
+  RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+""",
+)
+
+# Переиндексация ставит arhea.reindex = on (SET LOCAL): search_vector не виден в публичных
+# ответах, поэтому версии контента и кэши не сбрасываются на каждую пачку
+BUMP_CONTENT_VERSION = """
+CREATE OR REPLACE FUNCTION bump_content_version() RETURNS trigger AS $$
+DECLARE
+  e text;
+BEGIN
+  IF coalesce(current_setting('arhea.reindex', true), '') = 'on' THEN
+    RETURN NULL;
+  END IF;
+  FOREACH e IN ARRAY TG_ARGV LOOP
+    INSERT INTO content_version AS cv (entity, version, changed_at)
+    VALUES (e, 1, clock_timestamp())
+    ON CONFLICT (entity) DO UPDATE
+      SET version = cv.version + 1, changed_at = clock_timestamp();
+  END LOOP;
+  RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+PREVIOUS_BUMP_CONTENT_VERSION = """
+CREATE OR REPLACE FUNCTION bump_content_version() RETURNS trigger AS $$
+DECLARE
+  e text;
+BEGIN
+  FOREACH e IN ARRAY TG_ARGV LOOP
+    INSERT INTO content_version AS cv (entity, version, changed_at)
+    VALUES (e, 1, clock_timestamp())
+    ON CONFLICT (entity) DO UPDATE
+      SET version = cv.version + 1, changed_at = clock_timestamp();
+  END LOOP;
+  RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+PREVIOUS_SEARCH_FUNCTIONS = (
+    """
+CREATE OR REPLACE FUNCTION set_project_i18n_tsv() RETURNS trigger AS $$
+BEGIN
+  NEW.search_vector := to_tsvector('simple',
+    coalesce(NEW.name,'') || ' ' ||
+    coalesce(NEW.subname,'') || ' ' ||
+    coalesce(NEW.client_name,'') || ' ' ||
+    coalesce(NEW.short_description,'') || ' ' ||
+    coalesce(NEW.full_description,'')
+  );
+  RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+""",
+    """
+CREATE OR REPLACE FUNCTION set_news_i18n_tsv() RETURNS trigger AS $$
+BEGIN
+  NEW.search_vector := to_tsvector('simple',
+    coalesce(NEW.title,'') || ' ' ||
+    coalesce(NEW.short_description,'') || ' ' ||
+    coalesce(NEW.full_description,'')
+  );
+  RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+""",
+)
+
+# Таблица -> столбцы, при изменении которых пересчитывается search_vector
+TSV_TRIGGERS = {
+    "project_i18n": "name, subname, client_name, short_description, full_description",
+    "news_i18n": "title, short_description, full_description",
+}
+
+
+def _create_tsv_triggers(with_locale: bool) -> None:
+    for table, columns in TSV_TRIGGERS.items():
+        if with_locale:
+            # Смена локали меняет конфигурацию разбора
+            columns = f"locale, {columns}"
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_tsv ON {table};")
+        op.execute(
+            f"""
+CREATE TRIGGER trg_{table}_tsv
+BEFORE INSERT OR UPDATE OF {columns}
+ON {table}
+FOR EACH ROW EXECUTE FUNCTION set_{table}_tsv();
+"""
+        )
+
+
+def upgrade() -> None:
+    for statement in SEARCH_FUNCTIONS:
+        op.execute(statement)
+    op.execute(BUMP_CONTENT_VERSION)
+    _create_tsv_triggers(with_locale=True)
+
+
+def downgrade() -> None:
+    for statement in PREVIOUS_SEARCH_FUNCTIONS:
+        op.execute(statement)
+    op.execute(PREVIOUS_BUMP_CONTENT_VERSION)
+    _create_tsv_triggers(with_locale=False)
+    op.execute("DROP FUNCTION IF EXISTS news_i18n_search_vector(language_enum, text, text, text);")
+    op.execute("DROP FUNCTION IF EXISTS project_i18n_search_vector(language_enum, text, text, text, text, text);")
+    op.execute("DROP FUNCTION IF EXISTS search_config(language_enum);")
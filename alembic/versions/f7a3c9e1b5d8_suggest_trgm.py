@@ -0,0 +1,26 @@
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f7a3c9e1b5d8"
+down_revision = "e5f1b3c7d9a2"
+branch_labels = None
+depends_on = None
+
+
+# Индекс -> (таблица, столбец): подсказки ищут по ним ILIKE и word_similarity (<%)
+TRGM_INDEXES = {
+    "ix_project_i18n_name_trgm": ("project_i18n", "name"),
+    "ix_person_i18n_full_name_trgm": ("person_i18n", "full_name"),
+    "ix_location_i18n_city_trgm": ("location_i18n", "city"),
+}
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    for name, (table, column) in TRGM_INDEXES.items():
+        op.create_index(name, table, [column], postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"})
+
+
+def downgrade() -> None:
+    for name, (table, _) in TRGM_INDEXES.items():
+        op.drop_index(name, table_name=table)
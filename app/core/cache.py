@@ -0,0 +1,440 @@
+"""Кэш сериализованных ответов с инвалидацией по тегам.
+
+Бэкенды: MemoryCacheBackend (в процессе) и RedisCacheBackend (любой сервер с протоколом Redis;
+пакет redis — опциональная зависимость). Ключ: <prefix>:<entity>:<locale>:<хэш параметров>.
+Теги — имена сущностей ("project", "news", ...); сброс тега удаляет все ключи с этим тегом.
+
+Режим stale-while-revalidate (CachePolicy.stale_while_revalidate > 0): запись хранит момент
+сохранения и версии тегов, инвалидация её не удаляет. Свежая копия отдаётся как есть, устаревшая
+(по возрасту или после инвалидации) — тоже отдаётся сразу, а пересчёт идёт фоновой задачей под
+блокировкой в бэкенде: между воркерами пересчитывает только один.
+
+Каждая запись начинается строкой JSON-метаданных (момент сохранения, версии тегов,
+суррогатные ключи для CDN, версии контента из БД), затем идёт тело.
+
+Версии тегов в бэкенде знают только о коммитах, прошедших через этот кэш (для памяти —
+только своего воркера). Поэтому get_or_set(content_versions=...) принимает версии из
+content_version, прочитанные под запрос: запись с другими версиями — промах (или устаревшая
+копия в режиме stale-while-revalidate), так что тело всегда соответствует своему ETag.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Protocol
+import asyncio
+import json
+import logging
+import time
+
+from app.core.compression import compress_async, worth_compressing
+from app.core.singleflight import SingleFlight
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    body: bytes
+    tags: frozenset[str]
+    expires_at: float
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, body: bytes, tags: Iterable[str], ttl: float) -> None: ...
+
+    async def invalidate(self, tags: Iterable[str]) -> int: ...
+
+    async def versions(self, tags: Iterable[str]) -> tuple[int, ...]: ...
+
+    async def clear(self) -> None: ...
+
+    async def acquire(self, key: str, ttl: float) -> bool: ...
+
+    async def release(self, key: str) -> None: ...
+
+
+class MemoryCacheBackend:
+    """LRU в памяти процесса: годится для одного воркера и для тестов."""
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._versions: dict[str, int] = {}
+        self._locks: dict[str, float] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry.body
+
+    async def set(self, key: str, body: bytes, tags: Iterable[str], ttl: float) -> None:
+        self._drop(key)
+        entry = CacheEntry(body, frozenset(tags), time.monotonic() + ttl)
+        self._entries[key] = entry
+        for tag in entry.tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        keys = set()
+        for tag in tags:
+            self._versions[tag] = self._versions.get(tag, 0) + 1
+            keys |= self._tags.pop(tag, set())
+        for key in keys:
+            self._drop(key)
+        return len(keys)
+
+    async def versions(self, tags: Iterable[str]) -> tuple[int, ...]:
+        return tuple(self._versions.get(tag, 0) for tag in tags)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+        self._locks.clear()
+
+    async def acquire(self, key: str, ttl: float) -> bool:
+        now = time.monotonic()
+        if self._locks.get(key, 0.0) > now:
+            return False
+        self._locks[key] = now + ttl
+        return True
+
+    async def release(self, key: str) -> None:
+        self._locks.pop(key, None)
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class RedisCacheBackend:
+    """
+    Ключи ответов — обычные строки с EX; для каждого тега множество <prefix>:tag:<tag>
+    с именами ключей и счётчик версии <prefix>:ver:<tag>. Инвалидация: SUNION + DEL ключей
+    и множеств, INCR версий. EXPIRE ... GT/NX требует Redis >= 7.
+    """
+
+    def __init__(self, url: str | None = None, client: Any = None, prefix: str = "resp") -> None:
+        if client is None:
+            try:
+                from redis import asyncio as aioredis
+            except ImportError as e:
+                raise RuntimeError("RedisCacheBackend requires the 'redis' package") from e
+            client = aioredis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}:tag:{tag}"
+
+    def _version_key(self, tag: str) -> str:
+        return f"{self.prefix}:ver:{tag}"
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.client.get(key)
+
+    async def set(self, key: str, body: bytes, tags: Iterable[str], ttl: float) -> None:
+        seconds = max(1, int(ttl))
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(key, body, ex=seconds)
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.sadd(tag_key, key)
+                # Множество тега живёт не меньше самых долгих его ключей
+                pipe.expire(tag_key, seconds, gt=True)
+                pipe.expire(tag_key, seconds, nx=True)
+            await pipe.execute()
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        tags = list(tags)
+        if not tags:
+            return 0
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        keys = await self.client.sunion(tag_keys)
+        async with self.client.pipeline(transaction=True) as pipe:
+            for tag in tags:
+                pipe.incr(self._version_key(tag))
+            pipe.delete(*keys, *tag_keys)
+            await pipe.execute()
+        return len(keys)
+
+    async def versions(self, tags: Iterable[str]) -> tuple[int, ...]:
+        tags = list(tags)
+        if not tags:
+            return ()
+        values = await self.client.mget([self._version_key(tag) for tag in tags])
+        return tuple(int(v or 0) for v in values)
+
+    async def clear(self) -> None:
+        async for key in self.client.scan_iter(match=f"{self.prefix}:*"):
+            await self.client.delete(key)
+
+    async def acquire(self, key: str, ttl: float) -> bool:
+        return bool(await self.client.set(key, b"1", nx=True, ex=max(1, int(ttl))))
+
+    async def release(self, key: str) -> None:
+        await self.client.delete(key)
+
+
+@dataclass(slots=True, frozen=True)
+class CachePolicy:
+    """
+    max_age — сколько копия свежая; stale_while_revalidate — сколько ещё её можно отдавать,
+    обновляя в фоне; shared_max_age — срок в CDN (s-maxage), если он отличается от браузерного.
+    """
+    max_age: float
+    stale_while_revalidate: float = 0.0
+    shared_max_age: float | None = None
+
+    @property
+    def ttl(self) -> float:
+        return self.max_age + self.stale_while_revalidate
+
+
+@dataclass(slots=True, frozen=True)
+class CachedBody:
+    body: bytes
+    encoding: str | None = None
+    keys: tuple[str, ...] = ()
+    # Отдана устаревшая копия (stale-while-revalidate), пересчёт идёт в фоне
+    stale: bool = False
+
+
+# produce() возвращает тело или (тело, суррогатные ключи)
+Produced = bytes | tuple[bytes, Iterable[str]]
+
+
+def split_produced(produced: Produced) -> tuple[bytes, tuple[str, ...]]:
+    if isinstance(produced, tuple):
+        body, keys = produced
+        return body, tuple(sorted(set(keys)))
+    return produced, ()
+
+
+def _pack(
+    body: bytes,
+    keys: tuple[str, ...],
+    stored_at: float = 0.0,
+    versions: tuple[int, ...] = (),
+    content: tuple[int, ...] | None = None,
+) -> bytes:
+    head = json.dumps({"at": stored_at, "v": versions, "k": keys, "c": content}, separators=(",", ":")).encode()
+    return head + b"\n" + body
+
+
+def _same_content(meta: dict[str, Any], content: tuple[int, ...] | None) -> bool:
+    return content is None or meta.get("c") is not None and tuple(meta["c"]) == content
+
+
+def _unpack(raw: bytes) -> tuple[dict[str, Any], bytes]:
+    head, _, body = raw.partition(b"\n")
+    return json.loads(head), body
+
+
+def params_digest(params: Mapping[str, Any]) -> str:
+    raw = json.dumps(params, sort_keys=True, default=str, separators=(",", ":")).encode()
+    return blake2b(raw, digest_size=12).hexdigest()
+
+
+Variants = dict[str | None, bytes]
+
+
+class ResponseCache:
+    """
+    Кроме исходного тела хранит заранее сжатые варианты (<key>|gzip, <key>|br) с теми же
+    тегами и сроком: горячий ответ сжимается один раз при сохранении, а не на каждый запрос.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: float,
+        prefix: str = "resp",
+        lock_ttl: float = 30.0,
+        encodings: Iterable[str] = (),
+    ) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.prefix = prefix
+        self.lock_ttl = lock_ttl
+        self.encodings = tuple(encodings)
+        self._flight = SingleFlight("response_cache")
+        self._refreshing: dict[str, asyncio.Task] = {}
+
+    def key(self, entity: str, locale: Any, params: Mapping[str, Any] | None = None) -> str:
+        locale = getattr(locale, "value", locale) or "-"
+        return f"{self.prefix}:{entity}:{locale}:{params_digest(params or {})}"
+
+    async def get_or_set(
+        self,
+        entity: str,
+        locale: Any,
+        params: Mapping[str, Any] | None,
+        produce: Callable[[], Awaitable[Produced]],
+        tags: Iterable[str] = (),
+        ttl: float | None = None,
+        policy: CachePolicy | None = None,
+        encoding: str | None = None,
+        content_versions: tuple[int, ...] | None = None,
+    ) -> CachedBody:
+        """
+        encoding — выбранная для клиента кодировка; если такого варианта нет
+        (тело меньше порога сжатия), отдаётся исходное тело.
+        content_versions — версии из content_version, под которые нужно тело; запись,
+        сохранённая под другие версии, не отдаётся как свежая.
+        """
+        key = self.key(entity, locale, params)
+        all_tags = sorted({entity, *tags})
+        if encoding not in self.encodings:
+            encoding = None
+        if policy is not None and policy.stale_while_revalidate > 0:
+            return await self._get_or_revalidate(key, all_tags, produce, policy, encoding, content_versions)
+        if policy is not None:
+            ttl = policy.max_age
+        raw, used = await self._lookup(key, encoding)
+        if raw is not None:
+            meta, body = _unpack(raw)
+            if _same_content(meta, content_versions):
+                return CachedBody(body, used, tuple(meta["k"]))
+        before = await self.backend.versions(all_tags)
+        body, keys = split_produced(await produce())
+        variants = await self._encode(body)
+        # Коммит во время produce() мог сделать ответ устаревшим — тогда не сохраняем
+        if await self.backend.versions(all_tags) == before:
+            await self._store(
+                key, variants, keys, all_tags, self.ttl if ttl is None else ttl, content=content_versions
+            )
+        return _pick(variants, keys, encoding)
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        return await self.backend.invalidate(tags)
+
+    async def _lookup(self, key: str, encoding: str | None) -> tuple[bytes | None, str | None]:
+        if encoding is not None:
+            raw = await self.backend.get(_variant_key(key, encoding))
+            if raw is not None:
+                return raw, encoding
+        return await self.backend.get(key), None
+
+    async def _encode(self, body: bytes) -> Variants:
+        variants: Variants = {None: body}
+        if worth_compressing(body):
+            for encoding in self.encodings:
+                variants[encoding] = await compress_async(body, encoding)
+        return variants
+
+    async def _store(
+        self,
+        key: str,
+        variants: Variants,
+        keys: tuple[str, ...],
+        tags: Iterable[str],
+        ttl: float,
+        stored_at: float = 0.0,
+        versions: tuple[int, ...] = (),
+        content: tuple[int, ...] | None = None,
+    ) -> None:
+        for encoding, body in variants.items():
+            packed = _pack(body, keys, stored_at, versions, content)
+            await self.backend.set(_variant_key(key, encoding), packed, tags, ttl)
+
+    async def _get_or_revalidate(
+        self,
+        key: str,
+        tags: list[str],
+        produce: Callable[[], Awaitable[Produced]],
+        policy: CachePolicy,
+        encoding: str | None,
+        content: tuple[int, ...] | None = None,
+    ) -> CachedBody:
+        """produce() здесь может выполняться после ответа — он должен открывать свою сессию."""
+        raw, used = await self._lookup(key, encoding)
+        if raw is None:
+            # Холодный промах: одновременные запросы воркера (в любой кодировке) ждут один пересчёт
+            variants, keys = await self._flight.do(
+                key, lambda: self._produce_and_store(key, tags, produce, policy, content)
+            )
+            return _pick(variants, keys, encoding)
+        meta, body = _unpack(raw)
+        stale = (
+            time.time() - meta["at"] >= policy.max_age
+            or not _same_content(meta, content)
+            or tuple(meta["v"]) != await self.backend.versions(tags)
+        )
+        if stale:
+            self._revalidate(key, tags, produce, policy, content)
+        return CachedBody(body, used, tuple(meta["k"]), stale)
+
+    async def _produce_and_store(
+        self,
+        key: str,
+        tags: list[str],
+        produce: Callable[[], Awaitable[Produced]],
+        policy: CachePolicy,
+        content: tuple[int, ...] | None = None,
+    ) -> tuple[Variants, tuple[str, ...]]:
+        before = await self.backend.versions(tags)
+        body, keys = split_produced(await produce())
+        variants = await self._encode(body)
+        # Коммит во время produce() оставит старые версии: копия сразу окажется устаревшей и обновится
+        await self._store(key, variants, keys, (), policy.ttl, time.time(), before, content)
+        return variants, keys
+
+    def _revalidate(
+        self,
+        key: str,
+        tags: list[str],
+        produce: Callable[[], Awaitable[Produced]],
+        policy: CachePolicy,
+        content: tuple[int, ...] | None = None,
+    ) -> None:
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(key, tags, produce, policy, content))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _, key=key: self._refreshing.pop(key, None))
+
+    async def _refresh(
+        self,
+        key: str,
+        tags: list[str],
+        produce: Callable[[], Awaitable[Produced]],
+        policy: CachePolicy,
+        content: tuple[int, ...] | None = None,
+    ) -> None:
+        lock = f"{key}:lock"
+        if not await self.backend.acquire(lock, self.lock_ttl):
+            return
+        try:
+            await self._produce_and_store(key, tags, produce, policy, content)
+        except Exception:
+            logger.exception("stale-while-revalidate refresh of %s failed", key)
+        finally:
+            await self.backend.release(lock)
+
+
+def _variant_key(key: str, encoding: str | None) -> str:
+    return key if encoding is None else f"{key}|{encoding}"
+
+
+def _pick(variants: Variants, keys: tuple[str, ...], encoding: str | None) -> CachedBody:
+    if encoding in variants:
+        return CachedBody(variants[encoding], encoding, keys)
+    return CachedBody(variants[None], None, keys)
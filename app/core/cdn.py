@@ -0,0 +1,84 @@
+"""
+Заголовки для CDN и адресная очистка.
+
+Ответ несёт Cache-Control по политике маршрута и список суррогатных ключей в двух
+форматах: Surrogate-Key (через пробел, Fastly и совместимые) и Cache-Tag (через запятую,
+Cloudflare). Ключи — коллекции ("project") и строки ("project:<id>", "media:<id>", ...).
+
+После коммита HttpPurger отправляет закоммиченные ключи одним запросом
+POST <url> с заголовком Surrogate-Key — так устроена пакетная очистка Fastly;
+локальная замена CDN — tools/cdn_proxy.py.
+"""
+from typing import Iterable, Protocol
+import asyncio
+import logging
+import urllib.request
+
+from app.core.cache import CachePolicy
+
+
+logger = logging.getLogger(__name__)
+
+# Лимит длины заголовка у CDN — 16 KB; оставляем запас под остальные заголовки
+MAX_KEYS_HEADER = 8192
+
+
+def cache_control(policy: CachePolicy | None) -> str:
+    if policy is None:
+        return "no-store"
+    parts = ["public", f"max-age={int(policy.max_age)}"]
+    if policy.shared_max_age is not None:
+        parts.append(f"s-maxage={int(policy.shared_max_age)}")
+    if policy.stale_while_revalidate > 0:
+        parts.append(f"stale-while-revalidate={int(policy.stale_while_revalidate)}")
+    return ", ".join(parts)
+
+
+def fit_keys(keys: Iterable[str], limit: int = MAX_KEYS_HEADER) -> list[str]:
+    """
+    Ключи коллекций (без ":") идут первыми и не отбрасываются; строковые — пока влезают.
+    Для ответа с коллекцией потеря части строковых ключей безопасна: его очистит ключ коллекции.
+    """
+    ordered = sorted(set(keys), key=lambda k: (":" in k, k))
+    fitted, length = [], 0
+    for key in ordered:
+        if ":" in key and length + len(key) + 1 > limit:
+            break
+        fitted.append(key)
+        length += len(key) + 1
+    return fitted
+
+
+def cdn_headers(policy: CachePolicy | None, keys: Iterable[str] = ()) -> dict[str, str]:
+    headers = {"Cache-Control": cache_control(policy)}
+    keys = fit_keys(keys)
+    if keys:
+        headers["Surrogate-Key"] = " ".join(keys)
+        headers["Cache-Tag"] = ",".join(keys)
+    return headers
+
+
+class Purger(Protocol):
+    async def purge(self, keys: Iterable[str]) -> None: ...
+
+
+class HttpPurger:
+    def __init__(self, url: str, token: str | None = None, timeout: float = 2.0) -> None:
+        self.url = url
+        self.token = token
+        self.timeout = timeout
+
+    def _send(self, keys: list[str]) -> int:
+        request = urllib.request.Request(self.url, method="POST", headers={"Surrogate-Key": " ".join(keys)})
+        if self.token:
+            request.add_header("Fastly-Key", self.token)
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return response.status
+
+    async def purge(self, keys: Iterable[str]) -> None:
+        keys = sorted(set(keys))
+        # Пакет очистки ограничен так же, как заголовок ответа
+        for start in range(0, len(keys), 256):
+            batch = keys[start:start + 256]
+            status = await asyncio.to_thread(self._send, batch)
+            logger.info("cdn purge %s -> %s", batch, status)
@@ -0,0 +1,112 @@
+"""
+Сжатие ответов: выбор кодировки по Accept-Encoding (br, затем gzip), порог размера,
+крупные тела сжимаются в пуле потоков, чтобы не держать event loop.
+
+CompressionMiddleware сжимает только цельные (не потоковые) ответы сжимаемых типов и
+пропускает ответы, у которых Content-Encoding уже выставлен: кэш и снимок отдают
+заранее сжатые тела, и повторно они не сжимаются.
+"""
+from typing import Iterable
+import asyncio
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.settings import settings
+
+try:
+    import brotli
+except ImportError:  # опционально
+    brotli = None
+
+
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml", "image/svg+xml")
+
+
+def negotiate(accept_encoding: str, encodings: Iterable[str] = ENCODINGS) -> str | None:
+    """Первая из поддерживаемых кодировок, которую клиент принимает с q > 0."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name] = q
+    for encoding in encodings:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    raise ValueError(f"unsupported content encoding: {encoding}")
+
+
+async def compress_async(body: bytes, encoding: str) -> bytes:
+    if len(body) >= settings.COMPRESSION_THREAD_THRESHOLD:
+        return await asyncio.to_thread(compress, body, encoding)
+    return compress(body, encoding)
+
+
+def worth_compressing(body: bytes) -> bool:
+    return len(body) >= settings.COMPRESSION_MIN_SIZE
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if passthrough or start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            skip = (
+                message.get("more_body", False)
+                or "content-encoding" in headers
+                or start["status"] < 200
+                or start["status"] in (204, 304)
+                or not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+                or not worth_compressing(body)
+            )
+            if not skip:
+                body = await compress_async(body, encoding)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+                message = {**message, "body": body}
+            passthrough = True
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
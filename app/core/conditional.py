@@ -0,0 +1,61 @@
+"""Условные GET-запросы: ETag / Last-Modified / 304 Not Modified (RFC 9110, 13.1)."""
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import blake2b
+from typing import Any, Iterable
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: Any) -> str:
+    raw = "|".join(str(getattr(p, "value", p)) for p in parts).encode()
+    return f'W/"{blake2b(raw, digest_size=10).hexdigest()}"'
+
+
+def http_date(value: datetime) -> str:
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # Слабое сравнение: для GET достаточно совпадения opaque-части
+    return _opaque(etag) in {_opaque(t) for t in header.split(",")}
+
+
+def is_not_modified(request: Request, etag: str | None, last_modified: datetime | None) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match важнее If-Modified-Since
+        return etag is not None and _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def validator_headers(etag: str | None, last_modified: datetime | None, vary: Iterable[str] = ()) -> dict[str, str]:
+    headers = {}
+    if etag is not None:
+        headers["ETag"] = etag
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    vary = list(vary)
+    if vary:
+        headers["Vary"] = ", ".join(vary)
+    return headers
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
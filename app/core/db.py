@@ -1,18 +1,164 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
-from app.core.settings import settings  
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from contextvars import ContextVar
+from itertools import count
+from typing import Any, AsyncGenerator
+from uuid import uuid4
+import logging
+import time
+from app.core.settings import settings
+from app.core.pool_metrics import InstrumentedPool, instrument_engine
+from app.core.invalidation import wait_pending
 
 
+logger = logging.getLogger(__name__)
 
-engine = create_async_engine(
-    str(settings.DATABASE_URL),
-    pool_size = 5,
-    max_overflow = 10,
-    pool_pre_ping=True
+
+def _prepared_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+def pooler_connect_args(pooler_mode: str | None = None) -> dict[str, Any]:
+    """connect_args для asyncpg с учётом пулера.
+
+    В transaction-режиме серверное соединение меняется между транзакциями, поэтому
+    именованные prepared statements asyncpg (__asyncpg_stmt_N__) конфликтуют. Имена
+    делаем уникальными, а кэш оставляем только если пулер сам отслеживает prepared
+    statements (PgBouncer >= 1.21 с max_prepared_statements).
+    """
+    mode = pooler_mode or settings.DATABASE_POOLER_MODE
+    cache_size = settings.DATABASE_STATEMENT_CACHE_SIZE
+    if mode == "none":
+        return {"prepared_statement_cache_size": cache_size}
+    if mode != "transaction":
+        raise ValueError(f"Unknown pooler mode: {mode}")
+    if not settings.DATABASE_POOLER_PREPARED_STATEMENTS:
+        cache_size = 0
+    return {
+        "prepared_statement_cache_size": cache_size,
+        "statement_cache_size": 0,
+        "prepared_statement_name_func": _prepared_statement_name,
+    }
+
+
+def make_engine(url: str, name: str, pooler_mode: str | None = None) -> AsyncEngine:
+    new_engine = create_async_engine(
+        url,
+        connect_args=pooler_connect_args(pooler_mode),
+        poolclass=InstrumentedPool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    )
+    instrument_engine(name, new_engine)
+    return new_engine
+
+
+engine = make_engine(str(settings.DATABASE_URL), "primary")
+
+# Чтение после записи в том же контексте (запрос/задача) идёт на primary до этого момента
+_primary_until: ContextVar[float] = ContextVar("primary_until", default=0.0)
+
+
+def stick_to_primary(seconds: float | None = None) -> None:
+    ttl = settings.DATABASE_PRIMARY_STICKY_SECONDS if seconds is None else seconds
+    if ttl > 0:
+        _primary_until.set(time.monotonic() + ttl)
+
+
+def reads_pinned_to_primary() -> bool:
+    return _primary_until.get() > time.monotonic()
+
+
+class PrimarySession(AsyncSession):
+    """Сессия primary: дожидается инвалидации кэшей и после записи прилипает чтения к primary."""
+
+    async def commit(self) -> None:
+        await super().commit()
+        await wait_pending(self.sync_session)
+        if self.sync_session.info.pop("wrote", False):
+            stick_to_primary()
+
+
+class WriteSession(Session):
+    pass
+
+
+class ReadOnlySession(Session):
+    pass
+
+
+@event.listens_for(WriteSession, "after_flush")
+def _mark_wrote(session, flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(ReadOnlySession, "before_flush")
+def _reject_flush(session, flush_context, instances) -> None:
+    if session.new or session.dirty or session.deleted:
+        raise RuntimeError("read-only session cannot flush changes; use get_db for writes")
+
+
+class ReplicaRouter:
+    """Round-robin по репликам; упавшая реплика выводится из ротации на retry_seconds."""
+
+    def __init__(self, engines: list[AsyncEngine], retry_seconds: float) -> None:
+        self.engines = engines
+        self.retry_seconds = retry_seconds
+        self._counter = count()
+        self._down_until: dict[int, float] = {}
+
+    def candidates(self) -> list[AsyncEngine]:
+        if not self.engines:
+            return []
+        now = time.monotonic()
+        start = next(self._counter) % len(self.engines)
+        ordered = self.engines[start:] + self.engines[:start]
+        return [e for e in ordered if self._down_until.get(id(e), 0.0) <= now]
+
+    def mark_down(self, target: AsyncEngine) -> None:
+        self._down_until[id(target)] = time.monotonic() + self.retry_seconds
+        logger.warning("read replica %s:%s marked down for %.0fs", target.url.host, target.url.port, self.retry_seconds)
+
+
+def _replica_urls() -> list[str]:
+    return [u.strip() for u in settings.DATABASE_REPLICA_URLS.split(",") if u.strip()]
+
+
+replica_engines: list[AsyncEngine] = [
+    make_engine(url, f"replica-{i}") for i, url in enumerate(_replica_urls())
+]
+replica_router = ReplicaRouter(replica_engines, settings.DATABASE_REPLICA_RETRY_SECONDS)
+
+
+def _watch_replica(target: AsyncEngine) -> None:
+    @event.listens_for(target.sync_engine, "handle_error")
+    def _on_error(context) -> None:
+        if context.is_disconnect:
+            replica_router.mark_down(target)
+
+
+for _replica in replica_engines:
+    _watch_replica(_replica)
+
+
+async_session = async_sessionmaker(
+    engine,
+    expire_on_commit=False,
+    class_=PrimarySession,
+    sync_session_class=WriteSession,
 )
 
-async_session = async_sessionmaker(engine, expore_on_commit=False, class_=AsyncSession)
+read_session = async_sessionmaker(
+    expire_on_commit=False,
+    class_=AsyncSession,
+    sync_session_class=ReadOnlySession,
+    info={"read_only": True},
+)
 
 Base = declarative_base()
 
@@ -21,4 +167,27 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     try:
         yield session
     finally:
-        await session.close()
\ No newline at end of file
+        await session.close()
+
+
+async def open_read_session() -> AsyncSession:
+    """Сессия только для чтения: реплика по кругу, при недоступности — следующая, затем primary."""
+    if not reads_pinned_to_primary():
+        for target in replica_router.candidates():
+            session = read_session(bind=target)
+            try:
+                await session.connection()
+            except (DBAPIError, OSError):
+                await session.close()
+                replica_router.mark_down(target)
+                continue
+            return session
+    return read_session(bind=engine)
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    session = await open_read_session()
+    try:
+        yield session
+    finally:
+        await session.close()
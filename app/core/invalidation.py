@@ -0,0 +1,165 @@
+"""Теги инвалидации кэшей.
+
+Модели привязываются к тегам через track(). Любая запись в такие модели внутри сессии
+(flush или ORM-enabled INSERT/UPDATE/DELETE) помечает сессию тегами, а после коммита
+вызываются обработчики, зарегистрированные через on_commit(). При откате метки сбрасываются.
+
+track(..., keys=[(префикс, атрибут)]) добавляет построчные ключи вида "project:<id>": при flush
+к тегам сессии добавляются ключи изменённых строк (старое и новое значение атрибута).
+Массовые INSERT/UPDATE/DELETE помечают только теги моделей; ключи строк из RETURNING
+репозитории добавляют сами через mark_rows().
+
+Асинхронные обработчики (например, сброс ключей в Redis) запускаются задачами; PrimarySession
+дожидается их в commit(), чтобы ответ после записи не ушёл раньше инвалидации.
+"""
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Union
+import asyncio
+import inspect
+import logging
+
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+
+logger = logging.getLogger(__name__)
+
+_INFO_KEY = "invalidate_tags"
+_TASKS_KEY = "invalidate_tasks"
+
+Handler = Callable[[set[str]], Union[None, Awaitable[None]]]
+KeyRule = tuple[str, str]
+
+_model_tags: dict[type, set[str]] = defaultdict(set)
+_model_keys: dict[type, list[KeyRule]] = defaultdict(list)
+_handlers: dict[str, list[Handler]] = defaultdict(list)
+
+
+def track(model: type, *tags: str, keys: Iterable[KeyRule] = ()) -> None:
+    _model_tags[model].update(tags)
+    _model_keys[model].extend(keys)
+
+
+def on_commit(tag: str, handler: Handler) -> None:
+    """handler получает полный набор тегов, закоммиченных вместе с tag."""
+    _handlers[tag].append(handler)
+
+
+def tags_for(model: type) -> set[str]:
+    tags: set[str] = set()
+    for cls in model.__mro__:
+        tags |= _model_tags.get(cls, set())
+    return tags
+
+
+def key_rules(model: type) -> list[KeyRule]:
+    return [rule for cls in model.__mro__ for rule in _model_keys.get(cls, ())]
+
+
+def row_keys(obj: object, rules: Iterable[KeyRule] | None = None, history: bool = True) -> set[str]:
+    """
+    Ключи строки по правилам track(). history=True — ещё и прежние значения атрибутов
+    (строка могла сменить родителя); значения берутся из состояния, без запросов в БД.
+    """
+    state = sa_inspect(obj)
+    keys = set()
+    for prefix, attr in key_rules(type(obj)) if rules is None else rules:
+        if history:
+            changes = state.attrs[attr].history
+            values = (*changes.added, *changes.unchanged, *changes.deleted)
+        else:
+            values = (state.dict.get(attr),)
+        keys.update(f"{prefix}:{value}" for value in values if value is not None)
+    return keys
+
+
+def mapping_keys(model: type, values: Mapping[str, Any]) -> set[str]:
+    """Ключи строки по её значениям (например, строке RETURNING), без ORM-состояния."""
+    keys = set()
+    for prefix, attr in key_rules(model):
+        value = values.get(attr)
+        if value is not None:
+            keys.add(f"{prefix}:{value}")
+    return keys
+
+
+def mark_rows(session: Session, model: type, rows: Iterable[object | Mapping[str, Any]]) -> None:
+    """Ключи строк массовой записи: объекты из RETURNING model или словари колонок."""
+    keys: set[str] = set()
+    for row in rows:
+        if isinstance(row, Mapping):
+            keys |= mapping_keys(model, row)
+        else:
+            keys |= row_keys(row, history=False)
+    mark(session, keys)
+
+
+def mark(session: Session, tags: Iterable[str]) -> None:
+    tags = set(tags)
+    if tags:
+        session.info.setdefault(_INFO_KEY, set()).update(tags)
+
+
+def pending_tags(session: Session) -> set[str]:
+    return set(session.info.get(_INFO_KEY, ()))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session: Session, flush_context) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        mark(session, tags_for(type(obj)) | row_keys(obj))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_executed(state: ORMExecuteState) -> None:
+    if (state.is_insert or state.is_update or state.is_delete) and state.bind_mapper is not None:
+        mark(state.session, tags_for(state.bind_mapper.class_))
+
+
+@event.listens_for(Session, "after_commit")
+def _run_handlers(session: Session) -> None:
+    tags = session.info.pop(_INFO_KEY, None)
+    if not tags:
+        return
+    called: set[int] = set()
+    for tag in tags:
+        for handler in _handlers.get(tag, ()):
+            if id(handler) in called:
+                continue
+            called.add(id(handler))
+            if inspect.iscoroutinefunction(handler):
+                _schedule(session, handler, tags)
+                continue
+            try:
+                handler(tags)
+            except Exception:
+                logger.exception("invalidation handler failed for tags %s", sorted(tags))
+
+
+async def _guarded(handler: Handler, tags: set[str]) -> None:
+    try:
+        await handler(tags)
+    except Exception:
+        logger.exception("invalidation handler failed for tags %s", sorted(tags))
+
+
+def _schedule(session: Session, handler: Handler, tags: set[str]) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_guarded(handler, tags))
+        return
+    task = loop.create_task(_guarded(handler, tags))
+    session.info.setdefault(_TASKS_KEY, []).append(task)
+
+
+async def wait_pending(session: Session) -> None:
+    """Дождаться асинхронных обработчиков, запущенных последним коммитом."""
+    tasks = session.info.pop(_TASKS_KEY, None)
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_marks(session: Session) -> None:
+    session.info.pop(_INFO_KEY, None)
@@ -0,0 +1,136 @@
+from bisect import bisect_left
+from typing import Any
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+# Верхние границы корзин гистограммы ожидания checkout, мс
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "count", "total")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def snapshot(self) -> dict[str, Any]:
+        buckets, running = {}, 0
+        for bound, n in zip((*map(str, self.bounds), "+Inf"), self.counts):
+            running += n
+            buckets[bound] = running
+        return {"buckets": buckets, "count": self.count, "sum": round(self.total, 3)}
+
+
+class PoolMetrics:
+    """Счётчики пула одного engine; заполняются событиями пула и InstrumentedPool.connect()."""
+
+    def __init__(self, name: str, engine: AsyncEngine) -> None:
+        self.name = name
+        self.engine = engine
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.wait_ms = Histogram(WAIT_BUCKETS_MS)
+        self.closed = 0
+        self.lifetime_total = 0.0
+        self.lifetime_max = 0.0
+        self._opened: dict[int, float] = {}
+
+    def on_connect(self, dbapi_conn, record) -> None:
+        self.connects += 1
+        self._opened[id(record)] = time.monotonic()
+
+    def on_close(self, dbapi_conn, record) -> None:
+        opened = self._opened.pop(id(record), None)
+        if opened is None:
+            return
+        lifetime = time.monotonic() - opened
+        self.closed += 1
+        self.lifetime_total += lifetime
+        self.lifetime_max = max(self.lifetime_max, lifetime)
+
+    def on_invalidate(self, dbapi_conn, record, exception) -> None:
+        self.invalidations += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        pool = self.engine.pool
+        now = time.monotonic()
+        return {
+            "name": self.name,
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "checkout_wait_ms": self.wait_ms.snapshot(),
+            "connection_lifetime_s": {
+                "open": len(self._opened),
+                "oldest_open": round(now - min(self._opened.values()), 3) if self._opened else 0.0,
+                "closed": self.closed,
+                "avg_closed": round(self.lifetime_total / self.closed, 3) if self.closed else 0.0,
+                "max_closed": round(self.lifetime_max, 3),
+            },
+        }
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Пул, замеряющий время получения соединения (ожидание слота, открытие, pre-ping)."""
+
+    metrics: PoolMetrics | None = None
+
+    def connect(self):
+        metrics = self.metrics
+        if metrics is None:
+            return super().connect()
+        started = time.perf_counter()
+        try:
+            conn = super().connect()
+        except PoolTimeoutError:
+            metrics.timeouts += 1
+            raise
+        finally:
+            metrics.wait_ms.observe((time.perf_counter() - started) * 1000)
+        metrics.checkouts += 1
+        return conn
+
+    def recreate(self) -> "InstrumentedPool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+def instrument_engine(name: str, engine: AsyncEngine) -> PoolMetrics:
+    metrics = PoolMetrics(name, engine)
+    pool = engine.sync_engine.pool
+    if isinstance(pool, InstrumentedPool):
+        pool.metrics = metrics
+    event.listen(pool, "connect", metrics.on_connect)
+    event.listen(pool, "close", metrics.on_close)
+    event.listen(pool, "invalidate", metrics.on_invalidate)
+    pool_metrics[name] = metrics
+    return metrics
+
+
+def pool_snapshot() -> list[dict[str, Any]]:
+    return [m.snapshot() for m in pool_metrics.values()]
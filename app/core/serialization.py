@@ -0,0 +1,134 @@
+"""
+Быстрый вывод JSON для read-схем.
+
+Обычный путь — model_validate(from_attributes=True) + model_dump_json() — заново валидирует
+данные, которые уже пришли из БД, включая вложенные списки translations. Здесь по полям
+схемы один раз собирается план, и ORM-объект переводится в dict напрямую (RowSerializer),
+а dict — в байты через orjson (если установлен) или стандартный json. Результат совпадает
+с model_dump_json() той же схемы.
+"""
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from functools import cache
+from typing import Any, Callable, Iterable, Union, get_args, get_origin
+from uuid import UUID
+import json
+import types
+
+from fastapi import Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # опционально
+    orjson = None
+
+
+def _isoformat(value: datetime | time) -> str:
+    # Как pydantic: UTC — с суффиксом Z
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, time)):
+        return _isoformat(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_UTC_Z)
+    return json.dumps(value, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class FastJSONResponse(Response):
+    """JSONResponse на dumps(): orjson, если доступен."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+_REQUIRED = object()
+_Plan = tuple[str, Any, Callable[[Any], Any] | None]
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """Преобразование значения поля; None — значение кладётся как есть."""
+    annotation = _unwrap_optional(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        nested = serializer_for(annotation)
+        return lambda v: None if v is None else nested(v)
+    if get_origin(annotation) in (list, tuple, set, frozenset):
+        args = get_args(annotation)
+        item = _converter(args[0]) if args else None
+        if item is None:
+            return lambda v: None if v is None else list(v)
+        return lambda v: None if v is None else [item(x) for x in v]
+    if annotation is float:
+        # Numeric из БД приходит как Decimal, схема отдаёт число
+        return lambda v: None if v is None else float(v)
+    return None
+
+
+class RowSerializer:
+    """ORM-объект (или любой объект с атрибутами) -> dict по полям схемы, без валидации."""
+
+    def __init__(self, schema: type[BaseModel]) -> None:
+        self.schema = schema
+        self._fields: list[_Plan] = []
+
+    def _compile(self) -> None:
+        # Отложено до первого вызова: вложенные схемы могут ссылаться друг на друга
+        self._fields = [
+            (
+                name,
+                _REQUIRED if field.is_required() else field.get_default(call_default_factory=True),
+                _converter(field.annotation),
+            )
+            for name, field in self.schema.model_fields.items()
+            if not field.exclude
+        ]
+
+    def __call__(self, obj: Any) -> dict[str, Any]:
+        if not self._fields:
+            self._compile()
+        out = {}
+        # Загруженные атрибуты ORM лежат в __dict__ экземпляра: читаем мимо дескрипторов
+        loaded = getattr(obj, "__dict__", {})
+        for name, default, convert in self._fields:
+            if name in loaded:
+                value = loaded[name]
+            else:
+                value = getattr(obj, name) if default is _REQUIRED else getattr(obj, name, default)
+            out[name] = value if convert is None else convert(value)
+        return out
+
+    def many(self, objs: Iterable[Any]) -> list[dict[str, Any]]:
+        return [self(obj) for obj in objs]
+
+    def dump_json(self, objs: Iterable[Any]) -> bytes:
+        return dumps(self.many(objs))
+
+
+@cache
+def serializer_for(schema: type[BaseModel]) -> RowSerializer:
+    return RowSerializer(schema)
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import AnyUrl, Field
-from typing import Optional, Union
+from typing import Literal, Optional, Union
 
 class Settings(BaseSettings):
    model_config = SettingsConfigDict(
@@ -13,6 +13,48 @@ class Settings(BaseSettings):
    
    DATABASE_SYNC_URL: Optional[Union[AnyUrl, str]] = Field(default=None, description="PostgreSQL DSN (psycopg2) for migrations")
 
+   DATABASE_POOL_SIZE: int = Field(default=5, ge=1)
+   DATABASE_MAX_OVERFLOW: int = Field(default=10, ge=0)
+   DATABASE_POOL_TIMEOUT: float = Field(default=30.0, gt=0, description="Seconds to wait for a free connection")
+   DATABASE_POOL_RECYCLE: int = Field(default=-1, description="Reconnect connections older than N seconds, -1 disables")
+   DATABASE_POOL_PRE_PING: bool = Field(default=True)
+
+   DATABASE_POOLER_MODE: Literal["none", "transaction"] = Field(default="none", description="External pooler in front of Postgres (PgBouncer pool_mode)")
+   DATABASE_POOLER_PREPARED_STATEMENTS: bool = Field(default=False, description="Pooler tracks protocol-level prepared statements (PgBouncer >= 1.21, max_prepared_statements > 0)")
+   DATABASE_STATEMENT_CACHE_SIZE: int = Field(default=100, ge=0, description="Prepared statements cached per connection")
+
+   DATABASE_REPLICA_URLS: str = Field(default="", description="Comma-separated asyncpg DSNs of read replicas")
+   DATABASE_REPLICA_RETRY_SECONDS: float = Field(default=30.0, ge=0, description="How long a failed replica stays out of rotation")
+   DATABASE_PRIMARY_STICKY_SECONDS: float = Field(default=0.0, ge=0, description="Keep reads on primary after a commit in the same context")
+
+   TAXONOMY_CACHE_TTL_SECONDS: float = Field(default=600.0, ge=0, description="In-process taxonomy snapshot lifetime")
+
+   RESPONSE_CACHE_BACKEND: Literal["memory", "redis", "none"] = Field(default="memory")
+   RESPONSE_CACHE_REDIS_URL: Optional[str] = Field(default=None, description="redis://host:port/db for the shared response cache")
+   RESPONSE_CACHE_TTL_SECONDS: float = Field(default=300.0, gt=0)
+   RESPONSE_CACHE_MAX_ENTRIES: int = Field(default=2048, ge=1, description="Memory backend only")
+   RESPONSE_CACHE_REFRESH_LOCK_SECONDS: float = Field(default=30.0, gt=0, description="Lock held by the one worker recomputing a stale entry")
+
+   COMPRESSION_MIN_SIZE: int = Field(default=1024, ge=0, description="Smaller bodies are sent uncompressed")
+   COMPRESSION_THREAD_THRESHOLD: int = Field(default=65536, ge=0, description="Bodies at least this large are compressed in a worker thread")
+   COMPRESSION_GZIP_LEVEL: int = Field(default=6, ge=1, le=9)
+   COMPRESSION_BROTLI_QUALITY: int = Field(default=5, ge=0, le=11)
+
+   CDN_PURGE_URL: Optional[str] = Field(default=None, description="Surrogate-key purge endpoint; commits purge nothing when unset")
+   CDN_PURGE_TOKEN: Optional[str] = Field(default=None, description="Sent as Fastly-Key")
+   CDN_PURGE_TIMEOUT_SECONDS: float = Field(default=2.0, gt=0)
+
+   PUBLIC_SNAPSHOT_ENABLED: bool = Field(default=False, description="Serve /public/snapshot/{locale} from in-memory blobs")
+   PUBLIC_SNAPSHOT_POLL_SECONDS: float = Field(default=5.0, gt=0, description="How often each worker checks content_version")
+
+   SUGGEST_LIMIT_MAX: int = Field(default=10, ge=1, description="Hard cap on suggestions per request")
+   SUGGEST_CACHE_ENTRIES: int = Field(default=1024, ge=0, description="In-process LRU of short prefixes; 0 disables it")
+   SUGGEST_CACHE_MAX_PREFIX: int = Field(default=4, ge=0, description="Only queries up to this many characters are cached")
+   SUGGEST_CACHE_TTL_SECONDS: float = Field(default=30.0, gt=0, description="Bounds staleness of other workers' entries")
+
+   SEARCH_INDEX_ENABLED: bool = Field(default=False, description="Serve /public/search/{locale} from a per-worker in-memory index")
+   SEARCH_INDEX_POLL_SECONDS: float = Field(default=30.0, gt=0, description="How often each worker checks content_version for a full rebuild")
+
    DEBUG: bool = Field(default=False)
    ALLOWED_ORIGINS: str = Field(default="*")
    
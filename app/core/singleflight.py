@@ -0,0 +1,68 @@
+"""Single-flight: одновременные одинаковые вызовы разделяют один выполняющийся результат."""
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+import asyncio
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._waiters: dict[Hashable, int] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.failures = 0
+        self.max_waiters = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Первый вызов с ключом (лидер) выполняет fn() отдельной задачей; остальные,
+        пришедшие до её завершения, ждут тот же результат или ту же ошибку.
+        Отмена ожидающего не отменяет общую задачу.
+        """
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda t, key=key: self._finish(key, t))
+        else:
+            self.coalesced += 1
+            self._waiters[key] += 1
+            self.max_waiters = max(self.max_waiters, self._waiters[key])
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._waiters.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            self.failures += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalesced_ratio": round(self.coalesced / self.calls, 4) if self.calls else 0.0,
+            "failures": self.failures,
+            "in_flight": len(self._inflight),
+            "max_waiters": self.max_waiters,
+        }
+
+
+def freeze(value: Any) -> Hashable:
+    """Аргументы вызова -> хэшируемый ключ (списки, словари, множества, enum)."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(freeze(v) for v in value))
+    return getattr(value, "value", value)
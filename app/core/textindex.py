@@ -0,0 +1,171 @@
+"""
+Компактный инвертированный индекс в памяти с ранжированием BM25.
+
+Токен -> пара массивов (array): номера документов по возрастанию и взвешенная частота.
+Поля документа весят по-разному (BM25F в упрощённом виде: частоты и длина документа
+складываются с весами полей). Документы добавляются и удаляются по одному; номера
+растут монотонно, поэтому добавление — дописывание в конец массивов, удаление —
+bisect и срез. Освободившиеся номера собираются перенумерацией, когда их становится
+больше живых документов.
+
+Запрос — все слова обязательны (как websearch_to_tsquery), последнее слово
+дополняется как префикс: строка поиска работает на каждое нажатие.
+Стемминга нет: словоформы находятся через префикс.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Hashable, Iterable, Mapping
+import heapq
+import math
+import re
+import sys
+
+
+_TOKEN = re.compile(r"\w+")
+
+# Сколько словарных слов максимум разворачивает префикс последнего слова запроса
+MAX_PREFIX_TERMS = 64
+
+
+def tokenize(text: str | None) -> list[str]:
+    if not text:
+        return []
+    return _TOKEN.findall(text.lower().replace("ё", "е"))
+
+
+class InvertedIndex:
+    def __init__(self, fields: Mapping[str, float], k1: float = 1.2, b: float = 0.75) -> None:
+        self.fields = dict(fields)
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._keys: list[Hashable | None] = []
+        self._numbers: dict[Hashable, int] = {}
+        self._lengths = array("f")
+        self._terms: dict[int, tuple[str, ...]] = {}
+        self._total_length = 0.0
+        self._vocabulary: list[str] | None = None
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._numbers
+
+    def add(self, key: Hashable, document: Mapping[str, str | None]) -> None:
+        """Добавляет документ; документ с тем же ключом заменяется."""
+        self.remove(key)
+        weights: dict[str, float] = {}
+        length = 0.0
+        for name, weight in self.fields.items():
+            for token in tokenize(document.get(name)):
+                weights[token] = weights.get(token, 0.0) + weight
+                length += weight
+        if not weights:
+            return
+        number = len(self._keys)
+        self._keys.append(key)
+        self._numbers[key] = number
+        self._lengths.append(length)
+        self._terms[number] = tuple(weights)
+        self._total_length += length
+        for token, tf in weights.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = (array("I"), array("f"))
+                self._vocabulary = None
+            posting[0].append(number)
+            posting[1].append(tf)
+
+    def remove(self, key: Hashable) -> bool:
+        number = self._numbers.pop(key, None)
+        if number is None:
+            return False
+        for token in self._terms.pop(number):
+            docs, tfs = self._postings[token]
+            i = bisect_left(docs, number)
+            del docs[i], tfs[i]
+            if not docs:
+                del self._postings[token]
+                self._vocabulary = None
+        self._total_length -= self._lengths[number]
+        self._keys[number] = None
+        self._lengths[number] = 0.0
+        if len(self._keys) > 2 * len(self._numbers) + 64:
+            self._renumber()
+        return True
+
+    def update(self, documents: Iterable[tuple[Hashable, Mapping[str, str | None]]]) -> None:
+        for key, document in documents:
+            self.add(key, document)
+
+    def _renumber(self) -> None:
+        mapping = array("I", [0]) * len(self._keys)
+        keys, lengths = [], array("f")
+        for old, key in enumerate(self._keys):
+            if key is not None:
+                mapping[old] = len(keys)
+                self._numbers[key] = len(keys)
+                keys.append(key)
+                lengths.append(self._lengths[old])
+        self._terms = {mapping[old]: terms for old, terms in self._terms.items()}
+        for docs, _ in self._postings.values():
+            for i, old in enumerate(docs):
+                docs[i] = mapping[old]
+        self._keys, self._lengths = keys, lengths
+
+    def _expand(self, prefix: str) -> list[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        start = bisect_left(self._vocabulary, prefix)
+        end = bisect_right(self._vocabulary, prefix + "￿", lo=start)
+        return self._vocabulary[start:min(end, start + MAX_PREFIX_TERMS)]
+
+    def _term_scores(self, terms: Iterable[str]) -> dict[int, float]:
+        """Вклад слова запроса; при развороте префикса у документа берётся лучшее слово."""
+        n = len(self._numbers)
+        average = self._total_length / n
+        k1, b, lengths = self.k1, self.b, self._lengths
+        scores: dict[int, float] = {}
+        for term in terms:
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            docs, tfs = posting
+            idf = math.log(1.0 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            for number, tf in zip(docs, tfs):
+                score = idf * tf * (k1 + 1.0) / (tf + k1 * (1.0 - b + b * lengths[number] / average))
+                if score > scores.get(number, 0.0):
+                    scores[number] = score
+        return scores
+
+    def search(self, query: str, limit: int = 10, prefix: bool = True) -> list[tuple[Hashable, float]]:
+        tokens = tokenize(query)
+        if not tokens or not self._numbers or limit < 1:
+            return []
+        # Короткие списки первыми: пересечение сразу становится маленьким
+        groups = [[token] for token in dict.fromkeys(tokens[:-1])]
+        last = tokens[-1]
+        groups.append(self._expand(last) if prefix else [last])
+        groups.sort(key=lambda terms: sum(len(self._postings[t][0]) for t in terms if t in self._postings))
+        total: dict[int, float] | None = None
+        for terms in groups:
+            scores = self._term_scores(terms)
+            if total is None:
+                total = scores
+            else:
+                total = {number: score + scores[number] for number, score in total.items() if number in scores}
+            if not total:
+                return []
+        best = heapq.nlargest(limit, total.items(), key=lambda item: (item[1], -item[0]))
+        return [(self._keys[number], score) for number, score in best]
+
+    def memory_bytes(self) -> int:
+        """Приблизительный объём структур индекса (без самих ключей)."""
+        size = sys.getsizeof(self._postings) + sys.getsizeof(self._numbers) + sys.getsizeof(self._terms)
+        size += sys.getsizeof(self._keys) + self._lengths.buffer_info()[1] * self._lengths.itemsize
+        for token, (docs, tfs) in self._postings.items():
+            size += sys.getsizeof(token) + sys.getsizeof(docs) + sys.getsizeof(tfs)
+        for terms in self._terms.values():
+            size += sys.getsizeof(terms)
+        return size
@@ -1,17 +1,51 @@
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from uuid import UUID
+import asyncio
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 import sqlalchemy as sa
-from app.core.db import engine
+import app.models  # noqa: F401  все модели до первой настройки мапперов
+from app.core.db import async_session, engine
+from app.core.cdn import cdn_headers
+from app.core.compression import CompressionMiddleware
+from app.core.conditional import is_not_modified, not_modified, validator_headers
+from app.core.serialization import FastJSONResponse
+from app.core.settings import settings
+from app.models.taxonomy import LanguageEnum
+from app.services.cache import NEWS, PERSON, PROJECT, PUBLIC_TAGS, SNAPSHOT_POLICY
+from app.services.public import published_detail, published_list
+from app.services.search_index import SOURCES as SEARCH_SOURCES, catalog_index
+from app.services.snapshot import snapshot_store
+from app.services.suggest import suggest
+from app.services.taxonomy import get_filter_taxonomy
+from app.core.pool_metrics import pool_snapshot
+from app.repositories.base import MAX_LIMIT, read_flight
 from app.core.errors import *
 from sqlalchemy.exc import IntegrityError
 from app.core.errors import (DomainError, http_exception_handler, domain_exception_handler, integrity_exception_handler, generic_exception_handler)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    tasks = []
+    if settings.PUBLIC_SNAPSHOT_ENABLED:
+        tasks.append(asyncio.create_task(snapshot_store.run(async_session, settings.PUBLIC_SNAPSHOT_POLL_SECONDS)))
+    if settings.SEARCH_INDEX_ENABLED:
+        tasks.append(asyncio.create_task(catalog_index.run(async_session, settings.SEARCH_INDEX_POLL_SECONDS)))
+    yield
+    for task in tasks:
+        task.cancel()
+
+
 app = FastAPI(
     title="ARHEA API",
     version="0.1.0",
     debug=False,
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
+app.add_middleware(CompressionMiddleware)
+
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(DomainError, domain_exception_handler)
 app.add_exception_handler(IntegrityError, integrity_exception_handler)
@@ -26,6 +60,94 @@ async def check_db_connection() -> None:
     async with engine.connect() as conn:
         await conn.execute(sa.text("SELECT 1"))
 
+@app.get("/db_pool")
+async def db_pool_metrics():
+    return {"pools": pool_snapshot()}
+
+@app.get("/singleflight")
+async def singleflight_metrics():
+    return read_flight.snapshot()
+
+@app.get("/public/snapshot/{locale}")
+async def public_snapshot(locale: LanguageEnum, request: Request):
+    blob = snapshot_store.get(locale)
+    if blob is None:
+        raise DomainError("snapshot_not_ready", "public snapshot is not built yet", status=503)
+    headers = validator_headers(blob.etag, blob.generated_at, vary=("Accept-Encoding",))
+    headers.update(cdn_headers(SNAPSHOT_POLICY, ("snapshot", *PUBLIC_TAGS)))
+    if is_not_modified(request, blob.etag, blob.generated_at):
+        return not_modified(headers)
+    body, encoding = blob.encoded(request.headers.get("accept-encoding", ""))
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.get("/public/suggest/{locale}")
+async def public_suggest(
+    locale: LanguageEnum,
+    q: str = Query(min_length=1, max_length=64),
+    limit: int = Query(default=8, ge=1, le=settings.SUGGEST_LIMIT_MAX),
+):
+    return await suggest(q, locale, limit)
+
+@app.get("/public/taxonomy/{locale}")
+async def public_taxonomy(locale: LanguageEnum, fallback: LanguageEnum | None = None):
+    return await get_filter_taxonomy(locale, fallback)
+
+@app.get("/public/search/{locale}")
+async def public_search(
+    locale: LanguageEnum,
+    q: str = Query(min_length=1, max_length=128),
+    kind: list[str] | None = Query(default=None),
+    limit: int = Query(default=10, ge=1, le=50),
+):
+    if not catalog_index.ready:
+        raise DomainError("search_index_not_ready", "search index is not built yet", status=503)
+    unknown = set(kind or ()) - set(SEARCH_SOURCES)
+    if unknown:
+        raise DomainError("bad_request", "unknown kind", details={"kind": sorted(unknown)})
+    hits = catalog_index.search(q, locale, kinds=kind, limit=limit)
+    return [{"kind": h.kind, "id": h.id, "slug": h.slug, "label": h.label, "score": h.score} for h in hits]
+
+@app.get("/public/projects/{locale}")
+async def public_projects(
+    locale: LanguageEnum,
+    request: Request,
+    limit: int = Query(default=20, ge=1, le=MAX_LIMIT),
+    cursor: str | None = Query(default=None, max_length=512),
+):
+    return await published_list(request, PROJECT, locale, limit, cursor)
+
+@app.get("/public/news/{locale}")
+async def public_news(
+    locale: LanguageEnum,
+    request: Request,
+    limit: int = Query(default=20, ge=1, le=MAX_LIMIT),
+    cursor: str | None = Query(default=None, max_length=512),
+):
+    return await published_list(request, NEWS, locale, limit, cursor)
+
+@app.get("/public/people/{locale}")
+async def public_people(
+    locale: LanguageEnum,
+    request: Request,
+    limit: int = Query(default=20, ge=1, le=MAX_LIMIT),
+    cursor: str | None = Query(default=None, max_length=512),
+):
+    return await published_list(request, PERSON, locale, limit, cursor)
+
+@app.get("/public/projects/{locale}/{item_id}")
+async def public_project(locale: LanguageEnum, item_id: UUID, request: Request):
+    return await published_detail(request, PROJECT, locale, item_id)
+
+@app.get("/public/news/{locale}/{item_id}")
+async def public_news_item(locale: LanguageEnum, item_id: UUID, request: Request):
+    return await published_detail(request, NEWS, locale, item_id)
+
+@app.get("/public/people/{locale}/{item_id}")
+async def public_person(locale: LanguageEnum, item_id: UUID, request: Request):
+    return await published_detail(request, PERSON, locale, item_id)
+
 @app.get("/boom-domain")
 async def boom_domain():
     raise DomainError("bad_request", "invalid input")
@@ -0,0 +1,17 @@
+"""
+Все модели приложения. relationship() ссылаются на классы по имени ("Application",
+"MediaAsset", ...), и мапперы настраиваются, только когда импортированы все модули:
+импорт любого app.models.* загружает пакет целиком.
+"""
+from app.models import (  # noqa: F401
+    application,
+    career,
+    contact,
+    content_version,
+    location,
+    media,
+    news,
+    people,
+    project,
+    taxonomy,
+)
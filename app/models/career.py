@@ -25,7 +25,7 @@ class Career(Base):
     is_published = Column(Boolean, nullable=False, server_default=sa.text("false"))
     order_index = Column(Integer, nullable=False, server_default=sa.text("0"))
     
-    translations = relationship("CareerI18n", back_populates="career", cascade="all, delete-orphan", lazy="selectin")
+    translations = relationship("CareerI18n", back_populates="career", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
     applications = relationship("Application", back_populates="career")
 
     __table_args__ = (
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy import Column, String, BigInteger, DateTime
+from app.core.db import Base
+
+
+# ======================================================
+#                  CONTENT VERSION
+# ======================================================
+# Счётчик изменений публичного контента по сущностям (project, news, person, career).
+# Ведётся statement-триггерами БД на таблицах сущностей, их переводов и медиа
+# (миграция c3d9e1f4a2b6), поэтому учитывает и удаления, и правки дочерних строк.
+class ContentVersion(Base):
+    __tablename__ = "content_version"
+
+    entity = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, server_default=sa.text("0"))
+    changed_at = Column(DateTime(timezone=True), nullable=False, server_default=sa.text("now()"))
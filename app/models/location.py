@@ -30,7 +30,8 @@ class Location(Base):
         "LocationI18n",
         back_populates="location",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     __table_args__ = (
@@ -59,6 +60,7 @@ class LocationI18n(Base):
     __table_args__ = (
         Index("ix_location_i18n_locale", "locale"),
         Index("ix_location_i18n_order_index", "order_index"),
+        Index("ix_location_i18n_city_trgm", "city", postgresql_using="gin", postgresql_ops={"city": "gin_trgm_ops"}),
     )
 
 
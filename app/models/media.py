@@ -38,7 +38,8 @@ class MediaAsset(Base):
         "MediaAssetI18n",
         back_populates="media_asset",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     __table_args__ = (
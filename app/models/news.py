@@ -42,7 +42,7 @@ class News(Base):
     published_at = Column(DateTime(timezone=True), nullable=True)
 
     translations = relationship("NewsI18n", back_populates="news")
-    media_items = relationship("NewsMedia", back_populates="news", cascade="all, delete-orphan", lazy="selectin")
+    media_items = relationship("NewsMedia", back_populates="news", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
 
     __table_args__ = (
         Index("ix_news_published_at", "published_at"),
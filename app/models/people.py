@@ -28,8 +28,8 @@ class Person(Base):
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=sa.text("now()"), onupdate=sa.text("now()"))
 
     photo = relationship("MediaAsset")
-    project_roles = relationship("ProjectPersonRole", back_populates="person", cascade="all, delete-orphan", lazy="selectin")
-    translations = relationship("PersonI18n", back_populates="person", cascade="all, delete-orphan", lazy="selectin")
+    project_roles = relationship("ProjectPersonRole", back_populates="person", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    translations = relationship("PersonI18n", back_populates="person", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
 
     __table_args__ = (
         Index("ix_person_slug", "slug"),
@@ -55,6 +55,7 @@ class PersonI18n(Base):
     __table_args__ = (
         UniqueConstraint("person_id", "locale", name="uq_person_i18n_person_locale"),
         Index("ix_person_i18n_locale", "locale"),
+        Index("ix_person_i18n_full_name_trgm", "full_name", postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"}),
     )
 
 
@@ -60,11 +60,11 @@ class Project(Base):
     location = relationship("Location", foreign_keys=[location_id])
     project_type = relationship("ProjectType", foreign_keys=[type_id], back_populates="projects")
 
-    translations = relationship("ProjectI18n", back_populates="project", cascade="all, delete-orphan", lazy="selectin")
-    style_links = relationship("ProjectStyleLink", back_populates="project", cascade="all, delete-orphan", lazy="selectin")
-    styles = relationship("ProjectStyle", secondary="project_style_link", viewonly=True, lazy="selectin")
-    person_roles = relationship("ProjectPersonRole", back_populates="project", cascade="all, delete-orphan", lazy="selectin")
-    media = relationship("ProjectMedia", back_populates="project", cascade="all, delete-orphan", lazy="selectin")
+    translations = relationship("ProjectI18n", back_populates="project", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    style_links = relationship("ProjectStyleLink", back_populates="project", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    styles = relationship("ProjectStyle", secondary="project_style_link", viewonly=True, lazy="raise_on_sql")
+    person_roles = relationship("ProjectPersonRole", back_populates="project", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    media = relationship("ProjectMedia", back_populates="project", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
 
     __table_args__ = (
     CheckConstraint("slug ~ '^[a-z0-9-]+$'", name="ck_project_slug_format"),
@@ -115,6 +115,7 @@ class ProjectI18n(Base):
     __table_args__ = (
         Index("ix_project_i18n_locale", "locale"),
         Index("ix_project_i18n_search", "search_vector", postgresql_using="gin"),
+        Index("ix_project_i18n_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
     )
 
 
@@ -135,7 +136,8 @@ class ProjectType(Base):
         "ProjectTypeI18n",
         back_populates="project_type",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     __table_args__ = (
@@ -173,12 +175,13 @@ class ProjectStyle(Base):
     order_index = Column(Integer, nullable=False, server_default=sa.text("0"))
     visible = Column(Boolean, nullable=False, server_default=sa.text("true"))
 
-    project_links = relationship("ProjectStyleLink", back_populates="style", cascade="all, delete-orphan", lazy="selectin")
+    project_links = relationship("ProjectStyleLink", back_populates="style", cascade="all, delete-orphan", lazy="raise_on_sql")
     translations = relationship(
         "ProjectStyleI18n",
         back_populates="style",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     __table_args__ = (
@@ -245,3 +248,42 @@ class ProjectMedia(Base):
 )
 
 
+
+
+# ======================================================
+#                  PROJECT CARD (read model)
+# ======================================================
+class ProjectCard(Base):
+    """
+    Денормализованная карточка проекта: одна строка на (проект, локаль) со всем,
+    что нужно списку на главной. Пишется только триггерами БД (миграция d4e7a2c9b1f3)
+    при изменении проекта, его переводов, обложки, локации и типа.
+    """
+    __tablename__ = "project_card"
+
+    project_id = Column(UUID(as_uuid=True), ForeignKey("project.id", ondelete="CASCADE"), primary_key=True)
+    locale = Column(LanguageEnumType, primary_key=True)
+
+    slug = Column(String, nullable=False)
+    is_published = Column(Boolean, nullable=False)
+    published_at = Column(DateTime(timezone=True), nullable=True)
+    order_index = Column(Integer, nullable=False)
+
+    name = Column(String, nullable=True)
+    subname = Column(String, nullable=True)
+    short_description = Column(Text, nullable=True)
+
+    cover_path = Column(String, nullable=True)
+    cover_alt = Column(String, nullable=True)
+    location_id = Column(UUID(as_uuid=True), nullable=True)
+    city = Column(String, nullable=True)
+    country = Column(String, nullable=True)
+    type_id = Column(UUID(as_uuid=True), nullable=True)
+    type_title = Column(String, nullable=True)
+
+    refreshed_at = Column(DateTime(timezone=True), nullable=False, server_default=sa.text("now()"))
+
+    __table_args__ = (
+        Index("ix_project_card_listing",
+              "locale", "is_published", sa.text("order_index DESC"), sa.text("published_at DESC"), "project_id"),
+    )
@@ -7,39 +7,75 @@ from sqlalchemy.orm import selectinload
 from app.models.application import Application
 from app.models.career import Career
 from app.models.media import MediaAsset
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, LocaleArg, Page, locale_options
 
 
 class ApplicationRepository(BaseRepository[Application]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Application)  
 
-    def _relations_options(self):
+    def _load_profiles(self):
         files_option = selectinload(Application.files).selectinload(MediaAsset.translations)
         career_option = selectinload(Application.career).selectinload(Career.translations)
 
-        return (
+        detail = (
             files_option,
             career_option,
         )
 
-    async def get_with_relations(self, application_id: UUID) -> Application | None:
+        return {
+            "card": (career_option,),
+            "detail": detail,
+            "admin": detail,
+        }
+
+    def _relations_options(self):
+        return self._profile_options("detail")
+
+    async def get_with_relations(
+        self,
+        application_id: UUID,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> Application | None:
         stmt = (
             sa.select(Application)
             .where(Application.id == application_id)
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
         result = await self.session.execute(stmt)
         return result.unique().scalar_one_or_none()
 
-    async def list_with_relations(self, limit: int | None = None) -> list[Application]:
+    async def list_with_relations(
+        self,
+        limit: int | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> list[Application]:
         stmt = (
             sa.select(Application)
             .order_by(Application.created_at.desc())
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
         if limit is not None:
             stmt = stmt.limit(limit)
 
         result = await self.session.execute(stmt)
         return result.unique().scalars().all()
+
+    async def page_with_relations(
+        self,
+        limit: int = 20,
+        cursor: str | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> Page[Application]:
+        return await self.paginate(
+            filters=None,
+            order_by=("-created_at", "id"),
+            limit=limit,
+            cursor=cursor,
+            locale=locale,
+            fallback_locale=fallback_locale,
+            profile="detail",
+        )
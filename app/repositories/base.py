@@ -1,22 +1,188 @@
+from __future__ import annotations
+
 from typing import Any, Mapping, Optional, TypeVar, Generic
-from collections.abc import Sequence as Seq
+from collections.abc import Awaitable, Callable, Sequence as Seq
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from hashlib import blake2b
+import base64
+import enum
+import json
 from sqlalchemy import inspect
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import REGCONFIG, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeMeta
+from sqlalchemy.orm import DeclarativeMeta, lazyload, with_loader_criteria
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.orm.interfaces import ORMOption
 from sqlalchemy.exc import IntegrityError
+from app.core.db import Base
 from app.core.errors import DomainError
+from app.core.invalidation import key_rules, mapping_keys, mark, mark_rows
+from app.core.singleflight import SingleFlight, freeze
+from app.models.taxonomy import LanguageEnum
 
 
 
 T = TypeVar("T", bound=DeclarativeMeta)
+R = TypeVar("R")
+
+# Общий single-flight для чтений через read-only сессии (get_read_db)
+read_flight = SingleFlight("repository_reads")
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+@dataclass
+class SearchHit(Generic[T]):
+    item: T
+    rank: float
+
+
+SEARCH_ORDER = ["-rank", "-id"]
+
+
+def _dump_cursor_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)  # UUID, Decimal
+
+
+def _pack_cursor(payload: dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _unpack_cursor(cursor: str) -> dict[str, Any]:
+    return json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+
+
+def _load_cursor_value(column: Any, raw: Any) -> Any:
+    if raw is None:
+        return None
+    try:
+        py_type = column.type.python_type
+    except NotImplementedError:
+        return raw
+    if issubclass(py_type, (datetime, date)):
+        return py_type.fromisoformat(raw)
+    return py_type(raw)
+
+
+# Потолок на число закэшированных форм запросов на одну модель: формы конечны
+# (ключи фильтров валидируются по колонкам), лимит — страховка от комбинаторного роста.
+STATEMENT_CACHE_SIZE = 256
+
+# Потолок limit для списков: общий для репозиториев и Query(le=...) публичных маршрутов
+MAX_LIMIT = 100
+
+
+class ModelMeta:
+    """
+    Метаданные модели, которые раньше пересобирались на каждом вызове:
+    карта {key: column}, первичный ключ и кэш готовых statement-ов по их "форме"
+    (набор фильтров, порядок, наличие limit/курсора). Значения фильтров уходят
+    в bindparam-ы, поэтому один и тот же Select переиспользуется между вызовами,
+    а SQLAlchemy берёт мемоизированный cache key и скомпилированный SQL из кэша.
+    """
+    __slots__ = ("columns", "primary_key", "translations", "i18n_model", "i18n_columns", "statements")
+
+    def __init__(self, model: type):
+        mapper = inspect(model)
+        self.columns: dict[str, Any] = {c.key: getattr(model, c.key) for c in mapper.columns}
+        self.primary_key: tuple[Any, ...] = tuple(getattr(model, mapper.get_property_by_column(c).key) for c in mapper.primary_key)
+
+        # Связь translations -> *_i18n (если есть) для проекций с колонками одной локали.
+        rel = mapper.relationships.get("translations")
+        self.translations = getattr(model, "translations") if rel is not None else None
+        self.i18n_model = rel.mapper.class_ if rel is not None else None
+        self.i18n_columns: dict[str, Any] = (
+            {c.key: getattr(self.i18n_model, c.key) for c in rel.mapper.columns} if rel is not None else {}
+        )
+        self.statements: dict[tuple, Any] = {}
+
+    def statement(self, key: tuple, build: Callable[[], Any]) -> Any:
+        stmt = self.statements.get(key)
+        if stmt is None:
+            stmt = build()
+            if len(self.statements) < STATEMENT_CACHE_SIZE:
+                self.statements[key] = stmt
+        return stmt
+
+
+_MODEL_META: dict[type, ModelMeta] = {}
+
+
+def model_meta(model: type) -> ModelMeta:
+    meta = _MODEL_META.get(model)
+    if meta is None:
+        meta = _MODEL_META[model] = ModelMeta(model)
+    return meta
+
+
+LocaleArg = LanguageEnum | str | None
+
+_I18N_MODELS: tuple[int, tuple[type, ...]] = (0, ())
+
+
+def _i18n_models() -> tuple[type, ...]:
+    # *_i18n-модели берутся из реестра Base; пересчитываем, только если реестр вырос.
+    global _I18N_MODELS
+    mappers = Base.registry.mappers
+    if _I18N_MODELS[0] != len(mappers):
+        models = tuple(
+            m.class_ for m in mappers
+            if m.local_table is not None and m.local_table.name.endswith("_i18n") and "locale" in m.columns
+        )
+        _I18N_MODELS = (len(mappers), models)
+    return _I18N_MODELS[1]
+
+
+def locale_options(locale: LocaleArg, fallback_locale: LocaleArg = None) -> tuple[ORMOption, ...]:
+    """
+    Ограничивает загрузку всех *_I18n строк (в том числе вложенных, например
+    Project.media -> MediaAsset.translations) локалью locale и, опционально, fallback_locale.
+    Объекты, загруженные так, только для чтения: коллекция translations у них неполная.
+    """
+    if locale is None:
+        return ()
+    locales = tuple(dict.fromkeys(LanguageEnum(l) for l in (locale, fallback_locale) if l is not None))
+    return tuple(
+        with_loader_criteria(model, model.locale.in_(locales), include_aliases=True)
+        for model in _i18n_models()
+    )
 
 
 class BaseRepository(Generic[T]):
     def __init__(self, session: AsyncSession, model: type[T]):
         self.session = session
         self.model = model
+        self.meta = model_meta(model)
+
+    def _flight_key(self, *parts: Any) -> tuple | None:
+        """
+        Ключ single-flight или None, если объединять нельзя. Объединяются только чтения
+        в read-only сессиях: своих незакоммиченных изменений там нет, и результат лидера
+        годится всем. Объекты результата принадлежат сессии лидера — только для чтения.
+        В ключе — engine сессии: чтение, прилипшее к primary после записи, не ждёт реплику.
+        """
+        if not self.session.info.get("read_only"):
+            return None
+        return (self.session.bind, self.model.__name__, *(freeze(p) for p in parts))
+
+    async def _single_flight(self, key: tuple | None, load: Callable[[], Awaitable[R]]) -> R:
+        if key is None:
+            return await load()
+        return await read_flight.do(key, load)
 
     def _integrity_code_message(self, pgcode: str | None) -> tuple[str, int, str]:
         code_map = {
@@ -46,46 +212,93 @@ class BaseRepository(Generic[T]):
         raise DomainError(code, msg, status=status, details=details, cause=e)
 
 
-    def _build_pk_clause(self, id_or_dict: Any):
-        pks = inspect(self.model).primary_key
+    def _pk_clause(self):
+        return sa.and_(*(col == sa.bindparam(f"pk_{col.key}") for col in self.meta.primary_key))
+
+
+    def _key_attrs(self) -> tuple[str, ...]:
+        """Атрибуты, из которых track() строит ключи строк (id, project_id, news_id, ...)."""
+        return tuple(dict.fromkeys(attr for _, attr in key_rules(self.model)))
+
+
+    def _pk_params(self, id_or_dict: Any) -> dict[str, Any]:
+        pks = self.meta.primary_key
         if len(pks) == 1:
-            return pks[0] == id_or_dict
+            return {f"pk_{pks[0].key}": id_or_dict}
         
         if not isinstance(id_or_dict, Mapping): 
             raise TypeError("Composite primary key expects a dict with key:value")
         
-        clauses = []
+        params = {}
         for col in pks:
             key = col.key
             if key not in id_or_dict:
                 raise KeyError(f"Missing key part '{key}' for composite PK")        
-            clauses.append(col == id_or_dict[key])
+            params[f"pk_{key}"] = id_or_dict[key]
 
-        return sa.and_(*clauses)
+        return params
 
 
-    async def get(self, id_or_dict: object, options: Seq[ORMOption] | None = None) -> T | None:
-        stmt = sa.select(self.model).where(self._build_pk_clause(id_or_dict))
-        if options:
-            stmt = stmt.options(*options)
-        result = await self.session.execute(stmt)
-        result = result.unique()
-        return result.scalar_one_or_none()
-    
+    def _load_profiles(self) -> Mapping[str, Seq[ORMOption]]:
+        """
+        Именованные графы загрузки ("list", "card", "detail", "admin", ...) репозитория.
+        Связи в моделях объявлены lazy="raise_on_sql", поэтому всё, что endpoint
+        сериализует, должно быть перечислено в профиле — случайный N+1 падает сразу.
+        """
+        return {}
 
-    async def list(self, 
-        filters: Optional[Mapping[str, Any]] = None, 
-        order_by: Optional[Seq[str]] = None, 
-        limit: Optional[int] = None, 
-        options: Seq[ORMOption] | None = None,
-        ) -> list[T]:
 
-        stmt = sa.select(self.model)
+    def _profile_options(self, profile: str | None) -> tuple[ORMOption, ...]:
+        if profile is None:
+            return ()
+        # Loader-опции неизменяемы: строим профили один раз на класс репозитория.
+        cls = type(self)
+        profiles = cls.__dict__.get("_profiles_cache")
+        if profiles is None:
+            profiles = {name: tuple(opts) for name, opts in self._load_profiles().items()}
+            cls._profiles_cache = profiles
+        if profile not in profiles:
+            raise ValueError(f"Unknown load profile: {profile}")
+        return profiles[profile]
 
-        cols = {c.key: getattr(self.moу, c.key) for c in inspect(self.model).mapper.columns}
 
-        conditions = []
+    def _profile_key(self, profile: str | None) -> tuple[str, str] | None:
+        return (type(self).__qualname__, profile) if profile is not None else None
+
+
+    def _read_options(self, options: Seq[ORMOption] | None, locale: LocaleArg, fallback_locale: LocaleArg) -> tuple[ORMOption, ...]:
+        return (*(options or ()), *locale_options(locale, fallback_locale))
+
+
+    async def get(self,
+        id_or_dict: object,
+        options: Seq[ORMOption] | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+        profile: str | None = None,
+        ) -> T | None:
+        params = self._pk_params(id_or_dict)
+        profile_options = self._profile_options(profile)
+        stmt = self.meta.statement(
+            ("get", self._profile_key(profile)),
+            lambda: sa.select(self.model).where(self._pk_clause()).options(*profile_options),
+        )
+        key = None if options else self._flight_key("get", params, self._profile_key(profile), locale, fallback_locale)
+        options = self._read_options(options, locale, fallback_locale)
+        if options:
+            stmt = stmt.options(*options)
+
+        async def load() -> T | None:
+            result = await self.session.execute(stmt, params)
+            return result.unique().scalar_one_or_none()
 
+        return await self._single_flight(key, load)
+    
+
+    def _filter_shape(self, filters: Optional[Mapping[str, Any]]) -> tuple[tuple[tuple[str, str], ...], dict[str, Any]]:
+        cols = self.meta.columns
+        shape: list[tuple[str, str]] = []
+        params: dict[str, Any] = {}
         if filters:
             for k,v in filters.items():
                 if k not in cols:
@@ -94,59 +307,408 @@ class BaseRepository(Generic[T]):
                     continue
                 if isinstance(v, Seq) and not isinstance(v, (str, bytes, bytearray)):
                     if len(v) == 0:
-                        conditions.append(sa.false())
+                        shape.append((k, "none"))
                     else:    
-                        conditions.append(cols[k].in_(v))
+                        shape.append((k, "in"))
+                        params[f"f_{k}"] = list(v)
                 else:
-                    conditions.append(cols[k] == v)
-
-        if conditions:
-            stmt = stmt.where(sa.and_(*conditions))       
-
-        if order_by:
-            orders_expr: list[Any] = []
-            for name in order_by:
-                desc = name.startswith("-")
-                field = name[1:] if desc else name
-                if field not in cols: raise ValueError(f"Invalid order_by: {field}")
-                expr = cols[field].desc() if desc else cols[field]
-                orders_expr.append(expr)
-            if orders_expr:                   
-                stmt = stmt.order_by(*orders_expr)
+                    shape.append((k, "eq"))
+                    params[f"f_{k}"] = v
+        return tuple(sorted(shape)), params
+
+
+    def _filter_conditions(self, shape: Seq[tuple[str, str]]) -> list[Any]:
+        cols = self.meta.columns
+        conditions = []
+        for k, kind in shape:
+            if kind == "none":
+                conditions.append(sa.false())
+            elif kind == "in":
+                conditions.append(cols[k].in_(sa.bindparam(f"f_{k}", expanding=True)))
+            else:
+                conditions.append(cols[k] == sa.bindparam(f"f_{k}"))
+        return conditions
+
+
+    def _order_keys(self, order_by: Optional[Seq[str]]) -> tuple[tuple[str, bool], ...]:
+        cols = self.meta.columns
+        keys: list[tuple[str, bool]] = []
+        for name in order_by or ():
+            desc = name.startswith("-")
+            field = name[1:] if desc else name
+            if field not in cols: raise ValueError(f"Invalid order_by: {field}")
+            keys.append((field, desc))
+        return tuple(keys)
+
 
+    def _check_limit(self, limit: int) -> None:
+        if limit <= 0 or limit > MAX_LIMIT: raise ValueError(f"limit must be 1..{MAX_LIMIT}")
+
+
+    async def list(self, 
+        filters: Optional[Mapping[str, Any]] = None, 
+        order_by: Optional[Seq[str]] = None, 
+        limit: Optional[int] = None, 
+        options: Seq[ORMOption] | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+        profile: str | None = None,
+        ) -> list[T]:
+
+        shape, params = self._filter_shape(filters)
+        keys = self._order_keys(order_by)
         if limit is not None:
-            if limit <= 0 or limit > 100: raise ValueError("limit must be 1..100")
-            stmt = stmt.limit(limit)
+            self._check_limit(limit)
+            params["limit"] = limit
+        profile_options = self._profile_options(profile)
+
+        def build():
+            cols = self.meta.columns
+            stmt = sa.select(self.model)
+            conditions = self._filter_conditions(shape)
+            if conditions:
+                stmt = stmt.where(sa.and_(*conditions))
+            if keys:
+                stmt = stmt.order_by(*[cols[f].desc() if desc else cols[f] for f, desc in keys])
+            if limit is not None:
+                stmt = stmt.limit(sa.bindparam("limit", type_=sa.Integer))
+            return stmt.options(*profile_options)
+
+        stmt = self.meta.statement(("list", shape, keys, limit is not None, self._profile_key(profile)), build)
+        key = None if options else self._flight_key("list", shape, params, keys, self._profile_key(profile), locale, fallback_locale)
+        options = self._read_options(options, locale, fallback_locale)
+        if options:
+            stmt = stmt.options(*options)
+
+        async def load() -> list[T]:
+            result = await self.session.execute(stmt, params)
+            return result.unique().scalars().all()
+
+        return await self._single_flight(key, load)
+
+    async def select_columns(self,
+        columns: Seq[str],
+        filters: Optional[Mapping[str, Any]] = None,
+        order_by: Optional[Seq[str]] = None,
+        limit: Optional[int] = None,
+        i18n_columns: Seq[str] = (),
+        locale: LocaleArg = None,
+        row_type: Callable[..., Any] | None = None,
+        ) -> list[Any]:
+        """
+        Проекция: только перечисленные колонки модели (+ колонки *_i18n одной локали
+        через LEFT JOIN translations). Возвращает Row-кортежи (или row_type(*row)) —
+        без identity map, unit of work и загрузки связей.
+        """
+        cols = self.meta.columns
+        for name in columns:
+            if name not in cols:
+                raise ValueError(f"Invalid column: {name}")
+        if i18n_columns:
+            if self.meta.i18n_model is None:
+                raise ValueError(f"{self.model.__name__} has no translations")
+            if locale is None:
+                raise ValueError("locale is required for i18n columns")
+            for name in i18n_columns:
+                if name not in self.meta.i18n_columns or name in columns:
+                    raise ValueError(f"Invalid i18n column: {name}")
+
+        shape, params = self._filter_shape(filters)
+        keys = self._order_keys(order_by)
+        if limit is not None:
+            self._check_limit(limit)
+            params["limit"] = limit
+        if i18n_columns:
+            params["locale"] = LanguageEnum(locale)
+        column_key, i18n_key = tuple(columns), tuple(i18n_columns)
+
+        def build():
+            i18n_cols = self.meta.i18n_columns
+            stmt = sa.select(*[cols[c] for c in column_key], *[i18n_cols[c] for c in i18n_key])
+            if i18n_key:
+                stmt = stmt.select_from(self.model).outerjoin(
+                    self.meta.translations.and_(i18n_cols["locale"] == sa.bindparam("locale"))
+                )
+            conditions = self._filter_conditions(shape)
+            if conditions:
+                stmt = stmt.where(sa.and_(*conditions))
+            if keys:
+                stmt = stmt.order_by(*[cols[f].desc() if desc else cols[f] for f, desc in keys])
+            if limit is not None:
+                stmt = stmt.limit(sa.bindparam("limit", type_=sa.Integer))
+            return stmt
+
+        stmt = self.meta.statement(("columns", column_key, i18n_key, shape, keys, limit is not None), build)
+        result = await self.session.execute(stmt, params)
+        if row_type is None:
+            return list(result.all())
+        return [row_type(*row) for row in result]
+
+    # ---------------- KEYSET PAGINATION ----------------
+
+    def _keyset_keys(self, order_by: Optional[Seq[str]]) -> tuple[tuple[str, bool], ...]:
+        # Первичный ключ всегда добивается в конец порядка: без уникального хвоста keyset теряет строки.
+        keys = list(self._order_keys(order_by))
+        present = {f for f, _ in keys}
+        for pk in self.meta.primary_key:
+            if pk.key not in present:
+                keys.append((pk.key, False))
+        return tuple(keys)
+
+
+    def _encode_cursor(self, keys: Seq[tuple[str, bool]], item: Any, direction: str) -> str:
+        payload = {
+            "o": [("-" if desc else "") + f for f, desc in keys],
+            "d": direction,
+            "v": [_dump_cursor_value(getattr(item, f)) for f, _ in keys],
+        }
+        return _pack_cursor(payload)
 
+
+    def _decode_cursor(self, keys: Seq[tuple[str, bool]], cursor: str) -> tuple[list[Any], bool]:
+        cols = self.meta.columns
+        try:
+            payload = _unpack_cursor(cursor)
+            if payload["o"] != [("-" if desc else "") + f for f, desc in keys] or payload["d"] not in ("n", "p"):
+                raise ValueError("cursor does not match ordering")
+            values = [_load_cursor_value(cols[f], v) for (f, _), v in zip(keys, payload["v"], strict=True)]
+        except (ValueError, TypeError, KeyError, ArithmeticError) as e:
+            raise DomainError("invalid_cursor", "cursor is malformed or does not match ordering", status=400, cause=e)
+        return values, payload["d"] == "p"
+
+
+    def _keyset_clause(self, exprs: Seq[tuple[Any, bool]], values: Seq[Any]):
+        """
+        Условие "строго после курсора" для порядка exprs [(выражение, desc)].
+        NULL считается самым большим значением (поведение Postgres по умолчанию:
+        ASC NULLS LAST, DESC NULLS FIRST).
+        """
+        def nullable(expr) -> bool:
+            return getattr(getattr(expr, "expression", expr), "nullable", True)
+
+        if len({desc for _, desc in exprs}) == 1 and not any(nullable(e) for e, _ in exprs):
+            # Однонаправленный порядок по NOT NULL колонкам — row-value сравнение, которое
+            # планировщик превращает в range scan по составному индексу. Для NULL-колонок
+            # (a, b) > (x, y) не бывает истинным, и строки с NULL терялись бы.
+            left, right = sa.tuple_(*(e for e, _ in exprs)), sa.tuple_(*values)
+            return left < right if exprs[0][1] else left > right
+
+        def after(expr, desc, value):
+            if value is None:
+                return expr.is_not(None) if desc else sa.false()
+            if desc:
+                return expr < value
+            return sa.or_(expr > value, expr.is_(None)) if nullable(expr) else expr > value
+
+        def equal(expr, value):
+            return expr.is_(None) if value is None else expr == value
+
+        branches = []
+        for i, (expr, desc) in enumerate(exprs):
+            prefix = [equal(e, v) for (e, _), v in zip(exprs[:i], values[:i])]
+            branches.append(sa.and_(*prefix, after(expr, desc, values[i])))
+        clause = sa.or_(*branches)
+
+        # Грубая граница по первой колонке, чтобы индекс отсекал диапазон, а OR проверял хвост.
+        first, first_desc = exprs[0]
+        if values[0] is not None:
+            if first_desc:
+                bound = first <= values[0]
+            else:
+                bound = sa.or_(first >= values[0], first.is_(None)) if nullable(first) else first >= values[0]
+            clause = sa.and_(bound, clause)
+        return clause
+
+
+    def _cursor_params(self, keys: Seq[tuple[str, bool]], cursor: str | None, params: dict[str, Any]) -> tuple[bool, tuple[bool, ...] | None]:
+        # Значения курсора уходят в bindparam-ы k_i; форма запроса зависит только от направления и NULL-ов.
+        if not cursor:
+            return False, None
+        values, backward = self._decode_cursor(keys, cursor)
+        params.update({f"k_{i}": v for i, v in enumerate(values) if v is not None})
+        return backward, tuple(v is None for v in values)
+
+
+    def _keyset_condition(self, keys: Seq[tuple[str, bool]], backward: bool, nulls: Seq[bool]):
+        # Назад идём тем же условием, но с развёрнутым порядком.
+        cols = self.meta.columns
+        binds = [None if is_null else sa.bindparam(f"k_{i}", type_=cols[f].type) for i, ((f, _), is_null) in enumerate(zip(keys, nulls))]
+        return self._keyset_clause([(cols[f], desc != backward) for f, desc in keys], binds)
+
+
+    def _keyset_order(self, keys: Seq[tuple[str, bool]], backward: bool) -> list[Any]:
+        cols = self.meta.columns
+        return [cols[f].desc() if desc != backward else cols[f].asc() for f, desc in keys]
+
+
+    def _make_page(self, items: list[Any], keys: Seq[tuple[str, bool]], limit: int, cursor: str | None, backward: bool) -> Page:
+        # items выбраны с limit + 1: лишняя строка лишь сигнализирует, что дальше есть ещё.
+        has_more = len(items) > limit
+        items = items[:limit]
+        if backward:
+            items.reverse()
+
+        page = Page(items=items)
+        if items:
+            if has_more or backward:
+                page.next_cursor = self._encode_cursor(keys, items[-1], "n")
+            if (has_more and backward) or (cursor and not backward):
+                page.prev_cursor = self._encode_cursor(keys, items[0], "p")
+        return page
+
+
+    async def paginate(self,
+        filters: Optional[Mapping[str, Any]] = None,
+        order_by: Optional[Seq[str]] = None,
+        limit: int = 20,
+        cursor: str | None = None,
+        options: Seq[ORMOption] | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+        profile: str | None = None,
+        ) -> Page[T]:
+        """
+        Keyset-пагинация по order_by (+ PK как tie-breaker).
+        Курсор непрозрачный; next_cursor/prev_cursor отдаются вместе со страницей.
+        """
+        self._check_limit(limit)
+        keys = self._keyset_keys(order_by)
+        shape, params = self._filter_shape(filters)
+        params["limit"] = limit + 1
+        profile_options = self._profile_options(profile)
+
+        backward, nulls = self._cursor_params(keys, cursor, params)
+
+        def build():
+            conditions = self._filter_conditions(shape)
+            if nulls is not None:
+                conditions.append(self._keyset_condition(keys, backward, nulls))
+            stmt = sa.select(self.model)
+            if conditions:
+                stmt = stmt.where(sa.and_(*conditions))
+            stmt = stmt.order_by(*self._keyset_order(keys, backward))
+            return stmt.limit(sa.bindparam("limit", type_=sa.Integer)).options(*profile_options)
+
+        stmt = self.meta.statement(("page", shape, keys, backward, nulls, self._profile_key(profile)), build)
+        key = None if options else self._flight_key("page", shape, params, keys, self._profile_key(profile), locale, fallback_locale)
+        options = self._read_options(options, locale, fallback_locale)
         if options:
             stmt = stmt.options(*options)
 
-        result = await self.session.execute(stmt)
-        return result.unique().scalars().all()
+        async def load() -> Page[T]:
+            result = await self.session.execute(stmt, params)
+            return self._make_page(list(result.unique().scalars().all()), keys, limit, cursor, backward)
+
+        return await self._single_flight(key, load)
+
+
+    async def _search(self,
+        query: str,
+        locale: LanguageEnum | str,
+        limit: int = 20,
+        cursor: str | None = None,
+        filters: Optional[Mapping[str, Any]] = None,
+        fallback_locale: LocaleArg = None,
+        profile: str | None = None,
+        ) -> Page[SearchHit[T]]:
+        """
+        Полнотекстовый поиск по search_vector переводов одной локали (GIN-индекс
+        ix_*_i18n_search): websearch_to_tsquery, порядок ts_rank DESC, PK DESC.
+        Keyset-пагинация по (rank, PK); курсор привязан к запросу и локали.
+        """
+        self._check_limit(limit)
+        i18n = self.meta.i18n_model
+        if i18n is None or "search_vector" not in self.meta.i18n_columns or len(self.meta.primary_key) != 1:
+            raise ValueError(f"{self.model.__name__} has no searchable translations")
+        query = " ".join(query.split())
+        if not query:
+            return Page()
+        locale = LanguageEnum(locale)
+        shape, params = self._filter_shape(filters)
+        params.update({"q": query, "search_locale": locale, "limit": limit + 1})
+        scope = blake2b(f"{locale.value}|{query}".encode(), digest_size=8).hexdigest()
+
+        backward, after = False, False
+        if cursor:
+            try:
+                payload = _unpack_cursor(cursor)
+                if payload["o"] != SEARCH_ORDER or payload["s"] != scope or payload["d"] not in ("n", "p"):
+                    raise ValueError("cursor does not match search")
+                rank, pk = payload["v"]
+                params["k_0"] = float(rank)
+                params["k_1"] = _load_cursor_value(self.meta.primary_key[0], pk)
+            except (ValueError, TypeError, KeyError, ArithmeticError) as e:
+                raise DomainError("invalid_cursor", "cursor is malformed or does not match search", status=400, cause=e)
+            backward, after = payload["d"] == "p", True
+
+        pk_col = self.meta.primary_key[0]
+
+        def build():
+            search_locale = sa.bindparam("search_locale", type_=i18n.locale.type)
+            # Конфигурация по локали — та же search_config(), которой триггеры строят search_vector
+            config = sa.func.search_config(search_locale, type_=REGCONFIG)
+            tsquery = sa.func.websearch_to_tsquery(config, sa.bindparam("q", type_=sa.String))
+            rank = sa.func.ts_rank(i18n.search_vector, tsquery).label("rank")
+            conditions = [
+                i18n.locale == search_locale,
+                i18n.search_vector.op("@@")(tsquery),
+                *self._filter_conditions(shape),
+            ]
+            if after:
+                left = sa.tuple_(sa.func.ts_rank(i18n.search_vector, tsquery), pk_col)
+                right = sa.tuple_(sa.bindparam("k_0", type_=sa.Float), sa.bindparam("k_1", type_=pk_col.type))
+                conditions.append(left > right if backward else left < right)
+            order = [sa.asc(rank), pk_col.asc()] if backward else [sa.desc(rank), pk_col.desc()]
+            return (
+                sa.select(self.model, rank)
+                .join(self.meta.translations)
+                .where(*conditions)
+                .order_by(*order)
+                .limit(sa.bindparam("limit", type_=sa.Integer))
+            )
+
+        stmt = self.meta.statement(("search", shape, after, backward), build)
+        profile_options = self._profile_options(profile)
+        key = self._flight_key("search", shape, params, self._profile_key(profile), fallback_locale)
+        options = self._read_options(profile_options, locale, fallback_locale)
+        if options:
+            stmt = stmt.options(*options)
+
+        async def load() -> Page[SearchHit[T]]:
+            result = await self.session.execute(stmt, params)
+            rows = [SearchHit(item, float(rank)) for item, rank in result.unique().all()]
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            if backward:
+                rows.reverse()
+
+            def encode(hit: SearchHit[T], direction: str) -> str:
+                values = [hit.rank, _dump_cursor_value(getattr(hit.item, pk_col.key))]
+                return _pack_cursor({"o": SEARCH_ORDER, "s": scope, "d": direction, "v": values})
+
+            page: Page[SearchHit[T]] = Page(items=rows)
+            if rows:
+                if has_more or backward:
+                    page.next_cursor = encode(rows[-1], "n")
+                if (has_more and backward) or (cursor and not backward):
+                    page.prev_cursor = encode(rows[0], "p")
+            return page
+
+        return await self._single_flight(key, load)
+
 
     async def exists(self, filters: Optional[Mapping[str, Any]] = None) -> bool:
-        cols = {c.key: getattr(self.model, c.key) for c in inspect(self.model).mapper.columns}
+        shape, params = self._filter_shape(filters)
 
-        conditions = []
-        inner = sa.select(sa.literal(1)).select_from(self.model)
-        if filters:
-            for k,v in filters.items():
-                if k not in cols:
-                    raise ValueError(f"Invalid filter field: {k}")
-                if v is None:
-                    continue
-                if isinstance(v, Seq) and not isinstance(v, (str, bytes, bytearray)):
-                    if len(v) == 0:
-                        conditions.append(sa.false())
-                    else:    
-                        conditions.append(cols[k].in_(v))
-                else:
-                    conditions.append(cols[k] == v)
+        def build():
+            inner = sa.select(sa.literal(1)).select_from(self.model)
+            conditions = self._filter_conditions(shape)
+            if conditions:
+                inner = inner.where(sa.and_(*conditions))
+            return sa.select(sa.exists(inner))
 
-        if conditions:
-            inner = inner.where(sa.and_(*conditions))
-        stmt = sa.select(sa.exists(inner))
-        return bool(await self.session.scalar(stmt))
+        stmt = self.meta.statement(("exists", shape), build)
+        return bool(await self.session.scalar(stmt, params))
 
 
     async def create(self, data: Mapping[str, Any]) -> T:
@@ -156,6 +718,95 @@ class BaseRepository(Generic[T]):
             await self.session.flush()
         except IntegrityError as e: await self._raise_integrity(e, "create", {"data_keys" : list(data.keys())})
         return obj
+
+
+    def _check_columns(self, names: Seq[str], what: str) -> None:
+        for name in names:
+            if name not in self.meta.columns:
+                raise ValueError(f"Invalid {what} field: {name}")
+
+
+    async def create_many(self, rows: Seq[Mapping[str, Any]]) -> list[T]:
+        """
+        Multi-row INSERT ... RETURNING (insertmanyvalues): одна пачка вместо
+        add()+flush() на каждую строку. Возвращает созданные объекты в порядке rows.
+        Ключи созданных строк помечаются в сессии для инвалидации.
+        """
+        if not rows:
+            return []
+        for row in rows:
+            self._check_columns(list(row.keys()), "insert")
+
+        # insertmanyvalues бьёт строки на пачки; без sort_by_parameter_order порядок RETURNING не гарантирован
+        stmt = self.meta.statement(
+            ("insert",), lambda: sa.insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        )
+        try:
+            result = await self.session.scalars(stmt, [dict(row) for row in rows])
+            created = list(result.all())
+        except IntegrityError as e: await self._raise_integrity(e, "create_many", {"rows": len(rows)})
+        mark_rows(self.session.sync_session, self.model, created)
+        return created
+
+
+    async def upsert_many(self,
+        rows: Seq[Mapping[str, Any]],
+        conflict_cols: Seq[str],
+        update_cols: Seq[str] = (),
+        ) -> list[T]:
+        """
+        INSERT ... ON CONFLICT (conflict_cols) DO UPDATE SET update_cols ... RETURNING.
+        Без update_cols — DO NOTHING, и тогда возвращаются только реально вставленные строки.
+        updated_at (если есть у модели) выставляется в now() при конфликте.
+        Ключи вставленных и обновлённых строк помечаются в сессии для инвалидации.
+        """
+        if not rows:
+            return []
+        if not conflict_cols:
+            raise ValueError("conflict_cols must not be empty")
+        self._check_columns(conflict_cols, "conflict")
+        self._check_columns(update_cols, "update")
+        for row in rows:
+            self._check_columns(list(row.keys()), "insert")
+        # RETURNING отдаёт только новые значения: если DO UPDATE переносит строку к другому
+        # родителю (project_id, news_id), ключи прежних родителей дочитываем до записи
+        if set(update_cols) & set(self._key_attrs()):
+            await self._mark_existing(rows, conflict_cols)
+
+        conflict_key, update_key = tuple(conflict_cols), tuple(update_cols)
+
+        def build():
+            cols = self.meta.columns
+            stmt = pg_insert(self.model)
+            index_elements = [cols[c].property.columns[0] for c in conflict_key]
+            if not update_key:
+                return stmt.on_conflict_do_nothing(index_elements=index_elements).returning(self.model)
+            set_ = {c: stmt.excluded[cols[c].property.columns[0].name] for c in update_key}
+            if "updated_at" in cols and "updated_at" not in set_:
+                set_["updated_at"] = sa.func.now()
+            return stmt.on_conflict_do_update(index_elements=index_elements, set_=set_).returning(self.model)
+
+        stmt = self.meta.statement(("upsert", conflict_key, update_key), build)
+        try:
+            result = await self.session.scalars(
+                stmt,
+                [dict(row) for row in rows],
+                execution_options={"populate_existing": True},
+            )
+            upserted = list(result.all())
+        except IntegrityError as e: await self._raise_integrity(e, "upsert_many", {"rows": len(rows), "conflict_cols": list(conflict_key)})
+        mark_rows(self.session.sync_session, self.model, upserted)
+        return upserted
+
+
+    async def _mark_existing(self, rows: Seq[Mapping[str, Any]], conflict_cols: Seq[str]) -> None:
+        """Помечает ключи уже существующих строк, с которыми конфликтуют rows."""
+        cols = self.meta.columns
+        conflict = sa.tuple_(*(cols[c] for c in conflict_cols))
+        values = {tuple(row.get(c) for c in conflict_cols) for row in rows}
+        stmt = sa.select(*(cols[a] for a in self._key_attrs())).where(conflict.in_(list(values)))
+        existing = (await self.session.execute(stmt)).mappings().all()
+        mark_rows(self.session.sync_session, self.model, existing)
     
 
     async def update(self, id: Any, data: Mapping[str, Any]) -> Optional[T]:
@@ -178,5 +829,81 @@ class BaseRepository(Generic[T]):
         try:
             await self.session.flush()
         except IntegrityError as e: await self._raise_integrity(e, "delete", {"id": id})
-        return True    
-    
+        return True
+
+
+    async def update_returning(self, id: Any, data: Mapping[str, Any]) -> Optional[T]:
+        """
+        UPDATE ... WHERE pk RETURNING * одним запросом, без предварительного get()
+        и без каскада eager-загрузок: связи у возвращённого объекта не грузятся.
+        Если объект уже есть в identity map, его колонки обновляются из RETURNING.
+        None — если строки нет (как у update()).
+        Ключи строки (и прежнего родителя, если data его меняет) помечаются для инвалидации.
+        """
+        if not data:
+            return await self.get(id)
+        self._check_columns(list(data.keys()), "update")
+        params = self._pk_params(id)
+        keys = tuple(sorted(data))
+
+        def build():
+            cols = self.meta.columns
+            return (
+                sa.update(self.model)
+                .where(self._pk_clause())
+                .values({cols[k]: sa.bindparam(f"v_{k}", type_=cols[k].type) for k in keys})
+                .returning(self.model)
+                .options(lazyload("*"))
+            )
+
+        stmt = self.meta.statement(("update", keys), build)
+        # Уже загруженную копию помечаем expired: загрузчик RETURNING заполнит её колонки
+        # свежими значениями (populate_existing для ORM UPDATE не поддерживается).
+        ident = tuple(params[f"pk_{col.key}"] for col in self.meta.primary_key)
+        loaded = self.session.identity_map.get(identity_key(self.model, ident))
+        # RETURNING отдаёт только новые значения: прежние ключи берём до записи
+        if set(keys) & set(self._key_attrs()):
+            cols = self.meta.columns
+            before = await self.session.execute(
+                sa.select(*(cols[a] for a in self._key_attrs())).where(self._pk_clause()), params
+            )
+            mark(self.session.sync_session, mapping_keys(self.model, before.mappings().first() or {}))
+        if loaded is not None:
+            self.session.expire(loaded, list(self.meta.columns))
+        params.update({f"v_{k}": v for k, v in data.items()})
+        try:
+            result = await self.session.execute(
+                stmt,
+                params,
+                execution_options={"synchronize_session": False},
+            )
+            updated = result.scalars().one_or_none()
+        except IntegrityError as e: await self._raise_integrity(e, "update", {"id": id, "data_keys": list(data.keys())})
+        if updated is not None:
+            mark_rows(self.session.sync_session, self.model, [updated])
+        return updated
+
+
+    async def delete_returning(self, id: Any) -> bool:
+        """
+        DELETE ... WHERE pk RETURNING pk (и колонки ключей строки) одним запросом.
+        ORM-каскады не выполняются — работают FK-правила БД (ON DELETE CASCADE/RESTRICT).
+        """
+        params = self._pk_params(id)
+        key_attrs = self._key_attrs()
+
+        def build():
+            cols = self.meta.columns
+            pk_keys = {col.key for col in self.meta.primary_key}
+            extra = [cols[a] for a in key_attrs if a not in pk_keys]
+            return sa.delete(self.model).where(self._pk_clause()).returning(*self.meta.primary_key, *extra)
+
+        stmt = self.meta.statement(("delete", key_attrs), build)
+        try:
+            result = await self.session.execute(stmt, params, execution_options={"synchronize_session": "fetch"})
+            deleted = result.mappings().first()
+        except IntegrityError as e: await self._raise_integrity(e, "delete", {"id": id})
+        if deleted is None:
+            return False
+        mark_rows(self.session.sync_session, self.model, [deleted])
+        return True
@@ -5,41 +5,87 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.career import Career
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, LocaleArg, Page, locale_options
 
 
 class CareerRepository(BaseRepository[Career]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Career)  
 
-    async def list_published(self, locale: str | None = None, limit: int | None = None) -> list[Career]:
+    async def list_published(
+        self,
+        locale: LocaleArg = None,
+        limit: int | None = None,
+        fallback_locale: LocaleArg = None,
+    ) -> list[Career]:
         filters = {"is_published": True}
         order_by = ["-order_index"]
-        return await self.list(filters=filters, order_by=order_by, limit=limit)
+        return await self.list(filters=filters, order_by=order_by, limit=limit, locale=locale, fallback_locale=fallback_locale, profile="card")
+
+    def _load_profiles(self):
+        translations = (selectinload(Career.translations),)
+        return {
+            "card": translations,
+            "detail": translations,
+            "admin": translations,
+        }
 
     def _relations_options(self):
-        return (
-            selectinload(Career.translations),
-        )
+        return self._profile_options("detail")
 
-    async def get_with_relations(self, career_id: UUID) -> Career | None:
+    async def get_with_relations(
+        self,
+        career_id: UUID,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> Career | None:
         stmt = (
             sa.select(Career)
             .where(Career.id == career_id)
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
-        result = await self.session.execute(stmt)
-        return result.unique().scalar_one_or_none()
 
-    async def list_published_with_relations(self, limit: int | None = None) -> list[Career]:
+        async def load() -> Career | None:
+            result = await self.session.execute(stmt)
+            return result.unique().scalar_one_or_none()
+
+        return await self._single_flight(self._flight_key("detail", career_id, locale, fallback_locale), load)
+
+    async def list_published_with_relations(
+        self,
+        limit: int | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> list[Career]:
         stmt = (
             sa.select(Career)
             .where(Career.is_published.is_(True))
             .order_by(Career.order_index.desc())
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
         if limit is not None:
+            self._check_limit(limit)
             stmt = stmt.limit(limit)
 
-        result = await self.session.execute(stmt)
-        return result.unique().scalars().all()
+        async def load() -> list[Career]:
+            result = await self.session.execute(stmt)
+            return result.unique().scalars().all()
+
+        return await self._single_flight(self._flight_key("published", limit, locale, fallback_locale), load)
+
+    async def page_published_with_relations(
+        self,
+        limit: int = 20,
+        cursor: str | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> Page[Career]:
+        return await self.paginate(
+            filters={"is_published": True},
+            order_by=("-order_index", "id"),
+            limit=limit,
+            cursor=cursor,
+            locale=locale,
+            fallback_locale=fallback_locale,
+            profile="detail",
+        )
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.content_version import ContentVersion
+from app.repositories.base import BaseRepository
+
+
+class ContentVersionRepository(BaseRepository[ContentVersion]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, ContentVersion)
+
+    async def probe(self, entities: Iterable[str]) -> tuple[tuple[int, ...], datetime | None]:
+        """Версии сущностей (в порядке entities) и время последнего изменения — один запрос по PK."""
+        entities = list(entities)
+        rows = await self.select_columns(["entity", "version", "changed_at"], filters={"entity": entities})
+        found = {row.entity: row for row in rows}
+        versions = tuple(found[e].version if e in found else 0 for e in entities)
+        changed = [row.changed_at for row in rows]
+        return versions, max(changed) if changed else None
@@ -5,32 +5,48 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.location import Location
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, LocaleArg, locale_options
 
 
 class LocationRepository(BaseRepository[Location]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Location)  
 
-    def _relations_options(self):
-        return (
-            selectinload(Location.translations),
-        )
+    def _load_profiles(self):
+        translations = (selectinload(Location.translations),)
+        return {
+            "card": translations,
+            "detail": translations,
+            "admin": translations,
+        }
 
-    async def get_with_relations(self, location_id: UUID) -> Location | None:
+    def _relations_options(self):
+        return self._profile_options("detail")
+
+    async def get_with_relations(
+        self,
+        location_id: UUID,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> Location | None:
         stmt = (
             sa.select(Location)
             .where(Location.id == location_id)
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
         result = await self.session.execute(stmt)
         return result.unique().scalar_one_or_none()
 
-    async def list_with_relations(self, limit: int | None = None) -> list[Location]:
+    async def list_with_relations(
+        self,
+        limit: int | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> list[Location]:
         stmt = (
             sa.select(Location)
             .order_by(Location.order_index.asc())
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
         if limit is not None:
             stmt = stmt.limit(limit)
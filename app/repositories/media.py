@@ -7,39 +7,78 @@ from sqlalchemy.orm import selectinload
 from app.models.application import Application
 from app.models.career import Career
 from app.models.media import MediaAsset
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, LocaleArg, Page, locale_options
 
 
 class MediaAssetRepository(BaseRepository[MediaAsset]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, MediaAsset)  
 
-    def _relations_options(self):
-        application_option = selectinload(MediaAsset.application)
-        application_option.selectinload(Application.career).selectinload(Career.translations)
+    def _load_profiles(self):
+        application_option = (
+            selectinload(MediaAsset.application)
+            .selectinload(Application.career)
+            .selectinload(Career.translations)
+        )
 
-        return (
+        detail = (
             selectinload(MediaAsset.translations),
             application_option,
         )
 
-    async def get_with_relations(self, media_id: UUID) -> MediaAsset | None:
+        return {
+            "card": (selectinload(MediaAsset.translations),),
+            "detail": detail,
+            "admin": detail,
+        }
+
+    def _relations_options(self):
+        return self._profile_options("detail")
+
+    async def get_with_relations(
+        self,
+        media_id: UUID,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> MediaAsset | None:
         stmt = (
             sa.select(MediaAsset)
             .where(MediaAsset.id == media_id)
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
         result = await self.session.execute(stmt)
         return result.unique().scalar_one_or_none()
 
-    async def list_with_relations(self, limit: int | None = None) -> list[MediaAsset]:
+    async def list_with_relations(
+        self,
+        limit: int | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> list[MediaAsset]:
         stmt = (
             sa.select(MediaAsset)
             .order_by(MediaAsset.created_at.desc())
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
         if limit is not None:
             stmt = stmt.limit(limit)
 
         result = await self.session.execute(stmt)
         return result.unique().scalars().all()
+
+    async def page_with_relations(
+        self,
+        limit: int = 20,
+        cursor: str | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> Page[MediaAsset]:
+        return await self.paginate(
+            filters=None,
+            order_by=("-created_at", "id"),
+            limit=limit,
+            cursor=cursor,
+            locale=locale,
+            fallback_locale=fallback_locale,
+            profile="detail",
+        )
@@ -5,50 +5,125 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.media import MediaAsset
-from app.models.news import News, NewsMedia
-from app.repositories.base import BaseRepository
+from app.models.news import News, NewsMedia, NewsMediaKind
+from app.models.taxonomy import LanguageEnum
+from app.repositories.base import BaseRepository, LocaleArg, Page, SearchHit, locale_options
 
 
 class NewsRepository(BaseRepository[News]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, News)  
 
-    async def list_published(self, limit: int | None = None) -> list[News]:
+    async def list_published(
+        self,
+        limit: int | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> list[News]:
         filters = {"is_published": True}
         order_by = ["-published_at"]
-        return await self.list(filters=filters, order_by=order_by, limit=limit)
+        return await self.list(filters=filters, order_by=order_by, limit=limit, locale=locale, fallback_locale=fallback_locale, profile="card")
 
-    def _relations_options(self):
+    def _load_profiles(self):
         media_option = (
             selectinload(News.media_items)
             .selectinload(NewsMedia.media)
             .selectinload(MediaAsset.translations)
         )
-
-        return (
+        hero_option = (
+            selectinload(News.media_items.and_(NewsMedia.kind == NewsMediaKind.HERO))
+            .selectinload(NewsMedia.media)
+            .selectinload(MediaAsset.translations)
+        )
+        detail = (
             selectinload(News.translations),
             media_option,
         )
 
-    async def get_with_relations(self, news_id: UUID) -> News | None:
+        return {
+            "list": (selectinload(News.translations),),
+            "card": (selectinload(News.translations), hero_option),
+            "detail": detail,
+            "admin": detail,
+        }
+
+    def _relations_options(self):
+        return self._profile_options("detail")
+
+    async def get_with_relations(
+        self,
+        news_id: UUID,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> News | None:
         stmt = (
             sa.select(News)
             .where(News.id == news_id)
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
-        result = await self.session.execute(stmt)
-        return result.unique().scalar_one_or_none()
 
-    async def list_published_with_relations(self, limit: int | None = None) -> list[News]:
+        async def load() -> News | None:
+            result = await self.session.execute(stmt)
+            return result.unique().scalar_one_or_none()
+
+        return await self._single_flight(self._flight_key("detail", news_id, locale, fallback_locale), load)
+
+    async def list_published_with_relations(
+        self,
+        limit: int | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+        profile: str = "detail",
+    ) -> list[News]:
         stmt = (
             sa.select(News)
             .where(News.is_published.is_(True))
             .order_by(News.published_at.desc())
-            .options(*self._relations_options())
+            .options(*self._profile_options(profile), *locale_options(locale, fallback_locale))
         )
         if limit is not None:
+            self._check_limit(limit)
             stmt = stmt.limit(limit)
 
-        result = await self.session.execute(stmt)
-        return result.unique().scalars().all()
-    
+        async def load() -> list[News]:
+            result = await self.session.execute(stmt)
+            return result.unique().scalars().all()
+
+        return await self._single_flight(self._flight_key("published", profile, limit, locale, fallback_locale), load)
+
+    async def page_published_with_relations(
+        self,
+        limit: int = 20,
+        cursor: str | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+        profile: str = "detail",
+    ) -> Page[News]:
+        return await self.paginate(
+            filters={"is_published": True},
+            order_by=("-published_at", "id"),
+            limit=limit,
+            cursor=cursor,
+            locale=locale,
+            fallback_locale=fallback_locale,
+            profile=profile,
+        )
+
+    async def search(
+        self,
+        query: str,
+        locale: LanguageEnum | str,
+        limit: int = 20,
+        cursor: str | None = None,
+        fallback_locale: LocaleArg = None,
+    ) -> Page[SearchHit[News]]:
+        """Опубликованные новости по релевантности (title, описания) в локали locale."""
+        return await self._search(
+            query,
+            locale,
+            limit=limit,
+            cursor=cursor,
+            filters={"is_published": True},
+            fallback_locale=fallback_locale,
+            profile="card",
+        )
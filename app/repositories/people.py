@@ -7,49 +7,95 @@ from sqlalchemy.orm import selectinload
 from app.models.media import MediaAsset
 from app.models.people import Person, PersonRole, ProjectPersonRole
 from app.models.project import Project
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, LocaleArg, Page, locale_options
 
 
 class PersonRepository(BaseRepository[Person]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Person)  
 
-    def _relations_options(self):
+    def _load_profiles(self):
         photo_option = (
             selectinload(Person.photo)
             .selectinload(MediaAsset.translations)
         )
 
-        roles_option = selectinload(Person.project_roles)
-        role_loader = roles_option.selectinload(ProjectPersonRole.role)
-        role_loader.selectinload(PersonRole.translations)
-        project_loader = roles_option.selectinload(ProjectPersonRole.project)
-        project_loader.selectinload(Project.translations)
+        roles_option = selectinload(Person.project_roles).options(
+            selectinload(ProjectPersonRole.role).selectinload(PersonRole.translations),
+            selectinload(ProjectPersonRole.project).selectinload(Project.translations),
+        )
 
-        return (
+        detail = (
             selectinload(Person.translations),
             photo_option,
             roles_option,
         )
 
-    async def get_with_relations(self, person_id: UUID) -> Person | None:
+        return {
+            "list": (selectinload(Person.translations),),
+            "card": (selectinload(Person.translations), photo_option),
+            "detail": detail,
+            "admin": detail,
+        }
+
+    def _relations_options(self):
+        return self._profile_options("detail")
+
+    async def get_with_relations(
+        self,
+        person_id: UUID,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> Person | None:
         stmt = (
             sa.select(Person)
             .where(Person.id == person_id)
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
-        result = await self.session.execute(stmt)
-        return result.unique().scalar_one_or_none()
 
-    async def list_published_with_relations(self, limit: int | None = None) -> list[Person]:
+        async def load() -> Person | None:
+            result = await self.session.execute(stmt)
+            return result.unique().scalar_one_or_none()
+
+        return await self._single_flight(self._flight_key("detail", person_id, locale, fallback_locale), load)
+
+    async def list_published_with_relations(
+        self,
+        limit: int | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+        profile: str = "detail",
+    ) -> list[Person]:
         stmt = (
             sa.select(Person)
             .where(Person.is_published.is_(True))
             .order_by(Person.order_index.desc())
-            .options(*self._relations_options())
+            .options(*self._profile_options(profile), *locale_options(locale, fallback_locale))
         )
         if limit is not None:
+            self._check_limit(limit)
             stmt = stmt.limit(limit)
 
-        result = await self.session.execute(stmt)
-        return result.unique().scalars().all()
+        async def load() -> list[Person]:
+            result = await self.session.execute(stmt)
+            return result.unique().scalars().all()
+
+        return await self._single_flight(self._flight_key("published", profile, limit, locale, fallback_locale), load)
+
+    async def page_published_with_relations(
+        self,
+        limit: int = 20,
+        cursor: str | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+        profile: str = "detail",
+    ) -> Page[Person]:
+        return await self.paginate(
+            filters={"is_published": True},
+            order_by=("-order_index", "id"),
+            limit=limit,
+            cursor=cursor,
+            locale=locale,
+            fallback_locale=fallback_locale,
+            profile=profile,
+        )
@@ -1,78 +1,326 @@
+from dataclasses import dataclass, field
+from typing import Any, Sequence
 from uuid import UUID
 
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from app.models.location import Location
 from app.models.media import MediaAsset
 from app.models.people import Person, PersonRole, ProjectPersonRole
-from app.models.project import Project, ProjectMedia, ProjectStyle, ProjectType
-from app.repositories.base import BaseRepository
+from app.models.project import Project, ProjectCard, ProjectMedia, ProjectStyle, ProjectStyleLink, ProjectType
+from app.models.taxonomy import LanguageEnum
+from app.repositories.base import BaseRepository, LocaleArg, Page, SearchHit, locale_options
+
+
+PUBLISHED_ORDER = ("-order_index", "-published_at", "id")
+CARD_ORDER = ("-order_index", "-published_at", "project_id")
+
+# Фасеты страницы проектов; год группируется корзинами по YEAR_BUCKET лет (2015 -> 2015..2019)
+FACETS = ("type_id", "location_id", "style_id", "year")
+YEAR_BUCKET = 5
+
+
+@dataclass
+class FacetPage:
+    items: list[ProjectCard] = field(default_factory=list)
+    total: int = 0
+    # facet -> значение -> число проектов; у каждого фасета учтены все фильтры, кроме его собственного
+    counts: dict[str, dict[Any, int]] = field(default_factory=lambda: {f: {} for f in FACETS})
 
 
 class ProjectRepository(BaseRepository[Project]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Project)
 
-    async def list_published_for_main(self, limit: int | None = None) -> list[Project]:
+    async def list_published_for_main(
+        self,
+        limit: int | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> list[Project]:
         filters = {"is_published": True}
         order_by = ["-order_index"]
-        return await self.list(filters=filters, order_by=order_by, limit=limit)
-
-    def _relations_options(self):
-        media_option = selectinload(Project.media)
-        media_asset_option = media_option.selectinload(ProjectMedia.media)
-        media_asset_option.selectinload(MediaAsset.translations)
+        return await self.list(filters=filters, order_by=order_by, limit=limit, locale=locale, fallback_locale=fallback_locale, profile="card")
 
-        cover_option = selectinload(Project.cover)
-        cover_option.selectinload(MediaAsset.translations)
-
-        location_option = selectinload(Project.location)
-        location_option.selectinload(Location.translations)
-
-        project_type_option = selectinload(Project.project_type)
-        project_type_option.selectinload(ProjectType.translations)
-
-        styles_option = selectinload(Project.styles)
-        styles_option.selectinload(ProjectStyle.translations)
+    def _load_profiles(self):
+        card = (
+            selectinload(Project.translations),
+            selectinload(Project.cover).selectinload(MediaAsset.translations),
+            selectinload(Project.location).selectinload(Location.translations),
+            selectinload(Project.project_type).selectinload(ProjectType.translations),
+        )
 
-        person_roles_option = selectinload(Project.person_roles)
-        person_loader = person_roles_option.selectinload(ProjectPersonRole.person)
-        person_loader.selectinload(Person.translations)
-        role_loader = person_roles_option.selectinload(ProjectPersonRole.role)
-        role_loader.selectinload(PersonRole.translations)
+        # Loader-опции генеративны: ветвление только через .options(), иначе вложенная загрузка теряется.
+        media_option = (
+            selectinload(Project.media)
+            .selectinload(ProjectMedia.media)
+            .selectinload(MediaAsset.translations)
+        )
+        styles_option = selectinload(Project.styles).selectinload(ProjectStyle.translations)
+        person_roles_option = selectinload(Project.person_roles).options(
+            selectinload(ProjectPersonRole.person).selectinload(Person.translations),
+            selectinload(ProjectPersonRole.role).selectinload(PersonRole.translations),
+        )
 
-        return (
-            selectinload(Project.translations),
+        detail = (
+            *card,
             media_option,
-            cover_option,
-            location_option,
-            project_type_option,
             styles_option,
             person_roles_option,
         )
 
-    async def get_with_relations(self, project_id: UUID) -> Project | None:
+        return {
+            "list": (selectinload(Project.translations),),
+            "card": card,
+            "detail": detail,
+            "admin": (*detail, selectinload(Project.style_links)),
+        }
+
+    def _relations_options(self):
+        return self._profile_options("detail")
+
+    async def get_with_relations(
+        self,
+        project_id: UUID,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> Project | None:
         stmt = (
             sa.select(Project)
             .where(Project.id == project_id)
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
-        result = await self.session.execute(stmt)
-        return result.unique().scalar_one_or_none()
 
-    async def list_published_with_relations(self, limit: int | None = None) -> list[Project]:
+        async def load() -> Project | None:
+            result = await self.session.execute(stmt)
+            return result.unique().scalar_one_or_none()
+
+        return await self._single_flight(self._flight_key("detail", project_id, locale, fallback_locale), load)
+
+    async def list_published_with_relations(
+        self,
+        limit: int | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+        profile: str = "detail",
+    ) -> list[Project]:
         stmt = (
             sa.select(Project)
             .where(Project.is_published.is_(True))
             .order_by(Project.order_index.desc(), Project.published_at.desc())
-            .options(*self._relations_options())
+            .options(*self._profile_options(profile), *locale_options(locale, fallback_locale))
         )
         if limit is not None:
-            if limit <= 0 or limit > 100:
-                raise ValueError("limit must be 1..100")
+            self._check_limit(limit)
             stmt = stmt.limit(limit)
 
-        result = await self.session.execute(stmt)
-        return result.unique().scalars().all()
+        async def load() -> list[Project]:
+            result = await self.session.execute(stmt)
+            return result.unique().scalars().all()
+
+        return await self._single_flight(self._flight_key("published", profile, limit, locale, fallback_locale), load)
+
+    async def page_published_with_relations(
+        self,
+        limit: int = 20,
+        cursor: str | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+        profile: str = "detail",
+    ) -> Page[Project]:
+        return await self.paginate(
+            filters={"is_published": True},
+            order_by=PUBLISHED_ORDER,
+            limit=limit,
+            cursor=cursor,
+            locale=locale,
+            fallback_locale=fallback_locale,
+            profile=profile,
+        )
+
+    async def search(
+        self,
+        query: str,
+        locale: LanguageEnum | str,
+        limit: int = 20,
+        cursor: str | None = None,
+        fallback_locale: LocaleArg = None,
+    ) -> Page[SearchHit[Project]]:
+        """Опубликованные проекты по релевантности (name, subname, client_name, описания) в локали locale."""
+        return await self._search(
+            query,
+            locale,
+            limit=limit,
+            cursor=cursor,
+            filters={"is_published": True},
+            fallback_locale=fallback_locale,
+            profile="card",
+        )
+
+    async def list_published_cards(self, locale: LanguageEnum | str, limit: int | None = None) -> list[ProjectCard]:
+        return await ProjectCardRepository(self.session).list_published(locale, limit=limit)
+
+    async def page_published_cards(
+        self,
+        locale: LanguageEnum | str,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> Page[ProjectCard]:
+        return await ProjectCardRepository(self.session).page_published(locale, limit=limit, cursor=cursor)
+
+
+    async def facet_published(
+        self,
+        locale: LanguageEnum | str,
+        type_ids: Sequence[UUID] | None = None,
+        location_ids: Sequence[UUID] | None = None,
+        style_ids: Sequence[UUID] | None = None,
+        years: Sequence[int] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> FacetPage:
+        """
+        Страница карточек по фильтрам и счётчики по фасетам — одним запросом.
+        Внутри фасета значения объединяются через OR, фасеты между собой — через AND;
+        years — начала корзин (кратные YEAR_BUCKET).
+        """
+        self._check_limit(limit)
+        if offset < 0:
+            raise ValueError("offset must be >= 0")
+        selected = {"type_id": type_ids, "location_id": location_ids, "style_id": style_ids, "year": years}
+        params: dict[str, Any] = {"locale": LanguageEnum(locale), "limit": limit, "offset": offset}
+        for facet, values in selected.items():
+            if values is not None:
+                params[f"f_{facet}"] = list(values)
+        shape = tuple(facet for facet in FACETS if f"f_{facet}" in params)
+
+        stmt = self.meta.statement(("facets", shape), lambda: self._facet_statement(shape))
+        rows = (await self.session.execute(stmt, params)).all()
+
+        page = FacetPage(items=[row[1] for row in rows if row[1] is not None])
+        for facet, value, count in rows[0][0] if rows else ():
+            if facet is None:
+                page.total = count
+            elif value is not None and count:
+                page.counts[facet][int(value) if facet == "year" else UUID(value)] = count
+        return page
+
+    def _facet_statement(self, shape: tuple[str, ...]) -> sa.Select:
+        """
+        Фасеты: GROUPING SETS по type_id, location_id, style_id, корзине года и () — итог.
+        Для каждого набора свой count(DISTINCT id) FILTER без собственного фильтра фасета;
+        связь со стилями размножает строки, поэтому DISTINCT.
+        Страница: фильтры по project (type_id, location_id, is_published) и порядок по
+        order_index DESC — под индексы ix_project_type_loc_pub_order / ix_project_loc_pub_order /
+        ix_project_type_pub_order, — карточки project_card той же локали.
+        """
+        bucket = (Project.year - sa.func.mod(Project.year, YEAR_BUCKET)).label("year")
+        has_style = sa.exists().where(
+            ProjectStyleLink.project_id == Project.id,
+            ProjectStyleLink.style_id.in_(sa.bindparam("f_style_id", expanding=True)),
+        )
+        conditions = {
+            "type_id": Project.type_id.in_(sa.bindparam("f_type_id", expanding=True)),
+            "location_id": Project.location_id.in_(sa.bindparam("f_location_id", expanding=True)),
+            "style_id": has_style,
+            "year": bucket.in_(sa.bindparam("f_year", expanding=True)),
+        }
+        has_card = sa.and_(
+            ProjectCard.project_id == Project.id,
+            ProjectCard.locale == sa.bindparam("locale", type_=ProjectCard.locale.type),
+        )
+
+        base = (
+            sa.select(
+                Project.id,
+                Project.type_id,
+                Project.location_id,
+                bucket,
+                *(conditions[f].label(f"m_{f}") for f in shape),
+            )
+            .join(ProjectCard, has_card)
+            .where(Project.is_published.is_(True))
+            .subquery("facet_base")
+        )
+        link = ProjectStyleLink.__table__
+        dims = {
+            "type_id": base.c.type_id,
+            "location_id": base.c.location_id,
+            "style_id": link.c.style_id,
+            "year": base.c.year,
+        }
+
+        def count_without(facet: str | None):
+            flags = [base.c[f"m_{f}"] for f in shape if f != facet]
+            count = sa.func.count(sa.distinct(base.c.id))
+            return count.filter(sa.and_(*flags)) if flags else count
+
+        facet_name = sa.case(
+            *((sa.func.grouping(dims[f]) == 0, sa.literal(f)) for f in FACETS), else_=sa.null()
+        )
+        value = sa.case(
+            *((sa.func.grouping(dims[f]) == 0, sa.cast(dims[f], sa.Text)) for f in FACETS), else_=sa.null()
+        )
+        count = sa.case(
+            *((sa.func.grouping(dims[f]) == 0, count_without(f)) for f in FACETS), else_=count_without(None)
+        )
+        groups = (
+            sa.select(facet_name.label("facet"), value.label("value"), count.label("count"))
+            .select_from(base.outerjoin(link, link.c.project_id == base.c.id))
+            .group_by(sa.func.grouping_sets(*(sa.tuple_(dims[f]) for f in FACETS), sa.tuple_()))
+            .subquery("facet_groups")
+        )
+        facets = sa.select(
+            sa.func.coalesce(
+                sa.func.json_agg(sa.func.json_build_array(groups.c.facet, groups.c.value, groups.c.count)),
+                sa.text("'[]'::json"),
+                type_=sa.JSON,
+            ).label("facets")
+        ).subquery("facets")
+
+        page_query = (
+            sa.select(ProjectCard)
+            .join(Project, has_card)
+            .where(Project.is_published.is_(True), *(conditions[f] for f in shape))
+            .order_by(Project.order_index.desc(), Project.published_at.desc(), Project.id)
+            .limit(sa.bindparam("limit", type_=sa.Integer))
+            .offset(sa.bindparam("offset", type_=sa.Integer))
+            .subquery("page")
+        )
+        card = aliased(ProjectCard, page_query)
+        # Одна строка фасетов слева: пустая страница не теряет счётчики
+        return (
+            sa.select(facets.c.facets, card)
+            .select_from(facets)
+            .outerjoin(page_query, sa.true())
+            .order_by(card.order_index.desc(), card.published_at.desc(), card.project_id)
+        )
+
+
+class ProjectCardRepository(BaseRepository[ProjectCard]):
+    """Чтение денормализованных карточек project_card: один индексный запрос без связей."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, ProjectCard)
+
+    async def list_published(self, locale: LanguageEnum | str, limit: int | None = None) -> list[ProjectCard]:
+        return await self.list(
+            filters={"locale": LanguageEnum(locale), "is_published": True},
+            order_by=CARD_ORDER,
+            limit=limit,
+        )
+
+    async def page_published(
+        self,
+        locale: LanguageEnum | str,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> Page[ProjectCard]:
+        return await self.paginate(
+            filters={"locale": LanguageEnum(locale), "is_published": True},
+            order_by=CARD_ORDER,
+            limit=limit,
+            cursor=cursor,
+        )
@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+from functools import cache
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.location import Location, LocationI18n
+from app.models.people import Person, PersonI18n
+from app.models.project import Project, ProjectI18n
+from app.models.taxonomy import LanguageEnum
+
+
+@dataclass(slots=True)
+class Suggestion:
+    kind: str
+    id: UUID
+    label: str
+    slug: str
+    score: float
+
+
+def escape_like(value: str) -> str:
+    # Обратная косая — escape-символ LIKE в PostgreSQL по умолчанию
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+@cache
+def _suggest_statement() -> sa.Select:
+    """
+    Один запрос на все виды подсказок: в каждой ветке — совпадение с началом строки или
+    слова (ILIKE) либо нечёткое word_similarity (<%, порог pg_trgm.word_similarity_threshold).
+    Обе проверки идут по GIN-индексам gin_trgm_ops. Сначала совпадения по префиксу, затем
+    по близости; каждая ветка ограничена тем же limit.
+    """
+    q = sa.bindparam("q", type_=sa.String)
+    prefix = sa.bindparam("prefix", type_=sa.String)
+    word_prefix = sa.bindparam("word_prefix", type_=sa.String)
+    locale = sa.bindparam("locale", type_=ProjectI18n.locale.type)
+    limit = sa.bindparam("limit", type_=sa.Integer)
+
+    def branch(kind: str, label: sa.ColumnElement, ident: sa.ColumnElement, slug: sa.ColumnElement, i18n, *where):
+        is_prefix = sa.or_(label.ilike(prefix), label.ilike(word_prefix))
+        score = (sa.case((is_prefix, 1.0), else_=0.0) + sa.func.word_similarity(q, label, type_=sa.Float)).label("score")
+        return (
+            sa.select(sa.literal(kind).label("kind"), ident.label("id"), label.label("label"), slug.label("slug"), score)
+            .where(i18n.locale == locale, sa.or_(is_prefix, q.op("<%")(label)), *where)
+            .order_by(score.desc(), label)
+            .limit(limit)
+        )
+
+    branches = sa.union_all(
+        branch(
+            "project", ProjectI18n.name, Project.id, Project.slug, ProjectI18n, Project.is_published.is_(True)
+        ).join_from(ProjectI18n, Project),
+        branch(
+            "person", PersonI18n.full_name, Person.id, Person.slug, PersonI18n, Person.is_published.is_(True)
+        ).join_from(PersonI18n, Person),
+        branch(
+            "city", LocationI18n.city, Location.id, Location.city_slug, LocationI18n
+        ).join_from(LocationI18n, Location),
+    ).subquery("suggestion")
+    return sa.select(branches).order_by(branches.c.score.desc(), branches.c.label, branches.c.kind).limit(limit)
+
+
+class SuggestRepository:
+    """Подсказки поисковой строки: названия проектов, имена людей, города."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def suggest(self, query: str, locale: LanguageEnum | str, limit: int) -> list[Suggestion]:
+        query = " ".join(query.split())
+        if not query or limit < 1:
+            return []
+        escaped = escape_like(query)
+        params = {
+            "q": query,
+            "prefix": f"{escaped}%",
+            "word_prefix": f"% {escaped}%",
+            "locale": LanguageEnum(locale),
+            "limit": limit,
+        }
+        rows = await self.session.execute(_suggest_statement(), params)
+        return [Suggestion(row.kind, row.id, row.label, row.slug, float(row.score)) for row in rows]
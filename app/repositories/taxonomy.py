@@ -5,33 +5,49 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.project import ProjectStyle, ProjectType
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, LocaleArg, locale_options
 
 
 class ProjectTypeRepository(BaseRepository[ProjectType]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, ProjectType)
 
+    def _load_profiles(self):
+        translations = (selectinload(ProjectType.translations),)
+        return {
+            "card": translations,
+            "detail": translations,
+            "admin": translations,
+        }
+
     def _relations_options(self):
-        return (
-            selectinload(ProjectType.translations),
-        )
+        return self._profile_options("detail")
 
-    async def get_with_relations(self, type_id: UUID) -> ProjectType | None:
+    async def get_with_relations(
+        self,
+        type_id: UUID,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> ProjectType | None:
         stmt = (
             sa.select(ProjectType)
             .where(ProjectType.id == type_id)
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
         result = await self.session.execute(stmt)
         return result.unique().scalar_one_or_none()
 
-    async def list_visible_with_relations(self, limit: int | None = None) -> list[ProjectType]:
+    async def list_visible_with_relations(
+        self,
+        limit: int | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> list[ProjectType]:
         stmt = (
             sa.select(ProjectType)
             .where(ProjectType.visible.is_(True))
             .order_by(ProjectType.order_index.asc())
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
         if limit is not None:
             stmt = stmt.limit(limit)
@@ -44,26 +60,42 @@ class ProjectStyleRepository(BaseRepository[ProjectStyle]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, ProjectStyle)
 
+    def _load_profiles(self):
+        translations = (selectinload(ProjectStyle.translations),)
+        return {
+            "card": translations,
+            "detail": translations,
+            "admin": translations,
+        }
+
     def _relations_options(self):
-        return (
-            selectinload(ProjectStyle.translations),
-        )
+        return self._profile_options("detail")
 
-    async def get_with_relations(self, style_id: UUID) -> ProjectStyle | None:
+    async def get_with_relations(
+        self,
+        style_id: UUID,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> ProjectStyle | None:
         stmt = (
             sa.select(ProjectStyle)
             .where(ProjectStyle.id == style_id)
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
         result = await self.session.execute(stmt)
         return result.unique().scalar_one_or_none()
 
-    async def list_visible_with_relations(self, limit: int | None = None) -> list[ProjectStyle]:
+    async def list_visible_with_relations(
+        self,
+        limit: int | None = None,
+        locale: LocaleArg = None,
+        fallback_locale: LocaleArg = None,
+    ) -> list[ProjectStyle]:
         stmt = (
             sa.select(ProjectStyle)
             .where(ProjectStyle.visible.is_(True))
             .order_by(ProjectStyle.order_index.asc())
-            .options(*self._relations_options())
+            .options(*self._relations_options(), *locale_options(locale, fallback_locale))
         )
         if limit is not None:
             stmt = stmt.limit(limit)
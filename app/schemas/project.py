@@ -71,6 +71,27 @@ class ProjectRead(ProjectBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+
+# Строка project_card: карточка проекта в одной локали для публичного списка
+class ProjectCardRead(BaseModel):
+    project_id: UUID
+    locale: LanguageEnum
+    slug: str
+    published_at: datetime | None = None
+    order_index: int
+    name: str | None = None
+    subname: str | None = None
+    short_description: str | None = None
+    cover_path: str | None = None
+    cover_alt: str | None = None
+    location_id: UUID | None = None
+    city: str | None = None
+    country: str | None = None
+    type_id: UUID | None = None
+    type_title: str | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
 # ======================================================
 #                     PROJECT TYPE
 # ======================================================
@@ -0,0 +1,29 @@
+from __future__ import annotations
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+from app.models.taxonomy import LanguageEnum
+from app.schemas.career import CareerRead
+from app.schemas.location import LocationRead
+from app.schemas.news import NewsRead
+from app.schemas.people import PersonRead
+from app.schemas.project import ProjectRead, ProjectStyleRead, ProjectTypeRead
+
+
+# ======================================================
+#                  PUBLIC SNAPSHOT
+# ======================================================
+# Весь публичный контент одной локали: translations содержат только эту локаль.
+class PublicSnapshot(BaseModel):
+    locale: LanguageEnum
+    version: str
+    generated_at: datetime
+
+    projects: list[ProjectRead]
+    people: list[PersonRead]
+    news: list[NewsRead]
+    careers: list[CareerRead]
+    project_types: list[ProjectTypeRead]
+    project_styles: list[ProjectStyleRead]
+    locations: list[LocationRead]
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,226 @@
+from typing import Any, Awaitable, Callable, Iterable, Mapping
+
+from fastapi import Request, Response
+
+from app.core.cache import (
+    CacheBackend,
+    CachedBody,
+    CachePolicy,
+    Produced,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    ResponseCache,
+    params_digest,
+    split_produced,
+)
+from app.core.cdn import cdn_headers
+from app.core.compression import ENCODINGS, negotiate
+from app.core.conditional import is_not_modified, make_etag, not_modified, validator_headers
+from app.core.db import open_read_session
+from app.core.invalidation import on_commit, track
+from app.core.settings import settings
+from app.models.career import Career, CareerI18n
+from app.models.location import Location, LocationI18n
+from app.models.media import MediaAsset, MediaAssetI18n
+from app.models.news import News, NewsI18n, NewsMedia
+from app.models.people import Person, PersonI18n, PersonRole, PersonRoleI18n, ProjectPersonRole
+from app.models.project import (
+    Project,
+    ProjectI18n,
+    ProjectMedia,
+    ProjectStyle,
+    ProjectStyleI18n,
+    ProjectStyleLink,
+    ProjectType,
+    ProjectTypeI18n,
+)
+from app.repositories.content_version import ContentVersionRepository
+
+
+PROJECT, NEWS, PERSON, CAREER = "project", "news", "person", "career"
+PUBLIC_TAGS = (PROJECT, NEWS, PERSON, CAREER)
+
+# Дорогие публичные списки: после инвалидации отдаём прежнюю копию, пересчёт — в фоне.
+# CDN держит ответы сутки (s-maxage), только если настроена очистка по ключам:
+# без неё устаревшие копии в CDN снять нечем, и хватает max-age.
+SHARED_MAX_AGE = 86400 if settings.CDN_PURGE_URL else None
+LIST_POLICIES = {
+    PROJECT: CachePolicy(max_age=60, stale_while_revalidate=600, shared_max_age=SHARED_MAX_AGE),
+    NEWS: CachePolicy(max_age=60, stale_while_revalidate=600, shared_max_age=SHARED_MAX_AGE),
+    PERSON: CachePolicy(max_age=300, stale_while_revalidate=3600, shared_max_age=SHARED_MAX_AGE),
+}
+DETAIL_POLICY = CachePolicy(max_age=60, shared_max_age=SHARED_MAX_AGE)
+SNAPSHOT_POLICY = CachePolicy(max_age=30, shared_max_age=SHARED_MAX_AGE)
+
+# Какие публичные ответы устаревают при записи в модель
+_MODEL_TAGS = {
+    Project: (PROJECT,),
+    ProjectI18n: (PROJECT,),
+    ProjectMedia: (PROJECT,),
+    ProjectStyleLink: (PROJECT,),
+    ProjectType: (PROJECT,),
+    ProjectTypeI18n: (PROJECT,),
+    ProjectStyle: (PROJECT,),
+    ProjectStyleI18n: (PROJECT,),
+    Location: (PROJECT,),
+    LocationI18n: (PROJECT,),
+    News: (NEWS,),
+    NewsI18n: (NEWS,),
+    NewsMedia: (NEWS,),
+    Person: (PERSON, PROJECT),
+    PersonI18n: (PERSON, PROJECT),
+    PersonRole: (PERSON, PROJECT),
+    PersonRoleI18n: (PERSON, PROJECT),
+    ProjectPersonRole: (PERSON, PROJECT),
+    Career: (CAREER,),
+    CareerI18n: (CAREER,),
+    MediaAsset: (PROJECT, NEWS, PERSON),
+    MediaAssetI18n: (PROJECT, NEWS, PERSON),
+}
+
+# Построчные ключи (суррогатные ключи CDN): чья это строка — (префикс, атрибут с id)
+_ROW_KEYS = {
+    Project: (("project", "id"),),
+    ProjectI18n: (("project", "project_id"),),
+    ProjectMedia: (("project", "project_id"),),
+    ProjectStyleLink: (("project", "project_id"),),
+    ProjectType: (("project_type", "id"),),
+    ProjectTypeI18n: (("project_type", "type_id"),),
+    ProjectStyle: (("project_style", "id"),),
+    ProjectStyleI18n: (("project_style", "style_id"),),
+    Location: (("location", "id"),),
+    LocationI18n: (("location", "location_id"),),
+    News: (("news", "id"),),
+    NewsI18n: (("news", "news_id"),),
+    NewsMedia: (("news", "news_id"),),
+    Person: (("person", "id"),),
+    PersonI18n: (("person", "person_id"),),
+    PersonRole: (("person_role", "id"),),
+    PersonRoleI18n: (("person_role", "person_role_id"),),
+    ProjectPersonRole: (("project", "project_id"), ("person", "person_id")),
+    Career: (("career", "id"),),
+    CareerI18n: (("career", "career_id"),),
+    MediaAsset: (("media", "id"),),
+    MediaAssetI18n: (("media", "media_asset_id"),),
+}
+
+for _model, _tags in _MODEL_TAGS.items():
+    track(_model, *_tags, keys=_ROW_KEYS.get(_model, ()))
+
+
+def build_backend() -> CacheBackend | None:
+    kind = settings.RESPONSE_CACHE_BACKEND
+    if kind == "none":
+        return None
+    if kind == "memory":
+        return MemoryCacheBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+    if not settings.RESPONSE_CACHE_REDIS_URL:
+        raise ValueError("RESPONSE_CACHE_REDIS_URL is required for the redis cache backend")
+    return RedisCacheBackend(settings.RESPONSE_CACHE_REDIS_URL)
+
+
+_backend = build_backend()
+response_cache = (
+    ResponseCache(
+        _backend,
+        settings.RESPONSE_CACHE_TTL_SECONDS,
+        lock_ttl=settings.RESPONSE_CACHE_REFRESH_LOCK_SECONDS,
+        encodings=ENCODINGS,
+    )
+    if _backend
+    else None
+)
+
+
+async def _invalidate(tags: set[str]) -> None:
+    if response_cache is not None:
+        await response_cache.invalidate(tags & set(PUBLIC_TAGS))
+
+
+for _tag in PUBLIC_TAGS:
+    on_commit(_tag, _invalidate)
+
+
+async def _cached_body(
+    entity: str,
+    locale: Any,
+    params: Mapping[str, Any] | None,
+    produce: Callable[[], Awaitable[Produced]],
+    policy: CachePolicy | None,
+    accept_encoding: str,
+    content_versions: tuple[int, ...] | None = None,
+) -> CachedBody:
+    if response_cache is None:
+        # Сожмёт CompressionMiddleware
+        body, keys = split_produced(await produce())
+        return CachedBody(body, keys=keys)
+    return await response_cache.get_or_set(
+        entity,
+        locale,
+        params,
+        produce,
+        policy=policy,
+        encoding=negotiate(accept_encoding),
+        content_versions=content_versions,
+    )
+
+
+def _json_response(cached: CachedBody, policy: CachePolicy | None) -> Response:
+    headers = {"Vary": "Accept-Encoding", **cdn_headers(policy, cached.keys)}
+    if cached.encoding is not None:
+        headers["Content-Encoding"] = cached.encoding
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+async def cached_json(
+    entity: str,
+    locale: Any,
+    params: Mapping[str, Any] | None,
+    produce: Callable[[], Awaitable[Produced]],
+    policy: CachePolicy | None = None,
+    accept_encoding: str = "",
+) -> Response:
+    """
+    JSON-ответ публичного эндпоинта: из кэша или produce() с сохранением.
+    produce() возвращает тело или (тело, суррогатные ключи) — они уходят в заголовки для CDN.
+    С policy.stale_while_revalidate produce() может выполниться в фоне после ответа,
+    поэтому он открывает свою сессию, а не берёт сессию запроса.
+    Из кэша отдаётся заранее сжатый вариант под Accept-Encoding клиента.
+    """
+    cached = await _cached_body(entity, locale, params, produce, policy, accept_encoding)
+    return _json_response(cached, policy)
+
+
+async def conditional_json(
+    request: Request,
+    entity: str,
+    locale: Any,
+    params: Mapping[str, Any] | None,
+    produce: Callable[[], Awaitable[Produced]],
+    policy: CachePolicy | None = None,
+    depends_on: Iterable[str] = (),
+) -> Response:
+    """
+    Как cached_json, но с ETag/Last-Modified из content_version (один запрос по PK).
+    Если копия клиента актуальна — 304 без загрузки графа и сериализации.
+    Тело берётся из кэша, только если оно сохранено под те же версии content_version:
+    запись другого воркера кэш этого воркера не сбрасывает. Устаревшая копия из
+    stale-while-revalidate уходит без валидаторов: иначе клиент закрепил бы старое
+    тело под новым ETag.
+    """
+    entities = [entity, *depends_on]
+    session = await open_read_session()
+    try:
+        versions, changed_at = await ContentVersionRepository(session).probe(entities)
+    finally:
+        await session.close()
+    etag = make_etag(entity, locale, params_digest(params or {}), *versions)
+    validators = validator_headers(etag, changed_at)
+    if is_not_modified(request, etag, changed_at):
+        return not_modified({**validators, "Vary": "Accept-Encoding", **cdn_headers(policy)})
+    accept_encoding = request.headers.get("accept-encoding", "")
+    cached = await _cached_body(entity, locale, params, produce, policy, accept_encoding, tuple(versions))
+    response = _json_response(cached, policy)
+    if not cached.stale:
+        response.headers.update(validators)
+    return response
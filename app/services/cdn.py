@@ -0,0 +1,78 @@
+"""
+Суррогатные ключи публичных ответов и очистка CDN после коммита.
+
+Ключи ответа собираются обходом загруженного графа ORM: для каждой строки — её ключи
+по правилам track() (project:<id>, person:<id>, ...) и ссылки из REFERENCES (обложка,
+тип, стиль, роль). Незагруженные связи не трогаются — обход не делает запросов.
+"""
+from typing import Any, Iterable
+
+from sqlalchemy import inspect
+
+from app.core.cdn import HttpPurger, Purger
+from app.core.invalidation import on_commit, row_keys
+from app.core.settings import settings
+from app.models.news import NewsMedia
+from app.models.people import Person, ProjectPersonRole
+from app.models.project import Project, ProjectCard, ProjectMedia, ProjectStyleLink
+from app.services.cache import PUBLIC_TAGS
+
+
+# На что ещё ссылается строка (id в её колонках)
+REFERENCES = {
+    Project: (("media", "cover_media_id"), ("location", "location_id"), ("project_type", "type_id")),
+    # Карточку пишут триггеры БД: своих ключей у неё нет, только ссылки
+    ProjectCard: (("project", "project_id"), ("location", "location_id"), ("project_type", "type_id")),
+    ProjectMedia: (("media", "media_id"),),
+    ProjectStyleLink: (("project_style", "style_id"),),
+    ProjectPersonRole: (("person_role", "role_id"),),
+    NewsMedia: (("media", "media_id"),),
+    Person: (("media", "photo_media_id"),),
+}
+
+
+def surrogate_keys(objs: Iterable[Any], *collections: str) -> set[str]:
+    keys = set(collections)
+    seen: set[int] = set()
+    stack = list(objs)
+    while stack:
+        obj = stack.pop()
+        if obj is None or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        state = inspect(obj, raiseerr=False)
+        if state is None:
+            continue
+        keys |= row_keys(obj, history=False)
+        keys |= row_keys(obj, REFERENCES.get(type(obj), ()), history=False)
+        for rel in state.mapper.relationships:
+            loaded = state.dict.get(rel.key)
+            if loaded is None:
+                continue
+            if rel.uselist:
+                stack.extend(loaded)
+            else:
+                stack.append(loaded)
+    return keys
+
+
+def build_purger() -> Purger | None:
+    if not settings.CDN_PURGE_URL:
+        return None
+    return HttpPurger(settings.CDN_PURGE_URL, settings.CDN_PURGE_TOKEN, settings.CDN_PURGE_TIMEOUT_SECONDS)
+
+
+purger = build_purger()
+
+
+async def purge_committed(tags: set[str]) -> None:
+    """Коллекции публичного контента и ключи закоммиченных строк."""
+    if purger is None:
+        return
+    keys = {tag for tag in tags if tag in PUBLIC_TAGS or ":" in tag}
+    if keys:
+        await purger.purge(keys)
+
+
+for _tag in PUBLIC_TAGS:
+    on_commit(_tag, purge_committed)
@@ -1,4 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from app.models.news import News
 from app.core.errors import DomainError
 from uuid import UUID
@@ -10,7 +11,7 @@ from app.schemas.news import NewsCreate, NewsUpdate
 # ---------------- GET ----------------
 async def get_news(session: AsyncSession, news_id: UUID) -> News:
     repo = NewsRepository(session)
-    news = await repo.get(news_id)
+    news = await repo.get(news_id, profile="detail")
     if news is None:
         raise DomainError("not_found", "news not found", status=404, details={"id": news_id})
     return news
@@ -43,18 +44,18 @@ async def update_news(session: AsyncSession, news_id: UUID, data: NewsUpdate) ->
         raise DomainError("empty_update", "nothing to update", status=400)
     if "short_description" in payload and "preview" not in payload:
         payload["preview"] = payload["short_description"] or ""
-    news = await repo.update(news_id, payload)
+    news = await repo.update_returning(news_id, payload)
     if news is None:
         raise DomainError("not_found", "news not found", status=404, details={"id": news_id})
     await session.commit()
-    await session.refresh(news)
-    return news    
+    # RETURNING связи не грузит, а NewsRead сериализует translations — дочитываем их
+    return await repo.get(news_id, options=[selectinload(News.translations)])
 
 
 # ---------------- DELETE ----------------    
 async def delete_news(session: AsyncSession, news_id: UUID) -> bool:
     repo = NewsRepository(session)
-    deleted = await repo.delete(news_id)
+    deleted = await repo.delete_returning(news_id)
     if not deleted:
         raise DomainError("not_found", "news not found", status=404, details={"id": news_id})
     await session.commit()
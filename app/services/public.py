@@ -0,0 +1,91 @@
+"""
+Публичные списки (stale-while-revalidate; проекты — из project_card) и карточки
+опубликованного контента одной локали. Списки отдаются страницами с keyset-курсором:
+{"items": [...], "next_cursor": ..., "prev_cursor": ...}.
+Ответы условные (ETag/Last-Modified из content_version): актуальная копия клиента — 304.
+Ответы несут суррогатные ключи всех строк, из которых собраны, — для адресной очистки CDN.
+"""
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import open_read_session
+from app.core.errors import DomainError
+from app.core.serialization import dumps, serializer_for
+from app.models.project import ProjectCard
+from app.models.taxonomy import LanguageEnum
+from app.repositories.base import Page
+from app.repositories.news import NewsRepository
+from app.repositories.people import PersonRepository
+from app.repositories.project import ProjectRepository
+from app.schemas.news import NewsRead
+from app.schemas.people import PersonRead
+from app.schemas.project import ProjectCardRead, ProjectRead
+from app.services.cache import DETAIL_POLICY, LIST_POLICIES, NEWS, PERSON, PROJECT, conditional_json
+from app.services.cdn import surrogate_keys
+
+
+ListLoader = Callable[[AsyncSession, LanguageEnum, int, str | None], Awaitable[Page[Any]]]
+
+
+async def _project_cards(session: AsyncSession, locale: LanguageEnum, limit: int, cursor: str | None) -> Page[ProjectCard]:
+    return await ProjectRepository(session).page_published_cards(locale, limit=limit, cursor=cursor)
+
+
+def _published(repo_cls: type) -> ListLoader:
+    async def load(session: AsyncSession, locale: LanguageEnum, limit: int, cursor: str | None) -> Page[Any]:
+        return await repo_cls(session).page_published_with_relations(
+            limit=limit, cursor=cursor, locale=locale, profile="list"
+        )
+
+    return load
+
+
+# entity -> (имя списка в ключе кэша и ETag, загрузчик, сериализатор); проекты — из project_card
+PUBLIC_LISTS: dict[str, tuple[str, ListLoader, Any]] = {
+    PROJECT: ("card-pages", _project_cards, serializer_for(ProjectCardRead)),
+    NEWS: ("pages", _published(NewsRepository), serializer_for(NewsRead)),
+    PERSON: ("pages", _published(PersonRepository), serializer_for(PersonRead)),
+}
+
+PUBLIC_DETAILS = {
+    PROJECT: (ProjectRepository, serializer_for(ProjectRead)),
+    NEWS: (NewsRepository, serializer_for(NewsRead)),
+    PERSON: (PersonRepository, serializer_for(PersonRead)),
+}
+
+
+async def published_list(
+    request: Request, entity: str, locale: LanguageEnum, limit: int, cursor: str | None = None
+) -> Response:
+    name, load, serializer = PUBLIC_LISTS[entity]
+
+    async def produce() -> tuple[bytes, set[str]]:
+        session = await open_read_session()
+        try:
+            page = await load(session, locale, limit, cursor)
+            body = {"items": serializer.many(page.items), "next_cursor": page.next_cursor, "prev_cursor": page.prev_cursor}
+            return dumps(body), surrogate_keys(page.items, entity)
+        finally:
+            await session.close()
+
+    params = {"list": name, "limit": limit, "cursor": cursor}
+    return await conditional_json(request, entity, locale, params, produce, LIST_POLICIES[entity])
+
+
+async def published_detail(request: Request, entity: str, locale: LanguageEnum, item_id: UUID) -> Response:
+    repo_cls, serializer = PUBLIC_DETAILS[entity]
+
+    async def produce() -> tuple[bytes, set[str]]:
+        session = await open_read_session()
+        try:
+            item = await repo_cls(session).get_with_relations(item_id, locale=locale)
+            if item is None or not item.is_published:
+                raise DomainError("not_found", f"{entity} not found", status=404, details={"id": str(item_id)})
+            return dumps(serializer(item)), surrogate_keys([item])
+        finally:
+            await session.close()
+
+    return await conditional_json(request, entity, locale, {"id": item_id}, produce, DETAIL_POLICY)
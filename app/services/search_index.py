@@ -0,0 +1,327 @@
+"""
+Поиск по каталогу из памяти воркера (SEARCH_INDEX_ENABLED): опубликованные проекты,
+новости и люди, по InvertedIndex на каждую пару (сущность, локаль).
+
+Индекс строится при старте. Коммит этого воркера, затронувший строки проекта, новости
+или человека (ключи project:<id>, news:<id>, person:<id>), переиндексирует только эти
+сущности. Изменения других воркеров подхватываются полной пересборкой, когда раз
+в SEARCH_INDEX_POLL_SECONDS версия уходит от запомненной; коммит без ключей строк
+(массовый UPDATE без RETURNING) сразу помечает индекс устаревшим.
+
+Первая запись каталога в транзакции блокирует строки content_version до коммита, поэтому
+версии до и после своего коммита известны точно. Индекс сдвигает версию только по
+непрерывной цепочке своих коммитов; чужой коммит до или после своего рвёт цепочку
+или уводит текущую версию от запомненной — и индекс пересобирается.
+"""
+from dataclasses import dataclass
+from typing import Any, Iterable
+from uuid import UUID
+import asyncio
+import logging
+
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.invalidation import on_commit, tags_for
+from app.core.settings import settings
+from app.core.textindex import InvertedIndex
+from app.models.content_version import ContentVersion
+from app.models.news import News, NewsI18n
+from app.models.people import Person, PersonI18n
+from app.models.project import Project, ProjectI18n
+from app.models.taxonomy import LanguageEnum
+from app.repositories.content_version import ContentVersionRepository
+from app.services.cache import NEWS, PERSON, PROJECT
+
+
+logger = logging.getLogger(__name__)
+
+# Веса полей в пропорции весов ts_rank по умолчанию: A 1.0, B 0.4, C 0.2
+A, B, C = 5.0, 2.0, 1.0
+
+
+@dataclass(frozen=True)
+class Source:
+    model: type
+    i18n: type
+    owner: str
+    label: str
+    fields: dict[str, float]
+
+
+SOURCES = {
+    PROJECT: Source(
+        Project, ProjectI18n, "project_id", "name",
+        {"name": A, "subname": B, "client_name": B, "short_description": B, "full_description": C},
+    ),
+    NEWS: Source(News, NewsI18n, "news_id", "title", {"title": A, "short_description": B, "full_description": C}),
+    PERSON: Source(Person, PersonI18n, "person_id", "full_name", {"full_name": A, "position_title": B, "bio": C}),
+}
+
+
+@dataclass(slots=True)
+class CatalogHit:
+    kind: str
+    id: UUID
+    slug: str
+    label: str
+    score: float
+
+
+class _Shard:
+    """Индекс одной сущности в одной локали и то, что отдаётся в выдаче."""
+
+    def __init__(self, source: Source) -> None:
+        self.index = InvertedIndex(source.fields)
+        self.docs: dict[UUID, tuple[str, str]] = {}
+
+    def put(self, source: Source, row: Any) -> None:
+        key = getattr(row, source.owner)
+        self.index.add(key, {name: getattr(row, name) for name in source.fields})
+        if key in self.index:
+            self.docs[key] = (row.slug, getattr(row, source.label))
+
+    def drop(self, key: UUID) -> None:
+        self.index.remove(key)
+        self.docs.pop(key, None)
+
+
+def _rows_statement(source: Source, ids: Iterable[UUID] | None = None) -> sa.Select:
+    i18n = source.i18n
+    stmt = (
+        sa.select(
+            getattr(i18n, source.owner),
+            i18n.locale,
+            source.model.slug,
+            *(getattr(i18n, name) for name in source.fields),
+        )
+        .join(source.model)
+        .where(source.model.is_published.is_(True))
+    )
+    if ids is not None:
+        stmt = stmt.where(source.model.id.in_(list(ids)))
+    return stmt
+
+
+async def build_shards(session: AsyncSession) -> tuple[tuple[int, ...], dict[tuple[str, str], _Shard]]:
+    """Все сущности в одной REPEATABLE READ транзакции: версия и данные согласованы."""
+    await session.connection(execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True})
+    versions, _ = await ContentVersionRepository(session).probe(SOURCES)
+    shards = {(kind, locale.value): _Shard(source) for kind, source in SOURCES.items() for locale in LanguageEnum}
+    for kind, source in SOURCES.items():
+        for row in await session.execute(_rows_statement(source)):
+            shards[(kind, row.locale.value)].put(source, row)
+    return versions, shards
+
+
+class CatalogIndex:
+    def __init__(self) -> None:
+        self._shards: dict[tuple[str, str], _Shard] = {}
+        self.version: tuple[int, ...] | None = None
+        self._pending: dict[str, set[UUID]] = {kind: set() for kind in SOURCES}
+        self._commits: list[tuple[tuple[int, ...], tuple[int, ...]]] = []
+        self._stale = False
+        self._wake = asyncio.Event()
+
+    @property
+    def ready(self) -> bool:
+        return self.version is not None
+
+    def __len__(self) -> int:
+        return sum(len(shard.index) for shard in self._shards.values())
+
+    def search(
+        self,
+        query: str,
+        locale: LanguageEnum | str,
+        kinds: Iterable[str] | None = None,
+        limit: int = 10,
+    ) -> list[CatalogHit]:
+        locale = LanguageEnum(locale).value
+        hits = []
+        for kind in kinds or SOURCES:
+            shard = self._shards.get((kind, locale))
+            if shard is None:
+                continue
+            for key, score in shard.index.search(query, limit):
+                slug, label = shard.docs[key]
+                hits.append(CatalogHit(kind, key, slug, label, score))
+        hits.sort(key=lambda hit: hit.score, reverse=True)
+        return hits[:limit]
+
+    def memory_bytes(self) -> int:
+        return sum(shard.index.memory_bytes() for shard in self._shards.values())
+
+    def request_update(self, tags: set[str]) -> None:
+        keyed = False
+        for tag in tags:
+            kind, _, value = tag.partition(":")
+            keyed = keyed or bool(value)
+            if kind in self._pending and value:
+                self._pending[kind].add(UUID(value))
+        # Без ключей строк неизвестно, что поменялось: только пересборка
+        if not keyed:
+            self._stale = True
+        self._wake.set()
+
+    async def rebuild(self, sessions: async_sessionmaker) -> None:
+        async with sessions() as session:
+            versions, shards = await build_shards(session)
+        # Одно присваивание: поиск видит либо старый, либо новый набор целиком
+        self._shards = shards
+        self.version = versions
+        logger.info("catalog index %s rebuilt: %s documents", versions, len(self))
+
+    def record_commit(self, before: tuple[int, ...], after: tuple[int, ...]) -> None:
+        """Версии content_version до и после своего коммита (SOURCES по порядку)."""
+        self._commits.append((before, after))
+
+    async def apply_pending(self, sessions: async_sessionmaker) -> None:
+        """Переиндексирует сущности из своих коммитов и сдвигает версию по их цепочке."""
+        pending, self._pending = self._pending, {kind: set() for kind in SOURCES}
+        commits, self._commits = self._commits, []
+        if any(pending.values()):
+            async with sessions() as session:
+                await session.connection(execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True})
+                for kind, ids in pending.items():
+                    if not ids:
+                        continue
+                    source = SOURCES[kind]
+                    rows = (await session.execute(_rows_statement(source, ids))).all()
+                    # Снятая с публикации или удалённая сущность просто не вернётся из запроса
+                    for locale in LanguageEnum:
+                        shard = self._shards[(kind, locale.value)]
+                        for key in ids:
+                            shard.drop(key)
+                    for row in rows:
+                        self._shards[(kind, row.locale.value)].put(source, row)
+        self._advance(commits)
+
+    def _advance(self, commits: list[tuple[tuple[int, ...], tuple[int, ...]]]) -> None:
+        version = self.version
+        for before, after in sorted(commits):
+            # Коммит уже вошёл в снимок пересборки
+            if all(a <= v for a, v in zip(after, version)):
+                continue
+            # Между запомненной версией и своим коммитом был чужой: только пересборка
+            if before != version:
+                self._stale = True
+                self._wake.set()
+                return
+            version = after
+        self.version = version
+
+    async def current_version(self, sessions: async_sessionmaker) -> tuple[int, ...]:
+        async with sessions() as session:
+            versions, _ = await ContentVersionRepository(session).probe(SOURCES)
+        return versions
+
+    async def run(self, sessions: async_sessionmaker, interval: float) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            stale, self._stale = self._stale, False
+            try:
+                # Свои коммиты применяются до сверки: их версия не считается чужой
+                if self.ready and not stale:
+                    await self.apply_pending(sessions)
+                    stale, self._stale = self._stale, False
+                if stale or not self.ready or await self.current_version(sessions) != self.version:
+                    await self.rebuild(sessions)
+            except Exception:
+                self._stale = self._stale or stale
+                logger.exception("catalog index rebuild failed")
+            # До следующей сверки версии — только свои коммиты, по ключам строк
+            deadline = loop.time() + interval
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                self._wake.clear()
+                if self._stale:
+                    break
+                try:
+                    if self.ready:
+                        await self.apply_pending(sessions)
+                except Exception:
+                    logger.exception("catalog index update failed")
+
+catalog_index = CatalogIndex()
+
+_BEFORE_KEY = "catalog_versions_before"
+_COMMIT_KEY = "catalog_versions_commit"
+
+
+def _read_versions(session: Session, lock: bool = False) -> tuple[int, ...]:
+    stmt = (
+        sa.select(ContentVersion.entity, ContentVersion.version)
+        .where(ContentVersion.entity.in_(list(SOURCES)))
+        .order_by(ContentVersion.entity)
+    )
+    if lock:
+        stmt = stmt.with_for_update()
+    found = dict(session.connection().execute(stmt).all())
+    return tuple(found.get(kind, 0) for kind in SOURCES)
+
+
+def _writes_catalog(model: type) -> bool:
+    return not tags_for(model).isdisjoint(SOURCES)
+
+
+def _lock_versions(session: Session) -> None:
+    """До первой записи каталога: чужие коммиты каталога ждут нашего, версия «до» точная."""
+    if _BEFORE_KEY not in session.info:
+        session.info[_BEFORE_KEY] = _read_versions(session, lock=True)
+
+
+@event.listens_for(Session, "before_flush")
+def _lock_before_flush(session: Session, flush_context, instances) -> None:
+    if settings.SEARCH_INDEX_ENABLED and any(
+        _writes_catalog(type(obj)) for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        _lock_versions(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _lock_before_execute(state: ORMExecuteState) -> None:
+    if (
+        settings.SEARCH_INDEX_ENABLED
+        and (state.is_insert or state.is_update or state.is_delete)
+        and state.bind_mapper is not None
+        and _writes_catalog(state.bind_mapper.class_)
+    ):
+        _lock_versions(state.session)
+
+
+@event.listens_for(Session, "before_commit")
+def _read_after(session: Session) -> None:
+    if not settings.SEARCH_INDEX_ENABLED:
+        return
+    # Остаток изменений сбрасывается здесь, чтобы версия «после» его учла
+    session.flush()
+    before = session.info.pop(_BEFORE_KEY, None)
+    if before is not None:
+        session.info[_COMMIT_KEY] = (before, _read_versions(session))
+
+
+@event.listens_for(Session, "after_commit")
+def _record_commit(session: Session) -> None:
+    versions = session.info.pop(_COMMIT_KEY, None)
+    if versions is not None:
+        catalog_index.record_commit(*versions)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_versions(session: Session) -> None:
+    session.info.pop(_BEFORE_KEY, None)
+    session.info.pop(_COMMIT_KEY, None)
+
+
+def _request_update(tags: set[str]) -> None:
+    catalog_index.request_update(tags)
+
+
+for _tag in SOURCES:
+    on_commit(_tag, _request_update)
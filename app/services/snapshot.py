@@ -0,0 +1,163 @@
+"""
+Предрендеренный публичный снимок: JSON всего публичного контента на каждую локаль,
+заранее сжатый (gzip, br — если установлен brotli), хранится в памяти воркера.
+
+Каждый воркер сверяет версию content_version (один запрос по PK) раз в
+PUBLIC_SNAPSHOT_POLL_SECONDS и сразу после своего коммита публичного контента;
+при изменении пересобирает все локали и подменяет словарь блобов одной операцией.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any
+import asyncio
+import gzip
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+from app.core.compression import brotli, negotiate
+from app.core.conditional import make_etag
+from app.core.invalidation import on_commit
+from app.core.serialization import dumps, serializer_for
+from app.models.career import Career
+from app.models.location import Location
+from app.models.news import News
+from app.models.people import Person
+from app.models.project import Project, ProjectStyle, ProjectType
+from app.models.taxonomy import LanguageEnum
+from app.repositories.career import CareerRepository
+from app.repositories.content_version import ContentVersionRepository
+from app.repositories.location import LocationRepository
+from app.repositories.news import NewsRepository
+from app.repositories.people import PersonRepository
+from app.repositories.project import ProjectRepository
+from app.repositories.taxonomy import ProjectStyleRepository, ProjectTypeRepository
+from app.schemas.snapshot import PublicSnapshot
+from app.services.cache import PUBLIC_TAGS
+
+
+logger = logging.getLogger(__name__)
+
+# Раздел снимка -> (репозиторий, модель, фильтры, порядок)
+SECTIONS = {
+    "projects": (ProjectRepository, Project, {"is_published": True}, ("-order_index", "-published_at", "id")),
+    "people": (PersonRepository, Person, {"is_published": True}, ("-order_index", "id")),
+    "news": (NewsRepository, News, {"is_published": True}, ("-published_at", "id")),
+    "careers": (CareerRepository, Career, {"is_published": True}, ("-order_index", "id")),
+    "project_types": (ProjectTypeRepository, ProjectType, {"visible": True}, ("order_index", "id")),
+    "project_styles": (ProjectStyleRepository, ProjectStyle, {"visible": True}, ("order_index", "id")),
+    "locations": (LocationRepository, Location, None, ("order_index", "id")),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class SnapshotBlob:
+    locale: str
+    version: str
+    etag: str
+    generated_at: datetime
+    body: bytes
+    gzip: bytes
+    br: bytes | None
+
+    def encoded(self, accept_encoding: str) -> tuple[bytes, str | None]:
+        encoding = negotiate(accept_encoding, ("br", "gzip") if self.br is not None else ("gzip",))
+        if encoding == "br":
+            return self.br, "br"
+        if encoding == "gzip":
+            return self.gzip, "gzip"
+        return self.body, None
+
+
+def _version_label(versions: tuple[int, ...]) -> str:
+    return ".".join(map(str, versions))
+
+
+def _blob(locale: str, version: str, generated_at: datetime, body: bytes) -> SnapshotBlob:
+    return SnapshotBlob(
+        locale=locale,
+        version=version,
+        etag=make_etag("snapshot", locale, version),
+        generated_at=generated_at,
+        body=body,
+        gzip=gzip.compress(body, compresslevel=9, mtime=0),
+        br=brotli.compress(body, quality=11) if brotli is not None else None,
+    )
+
+
+async def build_snapshot(session: AsyncSession) -> tuple[str, dict[str, SnapshotBlob]]:
+    """Все локали в одной REPEATABLE READ транзакции: версия и данные согласованы."""
+    await session.connection(execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True})
+    versions, changed_at = await ContentVersionRepository(session).probe(PUBLIC_TAGS)
+    version = _version_label(versions)
+    generated_at = changed_at or datetime.now(timezone.utc)
+    bodies = {}
+    for locale in LanguageEnum:
+        payload: dict[str, Any] = {"locale": locale, "version": version, "generated_at": generated_at}
+        for section, (repo_cls, model, filters, order_by) in SECTIONS.items():
+            payload[section] = await repo_cls(session).list(
+                filters=filters,
+                order_by=order_by,
+                options=[selectinload(model.translations)],
+                locale=locale,
+            )
+        bodies[locale.value] = dumps(serializer_for(PublicSnapshot)(SimpleNamespace(**payload)))
+        # Коллекции translations загружены только для этой локали — следующей нужны свежие объекты
+        session.expunge_all()
+    # gzip -9 и brotli 11 на весь снимок — сотни миллисекунд CPU: сжимаем вне event loop
+    blobs = await asyncio.gather(
+        *(asyncio.to_thread(_blob, locale, version, generated_at, body) for locale, body in bodies.items())
+    )
+    return version, {blob.locale: blob for blob in blobs}
+
+
+class SnapshotStore:
+    def __init__(self) -> None:
+        self._blobs: dict[str, SnapshotBlob] = {}
+        self.version: str | None = None
+        self._wake = asyncio.Event()
+
+    def get(self, locale: LanguageEnum | str) -> SnapshotBlob | None:
+        return self._blobs.get(LanguageEnum(locale).value)
+
+    def swap(self, version: str, blobs: dict[str, SnapshotBlob]) -> None:
+        # Одно присваивание: читатели видят либо старый, либо новый набор целиком
+        self._blobs = blobs
+        self.version = version
+
+    def request_refresh(self, tags: set[str] | None = None) -> None:
+        self._wake.set()
+
+    async def current_version(self, sessions: async_sessionmaker) -> str:
+        async with sessions() as session:
+            versions, _ = await ContentVersionRepository(session).probe(PUBLIC_TAGS)
+        return _version_label(versions)
+
+    async def refresh(self, sessions: async_sessionmaker, force: bool = False) -> bool:
+        if not force and self.version is not None and await self.current_version(sessions) == self.version:
+            return False
+        async with sessions() as session:
+            version, blobs = await build_snapshot(session)
+        self.swap(version, blobs)
+        logger.info("public snapshot %s rebuilt: %s", version, {k: len(b.body) for k, b in blobs.items()})
+        return True
+
+    async def run(self, sessions: async_sessionmaker, interval: float) -> None:
+        while True:
+            self._wake.clear()
+            try:
+                await self.refresh(sessions)
+            except Exception:
+                logger.exception("public snapshot refresh failed")
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+snapshot_store = SnapshotStore()
+
+for _tag in PUBLIC_TAGS:
+    on_commit(_tag, snapshot_store.request_refresh)
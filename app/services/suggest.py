@@ -0,0 +1,63 @@
+"""
+Подсказки поисковой строки (as-you-type): проекты, люди, города одной локали.
+
+Короткие префиксы — самые частые и самые дорогие запросы (у триграмм мало избирательности),
+поэтому ответы на них держатся в LRU процесса. Коммит проекта или человека сбрасывает LRU
+своего воркера; записи других воркеров живут не дольше SUGGEST_CACHE_TTL_SECONDS.
+"""
+from fastapi import Response
+
+from app.core.cache import CachePolicy, MemoryCacheBackend
+from app.core.cdn import cdn_headers
+from app.core.db import open_read_session
+from app.core.invalidation import on_commit
+from app.core.serialization import dumps
+from app.core.settings import settings
+from app.models.taxonomy import LanguageEnum
+from app.repositories.suggest import SuggestRepository
+from app.services.cache import PERSON, PROJECT
+
+
+# Location и LocationI18n помечаются тегом project
+SUGGEST_TAGS = (PROJECT, PERSON)
+SUGGEST_POLICY = CachePolicy(max_age=30, shared_max_age=300)
+
+suggest_lru = MemoryCacheBackend(settings.SUGGEST_CACHE_ENTRIES) if settings.SUGGEST_CACHE_ENTRIES else None
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.split()).lower()
+
+
+async def _produce(query: str, locale: LanguageEnum, limit: int) -> bytes:
+    session = await open_read_session()
+    try:
+        items = await SuggestRepository(session).suggest(query, locale, limit)
+    finally:
+        await session.close()
+    return dumps([{"kind": s.kind, "id": s.id, "label": s.label, "slug": s.slug} for s in items])
+
+
+async def suggest(query: str, locale: LanguageEnum, limit: int) -> Response:
+    query = normalize_query(query)
+    limit = min(limit, settings.SUGGEST_LIMIT_MAX)
+    if not query:
+        body = b"[]"
+    elif suggest_lru is None or len(query) > settings.SUGGEST_CACHE_MAX_PREFIX:
+        body = await _produce(query, locale, limit)
+    else:
+        key = f"{locale.value}:{limit}:{query}"
+        body = await suggest_lru.get(key)
+        if body is None:
+            body = await _produce(query, locale, limit)
+            await suggest_lru.set(key, body, SUGGEST_TAGS, settings.SUGGEST_CACHE_TTL_SECONDS)
+    return Response(content=body, media_type="application/json", headers=cdn_headers(SUGGEST_POLICY, SUGGEST_TAGS))
+
+
+async def _invalidate(tags: set[str]) -> None:
+    if suggest_lru is not None:
+        await suggest_lru.invalidate(tags & set(SUGGEST_TAGS))
+
+
+for _tag in SUGGEST_TAGS:
+    on_commit(_tag, _invalidate)
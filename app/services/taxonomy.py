@@ -0,0 +1,122 @@
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+from uuid import UUID
+import asyncio
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import open_read_session
+from app.core.invalidation import on_commit, track
+from app.core.settings import settings
+from app.models.project import ProjectStyle, ProjectStyleI18n, ProjectType, ProjectTypeI18n
+from app.models.taxonomy import LanguageEnum
+from app.repositories.base import LocaleArg
+from app.repositories.taxonomy import ProjectStyleRepository, ProjectTypeRepository
+
+
+TAXONOMY_TAG = "taxonomy"
+
+for _model in (ProjectType, ProjectTypeI18n, ProjectStyle, ProjectStyleI18n):
+    track(_model, TAXONOMY_TAG)
+
+
+@dataclass(slots=True, frozen=True)
+class TaxonomyEntry:
+    id: UUID
+    key: str
+    order_index: int
+    titles: Mapping[str, str]
+
+    def title(self, locale: str, fallback: str | None = None) -> str | None:
+        return self.titles.get(locale) or (self.titles.get(fallback) if fallback else None)
+
+
+@dataclass(slots=True)
+class TaxonomySnapshot:
+    types: tuple[TaxonomyEntry, ...]
+    styles: tuple[TaxonomyEntry, ...]
+    _by_locale: dict[tuple[str, str | None], dict[str, Any]] = field(default_factory=dict)
+
+    def for_locale(self, locale: LocaleArg, fallback_locale: LocaleArg = None) -> dict[str, Any]:
+        """Данные для фильтра в одном языке; результат мемоизируется внутри снимка."""
+        loc = LanguageEnum(locale).value
+        fb = LanguageEnum(fallback_locale).value if fallback_locale else None
+        cached = self._by_locale.get((loc, fb))
+        if cached is None:
+            cached = {
+                "types": [{"id": e.id, "key": e.key, "title": e.title(loc, fb)} for e in self.types],
+                "styles": [{"id": e.id, "key": e.key, "title": e.title(loc, fb)} for e in self.styles],
+            }
+            self._by_locale[(loc, fb)] = cached
+        return cached
+
+
+def _entries(items) -> tuple[TaxonomyEntry, ...]:
+    return tuple(
+        TaxonomyEntry(
+            id=item.id,
+            key=item.key,
+            order_index=item.order_index,
+            titles={LanguageEnum(t.locale).value: t.title for t in item.translations},
+        )
+        for item in items
+    )
+
+
+class TaxonomyCache:
+    """
+    Снимок видимых типов и стилей проектов на воркер. Живёт ttl секунд и сбрасывается
+    после коммита, изменившего ProjectType/ProjectStyle или их переводы (в этом воркере;
+    остальные воркеры подхватят изменения по TTL).
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._snapshot: TaxonomySnapshot | None = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self, tags: set[str] | None = None) -> None:
+        self._snapshot = None
+        self._generation += 1
+
+    def peek(self) -> TaxonomySnapshot | None:
+        if self._snapshot is not None and time.monotonic() < self._expires_at:
+            return self._snapshot
+        return None
+
+    async def get(self, session: AsyncSession) -> TaxonomySnapshot:
+        snapshot = self.peek()
+        if snapshot is not None:
+            return snapshot
+        async with self._lock:
+            snapshot = self.peek()
+            if snapshot is not None:
+                return snapshot
+            generation = self._generation
+            types = await ProjectTypeRepository(session).list_visible_with_relations()
+            styles = await ProjectStyleRepository(session).list_visible_with_relations()
+            snapshot = TaxonomySnapshot(types=_entries(types), styles=_entries(styles))
+            # Если за время загрузки был коммит, снимок может быть устаревшим — не кэшируем
+            if generation == self._generation:
+                self._snapshot = snapshot
+                self._expires_at = time.monotonic() + self.ttl
+            return snapshot
+
+
+taxonomy_cache = TaxonomyCache(settings.TAXONOMY_CACHE_TTL_SECONDS)
+on_commit(TAXONOMY_TAG, taxonomy_cache.invalidate)
+
+
+async def get_filter_taxonomy(locale: LocaleArg, fallback_locale: LocaleArg = None) -> dict[str, Any]:
+    """Типы и стили для фильтра проектов; сессия чтения открывается только при промахе кэша."""
+    snapshot = taxonomy_cache.peek()
+    if snapshot is None:
+        session = await open_read_session()
+        try:
+            snapshot = await taxonomy_cache.get(session)
+        finally:
+            await session.close()
+    return snapshot.for_locale(locale, fallback_locale)
@@ -0,0 +1,141 @@
+"""Поиск по каталогу: индекс в памяти (app.services.search_index) против полнотекстового поиска Postgres.
+
+    DATABASE_URL=... python -m benchmarks.search_index --locale ru --queries 200
+
+Нужна база с применёнными миграциями и данными. Запросы — слова из названий
+опубликованных проектов локали; один и тот же набор идёт по всем путям:
+  memory            CatalogIndex.search(kind=project)
+  memory, prefix    то же по первым трём буквам слова (строка поиска на каждое нажатие)
+  postgres tsquery  websearch_to_tsquery + ts_rank по GIN-индексу, только id
+  repository        ProjectRepository.search: тот же запрос и загрузка карточек
+Память: объём структур индекса в процессе против GIN-индексов и колонок search_vector.
+"""
+import argparse
+import asyncio
+import gc
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Awaitable, Callable
+
+import sqlalchemy as sa
+
+import app.models.application, app.models.career, app.models.contact, app.models.location  # noqa: F401
+import app.models.media, app.models.news, app.models.people, app.models.project  # noqa: F401
+from app.core.db import async_session, engine
+from app.core.textindex import tokenize
+from app.models.project import Project, ProjectI18n
+from app.models.taxonomy import LanguageEnum
+from app.repositories.project import ProjectRepository
+from app.services.search_index import CatalogIndex
+
+
+PG_QUERY = sa.text(
+    """
+SELECT i.project_id, ts_rank(i.search_vector, q) AS rank
+FROM project_i18n i
+JOIN project p ON p.id = i.project_id,
+     websearch_to_tsquery(search_config(CAST(:locale AS language_enum)), :q) q
+WHERE i.locale = CAST(:locale AS language_enum) AND p.is_published AND i.search_vector @@ q
+ORDER BY rank DESC, p.id DESC
+LIMIT :limit
+"""
+)
+
+PG_SIZE = sa.text(
+    """
+SELECT pg_relation_size('ix_project_i18n_search') + pg_relation_size('ix_news_i18n_search')
+     + (SELECT coalesce(sum(pg_column_size(search_vector)), 0) FROM project_i18n)
+     + (SELECT coalesce(sum(pg_column_size(search_vector)), 0) FROM news_i18n)
+"""
+)
+
+
+async def measure(run: Callable[[str], Awaitable[object]], queries: list[str], warmup: int) -> list[float]:
+    for query in queries[:warmup]:
+        await run(query)
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        await run(query)
+        samples.append((time.perf_counter() - started) * 1000)
+    return sorted(samples)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    locale = LanguageEnum(args.locale)
+    # Первая сборка прогревает пул и кэш скомпилированных запросов: они не должны попасть в замер памяти
+    await CatalogIndex().rebuild(async_session)
+    index = CatalogIndex()
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    await index.rebuild(async_session)
+    build_ms = (time.perf_counter() - started) * 1000
+    gc.collect()
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    async with async_session() as session:
+        names = (
+            await session.execute(
+                sa.select(ProjectI18n.name).join(Project).where(Project.is_published.is_(True), ProjectI18n.locale == locale)
+            )
+        ).scalars().all()
+        pg_bytes = (await session.execute(PG_SIZE)).scalar_one()
+    words = [word for name in names for word in tokenize(name) if len(word) >= 3]
+    if not words:
+        raise SystemExit(f"no published projects with names in locale {locale.value}")
+    rng = random.Random(args.seed)
+    queries = [rng.choice(words) for _ in range(args.queries)]
+
+    async def memory(query: str) -> object:
+        return index.search(query, locale, kinds=["project"], limit=args.limit)
+
+    async def memory_prefix(query: str) -> object:
+        return index.search(query[:3], locale, kinds=["project"], limit=args.limit)
+
+    async with async_session() as session:
+        repo = ProjectRepository(session)
+
+        async def postgres(query: str) -> object:
+            return (await session.execute(PG_QUERY, {"q": query, "locale": locale.value, "limit": args.limit})).all()
+
+        async def repository(query: str) -> object:
+            page = await repo.search(query, locale, limit=args.limit)
+            session.expunge_all()
+            return page
+
+        paths = {
+            "memory": memory,
+            "memory, prefix": memory_prefix,
+            "postgres tsquery": postgres,
+            "repository": repository,
+        }
+        results = {name: await measure(run, queries, args.warmup) for name, run in paths.items()}
+
+    print(f"{len(index)} documents in memory, built in {build_ms:.0f} ms; {len(queries)} queries, locale {locale.value}")
+    print(f"memory: index structures {index.memory_bytes() / 1024:.0f} KiB, retained allocations {traced / 1024:.0f} KiB")
+    print(f"postgres: GIN indexes + search_vector columns {pg_bytes / 1024:.0f} KiB")
+    print(f"{'path':18} {'mean':>8} {'p50':>8} {'p95':>8}  ms")
+    for name, samples in results.items():
+        print(
+            f"{name:18} {statistics.fmean(samples):8.3f} {samples[len(samples) // 2]:8.3f}"
+            f" {samples[int(len(samples) * 0.95)]:8.3f}"
+        )
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--locale", default=LanguageEnum.RU.value, choices=[l.value for l in LanguageEnum])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
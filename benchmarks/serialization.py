@@ -0,0 +1,129 @@
+"""Сериализация списка ProjectRead: валидация from_attributes против прямого RowSerializer.
+
+    python -m benchmarks.serialization --count 100 --locales 3
+
+База не нужна: проекты с переводами собираются в памяти как transient ORM-объекты.
+Перед замером проверяется, что все пути дают одинаковый JSON.
+"""
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+import app.models.application, app.models.career, app.models.contact, app.models.location  # noqa: F401
+import app.models.media, app.models.news, app.models.people  # noqa: F401
+from app.core import serialization
+from app.core.serialization import serializer_for
+from app.models.project import Project, ProjectI18n
+from app.models.taxonomy import LanguageEnum
+from app.schemas.project import ProjectRead
+
+
+def build_projects(count: int, locales: int) -> list[Project]:
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    projects = []
+    for i in range(count):
+        pid = uuid4()
+        projects.append(
+            Project(
+                id=pid,
+                slug=f"project-{i}",
+                cover_media_id=uuid4(),
+                location_id=uuid4(),
+                type_id=uuid4(),
+                year=2000 + i % 20,
+                completion=2010 + i % 10,
+                area_m2=Decimal("120.50") + i,
+                is_published=True,
+                published_at=base + timedelta(days=i),
+                order_index=i % 7,
+                created_at=base,
+                updated_at=base + timedelta(hours=i, microseconds=i * 1000),
+                translations=[
+                    ProjectI18n(
+                        project_id=pid,
+                        locale=locale,
+                        name=f"Вилла {i} {locale.value}",
+                        subname="Частный дом",
+                        client_name=None,
+                        short_description="Дом с садом и террасой. " * 4,
+                        full_description="Подробное описание проекта. " * 40,
+                    )
+                    for locale in list(LanguageEnum)[:locales]
+                ],
+            )
+        )
+    return projects
+
+
+def paths(projects: list[Project]) -> dict[str, Callable[[], bytes]]:
+    adapter = TypeAdapter(list[ProjectRead])
+    serializer = serializer_for(ProjectRead)
+
+    def json_fallback() -> bytes:
+        orjson, serialization.orjson = serialization.orjson, None
+        try:
+            return serializer.dump_json(projects)
+        finally:
+            serialization.orjson = orjson
+
+    return {
+        "model_validate + dump_json": lambda: b"[%s]" % b",".join(
+            ProjectRead.model_validate(p).model_dump_json().encode() for p in projects
+        ),
+        "TypeAdapter per call": lambda: (lambda a: a.dump_json(a.validate_python(projects, from_attributes=True)))(
+            TypeAdapter(list[ProjectRead])
+        ),
+        "prebuilt TypeAdapter": lambda: adapter.dump_json(adapter.validate_python(projects, from_attributes=True)),
+        "RowSerializer + json": json_fallback,
+        "RowSerializer + orjson": lambda: serializer.dump_json(projects),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--locales", type=int, default=3, choices=range(1, len(LanguageEnum) + 1))
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    args = parser.parse_args()
+
+    projects = build_projects(args.count, args.locales)
+    candidates = paths(projects)
+    if serialization.orjson is None:
+        del candidates["RowSerializer + orjson"]
+
+    reference = json.loads(next(iter(candidates.values()))())
+    for name, run in candidates.items():
+        if json.loads(run()) != reference:
+            raise SystemExit(f"{name}: output differs from model_dump_json()")
+
+    size = len(next(iter(candidates.values()))())
+    print(f"{args.count} projects x {args.locales} translations, {size / 1024:.1f} KiB")
+    print(f"{'path':28} {'mean':>8} {'p50':>8} {'p95':>8}  ms   speedup")
+    baseline = None
+    for name, run in candidates.items():
+        for _ in range(args.warmup):
+            run()
+        samples = []
+        for _ in range(args.iterations):
+            started = time.perf_counter()
+            run()
+            samples.append((time.perf_counter() - started) * 1000)
+        samples.sort()
+        mean = statistics.fmean(samples)
+        baseline = baseline or mean
+        print(
+            f"{name:28} {mean:8.3f} {samples[len(samples) // 2]:8.3f}"
+            f" {samples[int(len(samples) * 0.95)]:8.3f}      x{baseline / mean:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
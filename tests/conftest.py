@@ -0,0 +1,109 @@
+"""
+Тесты: python -m pytest -q
+
+Чистые тесты не требуют окружения. Тесты с фикстурами connection/session идут в базе
+TEST_DATABASE_URL (asyncpg DSN, миграции применены: alembic upgrade head) и без неё
+пропускаются. Каждый такой тест начинает с пустых таблиц внутри транзакции, которая
+откатывается в конце; commit() сессий — это RELEASE SAVEPOINT.
+"""
+import asyncio
+import os
+import sys
+
+os.environ.setdefault(
+    "DATABASE_URL", os.environ.get("TEST_DATABASE_URL") or "postgresql+asyncpg://localhost/arhea_test"
+)
+
+import httpx
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core import db
+from app.core.db import Base, async_session, read_session
+# Все модули приложения загружаются до подмены open_read_session в фикстурах
+from app.main import app
+from app.services.cache import response_cache
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def connection():
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_async_engine(url, poolclass=NullPool)
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+        await conn.execute(sa.text(f"TRUNCATE {tables} CASCADE"))
+        try:
+            yield conn
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(connection):
+    async with async_session(bind=connection, join_transaction_mode="create_savepoint") as s:
+        yield s
+
+
+class JoinedSession(AsyncSession):
+    """Сессия внутри транзакции теста: уровень изоляции там уже не сменить."""
+
+    async def connection(self, **kw):
+        kw.pop("execution_options", None)
+        return await super().connection(**kw)
+
+
+@pytest.fixture
+def joined_sessions(connection):
+    """Фабрика сессий для кода, который открывает свои транзакции (снимки, индекс поиска)."""
+    return lambda: JoinedSession(bind=connection, join_transaction_mode="create_savepoint")
+
+
+@pytest.fixture
+def read_sessions(connection, monkeypatch):
+    """open_read_session() во всех модулях приложения — read-only сессии на соединении теста."""
+
+    async def open_session():
+        return read_session(bind=connection, join_transaction_mode="create_savepoint")
+
+    original = db.open_read_session
+    for name, module in list(sys.modules.items()):
+        if name.startswith("app.") and getattr(module, "open_read_session", None) is original:
+            monkeypatch.setattr(module, "open_read_session", open_session)
+    return open_session
+
+
+@pytest.fixture
+async def client(read_sessions):
+    """HTTP-клиент приложения; публичные эндпоинты читают через read_sessions, кэш ответов пустой."""
+    if response_cache is not None:
+        await response_cache.backend.clear()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+    if response_cache is not None:
+        # Фоновые пересчёты stale-while-revalidate должны закончиться до отката соединения
+        await asyncio.gather(*response_cache._refreshing.values(), return_exceptions=True)
+        await response_cache.backend.clear()
+
+
+@pytest.fixture
+def count_queries(connection):
+    """Список SQL, выполненных на соединении теста с момента вызова фикстуры."""
+    statements: list[str] = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(connection.sync_connection, "before_cursor_execute", before)
+    yield statements
+    sa.event.remove(connection.sync_connection, "before_cursor_execute", before)
@@ -0,0 +1,71 @@
+"""Строки для тестов с базой: добавляются в сессию и сбрасываются flush()."""
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.news import News, NewsI18n
+from app.models.people import Person, PersonI18n
+from app.models.project import Project, ProjectI18n
+from app.models.taxonomy import LanguageEnum
+
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def at(days: int) -> datetime:
+    return BASE_TIME + timedelta(days=days)
+
+
+async def add_project(
+    session: AsyncSession,
+    slug: str,
+    names: dict[LanguageEnum, str] | None = None,
+    published: bool = True,
+    **fields: Any,
+) -> Project:
+    if published:
+        fields.setdefault("published_at", BASE_TIME)
+    project = Project(slug=slug, is_published=published, **fields)
+    project.translations = [
+        ProjectI18n(locale=locale, name=name, subname="")
+        for locale, name in (names or {LanguageEnum.RU: slug}).items()
+    ]
+    session.add(project)
+    await session.flush()
+    return project
+
+
+async def add_news(
+    session: AsyncSession,
+    slug: str,
+    titles: dict[LanguageEnum, str] | None = None,
+    published: bool = True,
+    **fields: Any,
+) -> News:
+    if published:
+        fields.setdefault("published_at", BASE_TIME)
+    news = News(slug=slug, preview="", is_published=published, **fields)
+    news.translations = [
+        NewsI18n(locale=locale, title=title, short_description="", full_description="")
+        for locale, title in (titles or {LanguageEnum.RU: slug}).items()
+    ]
+    session.add(news)
+    await session.flush()
+    return news
+
+
+async def add_person(
+    session: AsyncSession,
+    slug: str,
+    names: dict[LanguageEnum, str] | None = None,
+    published: bool = True,
+    **fields: Any,
+) -> Person:
+    person = Person(slug=slug, is_published=published, **fields)
+    person.translations = [
+        PersonI18n(locale=locale, full_name=name) for locale, name in (names or {LanguageEnum.RU: slug}).items()
+    ]
+    session.add(person)
+    await session.flush()
+    return person
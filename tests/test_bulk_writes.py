@@ -0,0 +1,53 @@
+import random
+
+import pytest
+import sqlalchemy as sa
+
+from app.core.errors import DomainError
+from app.models.project import ProjectType
+from app.repositories.taxonomy import ProjectTypeRepository
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_create_many_returns_rows_in_input_order(session):
+    keys = [f"type_{i}" for i in range(1500)]
+    random.Random(7).shuffle(keys)
+    rows = [{"key": key, "order_index": i} for i, key in enumerate(keys)]
+
+    created = await ProjectTypeRepository(session).create_many(rows)
+
+    assert [t.key for t in created] == keys
+    assert [t.order_index for t in created] == list(range(len(keys)))
+    assert await session.scalar(sa.select(sa.func.count()).select_from(ProjectType)) == len(keys)
+
+
+async def test_upsert_many_updates_conflicting_rows(session):
+    repo = ProjectTypeRepository(session)
+    await repo.create_many([{"key": "house", "order_index": 1}, {"key": "office", "order_index": 2}])
+
+    upserted = await repo.upsert_many(
+        [{"key": "house", "order_index": 10}, {"key": "villa", "order_index": 3}],
+        conflict_cols=["key"],
+        update_cols=["order_index"],
+    )
+
+    assert sorted((t.key, t.order_index) for t in upserted) == [("house", 10), ("villa", 3)]
+    stored = dict((await session.execute(sa.select(ProjectType.key, ProjectType.order_index))).all())
+    assert stored == {"house": 10, "office": 2, "villa": 3}
+
+
+async def test_upsert_many_without_update_returns_only_inserted(session):
+    repo = ProjectTypeRepository(session)
+    await repo.create_many([{"key": "house"}])
+
+    inserted = await repo.upsert_many([{"key": "house"}, {"key": "villa"}], conflict_cols=["key"])
+
+    assert [t.key for t in inserted] == ["villa"]
+
+
+async def test_create_many_maps_integrity_errors(session):
+    with pytest.raises(DomainError) as error:
+        await ProjectTypeRepository(session).create_many([{"key": "house"}, {"key": "house"}])
+    assert error.value.code == "unique_violation"
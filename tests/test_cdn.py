@@ -0,0 +1,141 @@
+from collections import defaultdict
+
+import pytest
+
+from app.core import invalidation
+from app.core.cache import CachePolicy
+from app.core.cdn import cache_control, cdn_headers, fit_keys
+from app.core.invalidation import on_commit
+from app.core.settings import settings
+from app.models.news import NewsI18n
+from app.models.taxonomy import LanguageEnum
+from app.repositories.base import BaseRepository
+from app.repositories.news import NewsRepository
+from app.services import cdn
+from app.services.cache import DETAIL_POLICY, LIST_POLICIES, NEWS, PROJECT
+from tests.factories import add_news, add_project
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def committed(monkeypatch):
+    """Объединение тегов всех коммитов теста (реальные обработчики отключены)."""
+    monkeypatch.setattr(invalidation, "_handlers", defaultdict(list))
+    tags: set[str] = set()
+
+    async def handler(committed_tags: set[str]) -> None:
+        tags.update(committed_tags)
+
+    on_commit(NEWS, handler)
+    return tags
+
+
+class RecordingPurger:
+    def __init__(self) -> None:
+        self.purged: list[set[str]] = []
+
+    async def purge(self, keys) -> None:
+        self.purged.append(set(keys))
+
+
+def test_cache_control_shared_max_age():
+    assert cache_control(None) == "no-store"
+    assert cache_control(CachePolicy(max_age=60, stale_while_revalidate=600)) == (
+        "public, max-age=60, stale-while-revalidate=600"
+    )
+    assert cache_control(CachePolicy(max_age=60, shared_max_age=86400)) == "public, max-age=60, s-maxage=86400"
+
+
+def test_fit_keys_keeps_collections():
+    rows = [f"project:{i:04d}" for i in range(100)]
+    fitted = fit_keys(["project", *rows], limit=60)
+    assert fitted[0] == "project"
+    assert len(" ".join(fitted)) <= 60
+    headers = cdn_headers(DETAIL_POLICY, ["news:1", "news"])
+    assert headers["Surrogate-Key"] == "news news:1"
+    assert headers["Cache-Tag"] == "news,news:1"
+
+
+@pytest.mark.skipif(bool(settings.CDN_PURGE_URL), reason="очистка CDN настроена")
+def test_no_shared_max_age_without_purger():
+    assert DETAIL_POLICY.shared_max_age is None
+    assert all(policy.shared_max_age is None for policy in LIST_POLICIES.values())
+
+
+async def test_public_responses_carry_row_keys(session, client):
+    project = await add_project(session, "house")
+    await session.commit()
+
+    detail = await client.get(f"/public/projects/ru/{project.id}")
+    listing = await client.get("/public/projects/ru")
+
+    assert f"project:{project.id}" in detail.headers["surrogate-key"].split()
+    assert {PROJECT, f"project:{project.id}"} <= set(listing.headers["cache-tag"].split(","))
+    if not settings.CDN_PURGE_URL:
+        assert "s-maxage" not in detail.headers["cache-control"]
+        assert "s-maxage" not in listing.headers["cache-control"]
+
+
+async def test_update_returning_marks_row_key(session, committed):
+    news = await add_news(session, "a")
+    await session.commit()
+    committed.clear()
+
+    await NewsRepository(session).update_returning(news.id, {"slug": "b"})
+    await session.commit()
+
+    assert {NEWS, f"news:{news.id}"} <= committed
+
+
+async def test_update_returning_marks_previous_parent(session, committed):
+    first = await add_news(session, "a")
+    second = await add_news(session, "b", titles={LanguageEnum.EN: "b"})
+    await session.commit()
+    committed.clear()
+
+    repo = BaseRepository(session, NewsI18n)
+    moved = await repo.update_returning({"news_id": first.id, "locale": LanguageEnum.RU}, {"news_id": second.id})
+    await session.commit()
+
+    assert moved.news_id == second.id
+    assert {f"news:{first.id}", f"news:{second.id}"} <= committed
+
+
+async def test_delete_returning_marks_row_key(session, committed):
+    news = await add_news(session, "a")
+    await session.commit()
+    committed.clear()
+
+    assert await NewsRepository(session).delete_returning(news.id)
+    await session.commit()
+
+    assert {NEWS, f"news:{news.id}"} <= committed
+
+
+async def test_create_many_marks_row_keys(session, committed):
+    news = await add_news(session, "a")
+    await session.commit()
+    committed.clear()
+
+    await BaseRepository(session, NewsI18n).create_many(
+        [{"news_id": news.id, "locale": LanguageEnum.EN, "title": "A", "short_description": "", "full_description": ""}]
+    )
+    await session.commit()
+
+    assert f"news:{news.id}" in committed
+
+
+async def test_purge_committed_sends_public_keys(monkeypatch):
+    purger = RecordingPurger()
+    monkeypatch.setattr(cdn, "purger", purger)
+
+    await cdn.purge_committed({NEWS, "news:1", "taxonomy"})
+
+    assert purger.purged == [{NEWS, "news:1"}]
+
+
+async def test_purge_committed_without_purger(monkeypatch):
+    monkeypatch.setattr(cdn, "purger", None)
+    await cdn.purge_committed({NEWS, "news:1"})
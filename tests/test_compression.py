@@ -0,0 +1,103 @@
+import gzip
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route
+
+from app.core.cache import MemoryCacheBackend, ResponseCache
+from app.core.compression import ENCODINGS, CompressionMiddleware, brotli, negotiate
+
+
+pytestmark = pytest.mark.anyio
+
+BIG = b'{"items":[' + b",".join(b'{"name":"house"}' for _ in range(2000)) + b"]}"
+
+needs_brotli = pytest.mark.skipif(brotli is None, reason="brotli не установлен")
+
+
+def test_negotiate_prefers_server_order_and_honours_q():
+    assert negotiate("gzip, br") == ENCODINGS[0]
+    assert negotiate("br;q=0, gzip") == "gzip"
+    assert negotiate("*") == ENCODINGS[0]
+    assert negotiate("identity") is None
+    assert negotiate("") is None
+
+
+@needs_brotli
+def test_br_is_preferred_when_available():
+    assert ENCODINGS == ("br", "gzip")
+    assert negotiate("gzip, br") == "br"
+    assert negotiate("gzip, br;q=0") == "gzip"
+
+
+def app_with(body: bytes, status: int = 200, **headers: str) -> httpx.AsyncClient:
+    async def endpoint(request):
+        return Response(body, status_code=status, media_type="application/json", headers=headers)
+
+    app = CompressionMiddleware(Starlette(routes=[Route("/", endpoint)]))
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def test_middleware_compresses_large_json():
+    async with app_with(BIG) as client:
+        response = await client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < len(BIG)
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.content == BIG
+
+
+@needs_brotli
+async def test_middleware_negotiates_br():
+    async with app_with(BIG) as client:
+        response = await client.get("/", headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+    assert int(response.headers["content-length"]) < len(BIG)
+    assert response.content == BIG
+
+
+async def test_middleware_skips_small_encoded_and_304():
+    async with app_with(b"{}") as client:
+        assert "content-encoding" not in (await client.get("/", headers={"Accept-Encoding": "gzip"})).headers
+    async with app_with(gzip.compress(BIG), **{"Content-Encoding": "gzip"}) as client:
+        assert (await client.get("/", headers={"Accept-Encoding": "gzip"})).content == BIG
+    async with app_with(b"", status=304) as client:
+        assert "content-encoding" not in (await client.get("/", headers={"Accept-Encoding": "gzip"})).headers
+
+
+async def test_cache_stores_precompressed_variants():
+    cache = ResponseCache(MemoryCacheBackend(), ttl=60, encodings=("gzip",))
+    calls = 0
+
+    async def produce():
+        nonlocal calls
+        calls += 1
+        return BIG
+
+    first = await cache.get_or_set("news", "ru", {}, produce, encoding="gzip")
+    plain = await cache.get_or_set("news", "ru", {}, produce)
+    again = await cache.get_or_set("news", "ru", {}, produce, encoding="gzip")
+
+    assert first.encoding == again.encoding == "gzip"
+    assert gzip.decompress(again.body) == plain.body == BIG
+    assert calls == 1
+
+
+@needs_brotli
+async def test_cache_stores_br_variant():
+    cache = ResponseCache(MemoryCacheBackend(), ttl=60, encodings=("br", "gzip"))
+    calls = 0
+
+    async def produce():
+        nonlocal calls
+        calls += 1
+        return BIG
+
+    br = await cache.get_or_set("news", "ru", {}, produce, encoding="br")
+    gz = await cache.get_or_set("news", "ru", {}, produce, encoding="gzip")
+
+    assert (br.encoding, gz.encoding) == ("br", "gzip")
+    assert brotli.decompress(br.body) == gzip.decompress(gz.body) == BIG
+    assert calls == 1
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+import sqlalchemy as sa
+
+from app.models.taxonomy import LanguageEnum
+from app.services.cache import response_cache
+from tests.factories import add_news, add_project
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_list_returns_304_for_current_etag(session, client, count_queries):
+    await add_project(session, "house")
+    await session.commit()
+
+    first = await client.get("/public/projects/ru")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["last-modified"]
+
+    count_queries.clear()
+    second = await client.get("/public/projects/ru", headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert second.headers["cache-control"] == first.headers["cache-control"]
+    selects = [q for q in count_queries if q.startswith("SELECT")]
+    assert len(selects) == 1 and "FROM content_version" in selects[0]
+
+
+async def test_commit_changes_the_etag(session, client):
+    await add_news(session, "a")
+    await session.commit()
+    etag = (await client.get("/public/news/ru")).headers["etag"]
+
+    await add_news(session, "b")
+    await session.commit()
+    response = await client.get("/public/news/ru", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers.get("etag") != etag
+
+
+async def test_detail_honours_if_modified_since(session, client):
+    project = await add_project(session, "house")
+    await session.commit()
+
+    first = await client.get(f"/public/projects/ru/{project.id}")
+    assert first.status_code == 200
+    second = await client.get(
+        f"/public/projects/ru/{project.id}", headers={"If-Modified-Since": first.headers["last-modified"]}
+    )
+    assert second.status_code == 304
+
+
+async def test_detail_etag_depends_on_the_item(session, client):
+    a = await add_project(session, "a")
+    b = await add_project(session, "b")
+    await session.commit()
+
+    etag = (await client.get(f"/public/projects/ru/{a.id}")).headers["etag"]
+    response = await client.get(f"/public/projects/ru/{b.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+@pytest.mark.skipif(response_cache is None, reason="response cache is disabled")
+async def test_stale_copy_is_sent_without_validators(session, client):
+    await add_news(session, "a")
+    await session.commit()
+    assert "etag" in (await client.get("/public/news/ru")).headers
+
+    await add_news(session, "b")
+    await session.commit()
+    stale = await client.get("/public/news/ru")
+
+    assert [n["slug"] for n in stale.json()["items"]] == ["a"]
+    assert "etag" not in stale.headers
+
+
+@pytest.mark.skipif(response_cache is None, reason="response cache is disabled")
+async def test_foreign_write_rebuilds_cached_body(session, client):
+    news = await add_news(session, "a", titles={LanguageEnum.RU: "Старый"})
+    await session.commit()
+    first = await client.get(f"/public/news/ru/{news.id}")
+    assert first.json()["translations"][0]["title"] == "Старый"
+
+    # Запись другого воркера: кэш ответов этого воркера о ней не знает
+    await session.execute(sa.text("UPDATE news_i18n SET title = 'Новый'"))
+    await session.commit()
+    second = await client.get(f"/public/news/ru/{news.id}")
+
+    assert second.json()["translations"][0]["title"] == "Новый"
+    assert second.headers["etag"] != first.headers["etag"]
+    stale = await client.get(f"/public/news/ru/{news.id}", headers={"If-None-Match": first.headers["etag"]})
+    assert stale.status_code == 200
+    current = await client.get(f"/public/news/ru/{news.id}", headers={"If-None-Match": second.headers["etag"]})
+    assert current.status_code == 304
+
+
+@pytest.mark.skipif(response_cache is None, reason="response cache is disabled")
+async def test_foreign_write_marks_list_copy_stale(session, client):
+    await add_news(session, "a", titles={LanguageEnum.RU: "Старый"})
+    await session.commit()
+    await client.get("/public/news/ru")
+
+    await session.execute(sa.text("UPDATE news_i18n SET title = 'Новый'"))
+    await session.commit()
+    stale = await client.get("/public/news/ru")
+    assert stale.json()["items"][0]["translations"][0]["title"] == "Старый"
+    assert "etag" not in stale.headers
+
+    await asyncio.gather(*response_cache._refreshing.values())
+    fresh = await client.get("/public/news/ru")
+    assert fresh.json()["items"][0]["translations"][0]["title"] == "Новый"
+    assert "etag" in fresh.headers
@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+from app.models.location import Location
+from app.models.project import ProjectStyle, ProjectStyleLink, ProjectType
+from app.models.taxonomy import LanguageEnum
+from app.repositories.project import FACETS, YEAR_BUCKET, ProjectRepository
+from tests.factories import add_project
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def catalog(session, size: int = 40):
+    """Случайные проекты с типом, городом, стилями и годом; возвращает их описания для проверки."""
+    rnd = random.Random(3)
+    types = [ProjectType(key=f"type_{i}") for i in range(3)]
+    locations = [Location(country_code="TM", city_slug=f"city-{i}") for i in range(3)]
+    styles = [ProjectStyle(key=f"style_{i}") for i in range(3)]
+    session.add_all([*types, *locations, *styles])
+    await session.flush()
+
+    projects = []
+    for i in range(size):
+        location = rnd.choice([*locations, None])
+        project = await add_project(
+            session,
+            f"p-{i}",
+            published=rnd.random() > 0.2,
+            order_index=i,
+            type_id=rnd.choice(types).id,
+            location_id=location.id if location is not None else None,
+            year=rnd.choice([None, 2003, 2008, 2011, 2016, 2019]),
+        )
+        chosen = rnd.sample(styles, rnd.randint(0, 2))
+        session.add_all(ProjectStyleLink(project_id=project.id, style_id=s.id) for s in chosen)
+        projects.append(
+            {
+                "id": project.id,
+                "published": project.is_published,
+                "order_index": i,
+                "type_id": {project.type_id},
+                "location_id": {project.location_id} - {None},
+                "style_id": {s.id for s in chosen},
+                "year": {project.year - project.year % YEAR_BUCKET} if project.year else set(),
+            }
+        )
+    await session.flush()
+    return projects, types, locations, styles
+
+
+def expected(projects, selected):
+    def matches(p, skip=None):
+        return p["published"] and all(
+            p[f] & set(values) for f, values in selected.items() if f != skip and values is not None
+        )
+
+    counts = {f: {} for f in FACETS}
+    for facet in FACETS:
+        for p in projects:
+            if matches(p, skip=facet):
+                for value in p[facet]:
+                    counts[facet][value] = counts[facet].get(value, 0) + 1
+    hits = sorted((p for p in projects if matches(p)), key=lambda p: -p["order_index"])
+    return [p["id"] for p in hits], counts
+
+
+async def test_facets_match_brute_force(session):
+    projects, types, locations, styles = await catalog(session)
+    repo = ProjectRepository(session)
+    cases = [
+        {},
+        {"type_id": [types[0].id]},
+        {"type_id": [types[0].id, types[1].id], "style_id": [styles[2].id]},
+        {"location_id": [locations[1].id], "year": [2005, 2015]},
+        {"type_id": [types[2].id], "location_id": [locations[0].id], "style_id": [styles[0].id], "year": [2000]},
+    ]
+    for selected in cases:
+        ids, counts = expected(projects, selected)
+        page = await repo.facet_published(
+            LanguageEnum.RU,
+            type_ids=selected.get("type_id"),
+            location_ids=selected.get("location_id"),
+            style_ids=selected.get("style_id"),
+            years=selected.get("year"),
+            limit=100,
+        )
+        assert [card.project_id for card in page.items] == ids, selected
+        assert page.total == len(ids)
+        assert page.counts == counts, selected
+
+
+async def test_facets_page_and_counts_in_one_query(session, count_queries):
+    projects, types, _, _ = await catalog(session)
+    ids, counts = expected(projects, {"type_id": [types[1].id]})
+    count_queries.clear()
+
+    page = await ProjectRepository(session).facet_published("ru", type_ids=[types[1].id], limit=2, offset=1)
+
+    assert [q for q in count_queries if q.startswith("SELECT")] == [count_queries[-1]]
+    assert [card.project_id for card in page.items] == ids[1:3]
+    assert page.total == len(ids)
+    assert page.counts == counts
+
+
+async def test_empty_page_keeps_counts(session):
+    projects, _, _, _ = await catalog(session)
+    ids, counts = expected(projects, {})
+
+    page = await ProjectRepository(session).facet_published("ru", limit=5, offset=len(ids))
+
+    assert page.items == []
+    assert page.total == len(ids)
+    assert page.counts == counts
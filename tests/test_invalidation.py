@@ -0,0 +1,95 @@
+from collections import defaultdict
+
+import pytest
+
+from app.core import invalidation
+from app.core.cache import MemoryCacheBackend
+from app.core.invalidation import on_commit, pending_tags
+from app.models.taxonomy import LanguageEnum
+from app.repositories.news import NewsRepository
+from app.services.cache import NEWS, PERSON, PROJECT
+from tests.factories import add_news, add_person
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def committed(monkeypatch):
+    """Наборы тегов, с которыми вызывались обработчики коммита (реальные обработчики отключены)."""
+    monkeypatch.setattr(invalidation, "_handlers", defaultdict(list))
+    calls: list[set[str]] = []
+
+    async def handler(tags: set[str]) -> None:
+        calls.append(set(tags))
+
+    for tag in (PROJECT, NEWS, PERSON):
+        on_commit(tag, handler)
+    return calls
+
+
+async def test_flush_marks_model_tags_and_row_keys(session, committed):
+    news = await add_news(session, "a")
+    assert pending_tags(session) >= {NEWS, f"news:{news.id}"}
+
+    await session.commit()
+
+    assert len(committed) == 1
+    assert committed[0] >= {NEWS, f"news:{news.id}"}
+    assert pending_tags(session) == set()
+
+
+async def test_one_handler_call_per_commit(session, committed):
+    await add_person(session, "p", names={LanguageEnum.RU: "П"})
+    await session.commit()
+    assert len(committed) == 1
+    assert {PERSON, PROJECT} <= committed[0]
+
+
+async def test_rollback_drops_marks(session, committed):
+    await add_news(session, "a")
+    await session.rollback()
+    assert pending_tags(session) == set()
+    assert committed == []
+
+
+async def test_bulk_statements_mark_model_tags(session, committed):
+    news = await add_news(session, "a")
+    await session.commit()
+    committed.clear()
+
+    await NewsRepository(session).update_returning(news.id, {"slug": "b"})
+    await session.commit()
+
+    assert NEWS in committed[0]
+
+
+async def test_memory_backend_invalidates_by_tag():
+    backend = MemoryCacheBackend()
+    await backend.set("a", b"1", {"news"}, ttl=60)
+    await backend.set("b", b"2", {"news", "project"}, ttl=60)
+    await backend.set("c", b"3", {"person"}, ttl=60)
+
+    assert await backend.invalidate({"news"}) == 2
+    assert [await backend.get(k) for k in "abc"] == [None, None, b"3"]
+    assert await backend.versions(["news", "person"]) == (1, 0)
+
+
+async def test_memory_backend_expires_and_evicts():
+    backend = MemoryCacheBackend(max_entries=2)
+    await backend.set("old", b"0", (), ttl=0)
+    assert await backend.get("old") is None
+
+    await backend.set("a", b"1", (), ttl=60)
+    await backend.set("b", b"2", (), ttl=60)
+    await backend.get("a")
+    await backend.set("c", b"3", (), ttl=60)
+    assert [await backend.get(k) for k in "abc"] == [b"1", None, b"3"]
+
+
+async def test_memory_backend_refresh_lock():
+    backend = MemoryCacheBackend()
+    assert await backend.acquire("lock", ttl=60)
+    assert not await backend.acquire("lock", ttl=60)
+    await backend.release("lock")
+    assert await backend.acquire("lock", ttl=60)
@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.errors import DomainError
+from app.models.project import Project
+from app.repositories.base import Page
+from app.repositories.project import ProjectRepository
+from tests.factories import add_project, at
+
+
+pytestmark = pytest.mark.anyio
+
+
+def compiled(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_row_value_comparison_only_for_not_null_columns():
+    repo = ProjectRepository(session=None)
+    fast = compiled(repo._keyset_clause([(Project.order_index, False), (Project.id, False)], [1, "x"]))
+    assert fast.startswith("(project.order_index, project.id) >")
+
+    nullable = compiled(repo._keyset_clause([(Project.year, False), (Project.id, False)], [2000, "x"]))
+    assert "(project.year, project.id)" not in nullable
+    assert "project.year IS NULL" in nullable
+
+
+async def walk(repo: ProjectRepository, order_by, limit: int) -> tuple[list[str], Page]:
+    slugs, cursor = [], None
+    while True:
+        page = await repo.paginate(order_by=order_by, limit=limit, cursor=cursor)
+        slugs += [p.slug for p in page.items]
+        if page.next_cursor is None:
+            return slugs, page
+        cursor = page.next_cursor
+
+
+async def walk_back(repo: ProjectRepository, order_by, limit: int, page: Page) -> list[str]:
+    slugs = [p.slug for p in page.items]
+    while page.prev_cursor is not None:
+        page = await repo.paginate(order_by=order_by, limit=limit, cursor=page.prev_cursor)
+        slugs = [p.slug for p in page.items] + slugs
+    return slugs
+
+
+@pytest.mark.parametrize("order_by", [("year",), ("-year", "-id"), ("-published_at", "year")])
+async def test_paginate_keeps_null_rows(session, order_by):
+    years = [2001, None, 2003, 2001, None, 2002, 2004]
+    for i, year in enumerate(years):
+        await add_project(session, f"p-{i}", year=year, published_at=at(i % 2))
+    repo = ProjectRepository(session)
+    expected = [p.slug for p in await repo.list(order_by=[*order_by, "id"])]
+
+    forward, last = await walk(repo, order_by, limit=2)
+    assert forward == expected
+    assert await walk_back(repo, order_by, 2, last) == expected
+
+
+async def test_cursor_must_match_ordering(session):
+    for i in range(3):
+        await add_project(session, f"p-{i}", order_index=i)
+    repo = ProjectRepository(session)
+    page = await repo.paginate(order_by=("-order_index",), limit=1)
+    assert [p.slug for p in page.items] == ["p-2"]
+    with pytest.raises(DomainError):
+        await repo.paginate(order_by=("order_index",), limit=1, cursor=page.next_cursor)
@@ -0,0 +1,51 @@
+import pytest
+import sqlalchemy as sa
+
+from app.core.serialization import serializer_for
+from app.models.project import ProjectStyle, ProjectStyleLink
+from app.repositories.news import NewsRepository
+from app.repositories.people import PersonRepository
+from app.repositories.project import ProjectRepository
+from app.schemas.news import NewsRead
+from app.schemas.people import PersonRead
+from app.schemas.project import ProjectRead
+from tests.factories import add_news, add_person, add_project
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize(
+    "repo_cls, schema, add",
+    [(ProjectRepository, ProjectRead, add_project), (NewsRepository, NewsRead, add_news), (PersonRepository, PersonRead, add_person)],
+)
+async def test_list_profile_loads_translations_only(session, count_queries, repo_cls, schema, add):
+    for i in range(3):
+        await add(session, f"item-{i}")
+    session.expunge_all()
+    count_queries.clear()
+
+    items = await repo_cls(session).list_published_with_relations(locale="ru", profile="list")
+
+    assert len(count_queries) == 2
+    assert len(serializer_for(schema).dump_json(items)) > 2
+
+
+async def test_unknown_profile_is_rejected(session):
+    with pytest.raises(ValueError):
+        await ProjectRepository(session).list_published_with_relations(profile="nope")
+
+
+async def test_style_delete_cascades_to_links(session):
+    project = await add_project(session, "house")
+    style = ProjectStyle(key="modern")
+    session.add(style)
+    await session.flush()
+    session.add(ProjectStyleLink(project_id=project.id, style_id=style.id))
+    await session.flush()
+    session.expunge_all()
+
+    await session.delete(await session.get(ProjectStyle, style.id))
+    await session.flush()
+
+    assert await session.scalar(sa.select(sa.func.count()).select_from(ProjectStyleLink)) == 0
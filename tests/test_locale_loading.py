@@ -0,0 +1,43 @@
+import pytest
+
+from app.models.taxonomy import LanguageEnum
+from app.repositories.base import locale_options
+from app.repositories.news import NewsRepository
+from app.repositories.project import ProjectRepository
+from tests.factories import add_news, add_project
+
+
+pytestmark = pytest.mark.anyio
+
+NAMES = {LanguageEnum.RU: "дом", LanguageEnum.EN: "house", LanguageEnum.TK: "jaý"}
+
+
+def locales(obj) -> set[str]:
+    return {t.locale.value for t in obj.translations}
+
+
+def test_no_locale_means_no_criteria():
+    assert locale_options(None, "en") == ()
+    assert len(locale_options("en", "en")) == len(locale_options("en"))
+
+
+async def test_get_loads_only_requested_locales(session):
+    project_id = (await add_project(session, "house", names=NAMES)).id
+    repo = ProjectRepository(session)
+
+    session.expunge_all()
+    assert locales(await repo.get_with_relations(project_id, locale="en")) == {"en"}
+    session.expunge_all()
+    assert locales(await repo.get_with_relations(project_id, locale="tk", fallback_locale="ru")) == {"tk", "ru"}
+    session.expunge_all()
+    assert locales(await repo.get_with_relations(project_id)) == {"ru", "en", "tk"}
+
+
+async def test_list_applies_locale_to_every_row(session):
+    await add_news(session, "a", titles={LanguageEnum.RU: "а", LanguageEnum.EN: "a"})
+    await add_news(session, "b", titles={LanguageEnum.EN: "b"})
+    session.expunge_all()
+
+    items = await NewsRepository(session).list_published_with_relations(locale="ru")
+
+    assert {n.slug: locales(n) for n in items} == {"a": {"ru"}, "b": set()}
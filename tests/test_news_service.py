@@ -0,0 +1,48 @@
+import pytest
+import sqlalchemy as sa
+
+from app.core.errors import DomainError
+from app.models.news import News
+from app.schemas.news import NewsRead, NewsUpdate
+from app.services.news import delete_news, update_news
+from tests.factories import add_news
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_update_news_returns_serializable_news(session):
+    news_id = (await add_news(session, "old")).id
+    session.expunge_all()
+
+    news = await update_news(session, news_id, NewsUpdate(slug="new"))
+
+    read = NewsRead.model_validate(news)
+    assert read.slug == "new"
+    assert [t.title for t in read.translations] == ["old"]
+
+
+async def test_update_news_refreshes_loaded_copy(session):
+    loaded = await add_news(session, "old")
+
+    news = await update_news(session, loaded.id, NewsUpdate(slug="new", preview="p"))
+
+    assert news is loaded
+    assert (loaded.slug, loaded.preview) == ("new", "p")
+
+
+async def test_update_news_missing(session):
+    news = await add_news(session, "old")
+    await delete_news(session, news.id)
+    with pytest.raises(DomainError) as error:
+        await update_news(session, news.id, NewsUpdate(slug="new"))
+    assert error.value.status == 404
+
+
+async def test_delete_news(session):
+    news_id = (await add_news(session, "old")).id
+
+    assert await delete_news(session, news_id) is True
+    assert await session.scalar(sa.select(sa.func.count()).select_from(News)) == 0
+    with pytest.raises(DomainError):
+        await delete_news(session, news_id)
@@ -0,0 +1,59 @@
+import os
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.pool_metrics import Histogram, InstrumentedPool, instrument_engine, pool_metrics
+
+
+pytestmark = pytest.mark.anyio
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((1, 10))
+    for value in (0.5, 1, 3, 50):
+        histogram.observe(value)
+    assert histogram.snapshot() == {"buckets": {"1": 2, "10": 3, "+Inf": 4}, "count": 4, "sum": 54.5}
+
+
+@pytest.fixture
+async def instrumented():
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_async_engine(url, poolclass=InstrumentedPool, pool_size=1, max_overflow=0, pool_timeout=0.2)
+    metrics = instrument_engine("test", engine)
+    try:
+        yield engine, metrics
+    finally:
+        pool_metrics.pop("test", None)
+        await engine.dispose()
+
+
+async def test_checkouts_and_timeouts_are_counted(instrumented):
+    engine, metrics = instrumented
+    async with engine.connect() as conn:
+        await conn.execute(sa.text("SELECT 1"))
+        with pytest.raises(PoolTimeoutError):
+            async with engine.connect():
+                pass
+
+    async with engine.connect() as conn:
+        await conn.execute(sa.text("SELECT 1"))
+
+    snapshot = metrics.snapshot()
+    assert (snapshot["checkouts"], snapshot["timeouts"], snapshot["connects"]) == (2, 1, 1)
+    assert snapshot["checkout_wait_ms"]["count"] == 3
+    assert snapshot["checked_out"] == 0
+    assert snapshot["connection_lifetime_s"]["open"] == 1
+
+
+async def test_metrics_survive_pool_recreate(instrumented):
+    engine, metrics = instrumented
+    await engine.dispose()
+    async with engine.connect() as conn:
+        await conn.execute(sa.text("SELECT 1"))
+    assert engine.sync_engine.pool.metrics is metrics
+    assert metrics.checkouts == 1
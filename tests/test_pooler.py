@@ -0,0 +1,48 @@
+import os
+
+import pytest
+import sqlalchemy as sa
+
+from app.core import db
+from app.core.db import make_engine, pooler_connect_args
+from app.core.pool_metrics import pool_metrics
+
+
+pytestmark = pytest.mark.anyio
+
+
+def test_direct_connection_keeps_statement_cache():
+    assert pooler_connect_args("none") == {"prepared_statement_cache_size": db.settings.DATABASE_STATEMENT_CACHE_SIZE}
+
+
+def test_transaction_mode_uses_unique_statement_names(monkeypatch):
+    monkeypatch.setattr(db.settings, "DATABASE_POOLER_PREPARED_STATEMENTS", False)
+    args = pooler_connect_args("transaction")
+    assert args["prepared_statement_cache_size"] == 0
+    assert args["statement_cache_size"] == 0
+    names = {args["prepared_statement_name_func"]() for _ in range(3)}
+    assert len(names) == 3
+
+    monkeypatch.setattr(db.settings, "DATABASE_POOLER_PREPARED_STATEMENTS", True)
+    cached = pooler_connect_args("transaction")
+    assert cached["prepared_statement_cache_size"] == db.settings.DATABASE_STATEMENT_CACHE_SIZE
+    assert cached["statement_cache_size"] == 0
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        pooler_connect_args("session")
+
+
+async def test_transaction_mode_engine_runs_repeated_statements():
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = make_engine(url, "pooler-test", pooler_mode="transaction")
+    try:
+        for _ in range(2):
+            async with engine.connect() as conn:
+                assert await conn.scalar(sa.text("SELECT CAST(:x AS int) + 1"), {"x": 1}) == 2
+    finally:
+        pool_metrics.pop("pooler-test", None)
+        await engine.dispose()
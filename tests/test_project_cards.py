@@ -0,0 +1,62 @@
+import pytest
+
+from app.models.project import Project, ProjectCard
+from app.models.taxonomy import LanguageEnum
+from app.repositories.project import ProjectRepository
+from tests.factories import add_project, at
+
+
+pytestmark = pytest.mark.anyio
+
+NAMES = {LanguageEnum.RU: "Дом", LanguageEnum.EN: "House"}
+
+
+async def test_card_list_reads_cards(session):
+    await add_project(session, "low", names=NAMES, order_index=1)
+    await add_project(session, "high", names=NAMES, order_index=5, published_at=at(1))
+    await add_project(session, "draft", names=NAMES, published=False)
+    repo = ProjectRepository(session)
+
+    cards = await repo.list_published_cards("en", limit=10)
+
+    assert all(isinstance(c, ProjectCard) for c in cards)
+    assert [(c.slug, c.name, c.locale) for c in cards] == [("high", "House", LanguageEnum.EN), ("low", "House", LanguageEnum.EN)]
+    # Прежний метод главной не менял сигнатуру: limit первым аргументом, ORM-проекты
+    projects = await repo.list_published_for_main(1, locale="en")
+    assert [type(p) for p in projects] == [Project] and projects[0].slug == "high"
+
+
+async def test_public_lists_page_with_cursor(session, client):
+    for i in range(5):
+        await add_project(session, f"p-{i}", names=NAMES, order_index=i)
+    await session.commit()
+
+    slugs, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/public/projects/en", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        slugs += [c["slug"] for c in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert slugs == [f"p-{i}" for i in reversed(range(5))]
+    assert (await client.get("/public/projects/en", params={"cursor": "broken"})).status_code == 400
+
+
+async def test_public_project_list_is_served_from_cards(session, client, count_queries):
+    project = await add_project(session, "house", names=NAMES)
+    await session.commit()
+    count_queries.clear()
+
+    response = await client.get("/public/projects/en")
+
+    assert response.status_code == 200
+    assert [(c["project_id"], c["slug"], c["name"]) for c in response.json()["items"]] == [(str(project.id), "house", "House")]
+    assert response.json()["next_cursor"] is None
+    assert f"project:{project.id}" in response.headers["surrogate-key"].split()
+    selects = [q for q in count_queries if q.startswith("SELECT")]
+    assert len(selects) == 2
+    assert "FROM project_card" in selects[1]
@@ -0,0 +1,45 @@
+from typing import NamedTuple
+
+import pytest
+
+from app.models.project import Project
+from app.models.taxonomy import LanguageEnum
+from app.repositories.project import ProjectRepository
+from tests.factories import add_project
+
+
+pytestmark = pytest.mark.anyio
+
+
+class Card(NamedTuple):
+    slug: str
+    name: str | None
+
+
+async def test_select_columns_returns_rows_without_entities(session):
+    await add_project(session, "a", names={LanguageEnum.RU: "А", LanguageEnum.EN: "A"}, order_index=2)
+    await add_project(session, "b", names={LanguageEnum.RU: "Б"}, order_index=1)
+    await add_project(session, "hidden", published=False)
+    session.expunge_all()
+
+    rows = await ProjectRepository(session).select_columns(
+        ["slug"],
+        filters={"is_published": True},
+        order_by=["-order_index"],
+        i18n_columns=["name"],
+        locale="en",
+        row_type=Card,
+    )
+
+    assert rows == [Card("a", "A"), Card("b", None)]
+    assert not any(isinstance(obj, Project) for obj in session.identity_map.values())
+
+
+async def test_select_columns_validates_names(session):
+    repo = ProjectRepository(session)
+    with pytest.raises(ValueError):
+        await repo.select_columns(["no_such_column"])
+    with pytest.raises(ValueError):
+        await repo.select_columns(["slug"], i18n_columns=["name"])
+    with pytest.raises(ValueError):
+        await repo.select_columns(["slug"], i18n_columns=["slug"], locale="ru")
@@ -0,0 +1,70 @@
+import contextvars
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import db
+from app.core.db import ReplicaRouter
+from app.models.project import ProjectType
+
+
+pytestmark = pytest.mark.anyio
+
+DEAD_URL = "postgresql+asyncpg://nobody@127.0.0.1:1/none"
+
+
+def engines(n: int):
+    return [create_async_engine(f"postgresql+asyncpg://u@replica-{i}/db") for i in range(n)]
+
+
+def test_router_rotates_and_skips_down_replicas():
+    a, b, c = engines(3)
+    router = ReplicaRouter([a, b, c], retry_seconds=60)
+    assert [router.candidates()[0] for _ in range(4)] == [a, b, c, a]
+
+    router.mark_down(b)
+    assert all(b not in router.candidates() for _ in range(3))
+    assert ReplicaRouter([], retry_seconds=60).candidates() == []
+
+
+def test_down_replica_returns_after_retry(monkeypatch):
+    (a,) = engines(1)
+    router = ReplicaRouter([a], retry_seconds=5)
+    now = 1000.0
+    monkeypatch.setattr(db.time, "monotonic", lambda: now)
+    router.mark_down(a)
+    assert router.candidates() == []
+    now += 6
+    assert router.candidates() == [a]
+
+
+def test_sticky_primary_is_per_context():
+    def write_then_check():
+        db.stick_to_primary(30)
+        return db.reads_pinned_to_primary()
+
+    assert contextvars.copy_context().run(write_then_check)
+    assert not contextvars.copy_context().run(db.reads_pinned_to_primary)
+
+
+async def test_unreachable_replica_falls_back_to_primary(monkeypatch):
+    dead = create_async_engine(DEAD_URL)
+    router = ReplicaRouter([dead], retry_seconds=60)
+    monkeypatch.setattr(db, "replica_router", router)
+
+    session = await db.open_read_session()
+    try:
+        assert session.bind is db.engine
+        assert session.info["read_only"]
+        assert router.candidates() == []
+    finally:
+        await session.close()
+        await dead.dispose()
+
+
+async def test_read_session_rejects_flush(connection):
+    session = db.read_session(bind=connection, join_transaction_mode="create_savepoint")
+    session.add(ProjectType(key="house"))
+    with pytest.raises(RuntimeError):
+        await session.flush()
+    await session.close()
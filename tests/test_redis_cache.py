@@ -0,0 +1,92 @@
+import pytest
+
+from app.core.cache import CachePolicy, RedisCacheBackend, ResponseCache
+
+
+fakeredis = pytest.importorskip("fakeredis")
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def backend(server, prefix: str = "resp") -> RedisCacheBackend:
+    """Отдельный клиент на общем сервере — как второй воркер."""
+    return RedisCacheBackend(client=fakeredis.aioredis.FakeRedis(server=server), prefix=prefix)
+
+
+async def test_get_set_with_ttl(server):
+    cache = backend(server)
+    await cache.set("resp:a", b"1", {"news"}, ttl=60)
+    await cache.set("resp:b", b"2", {"news"}, ttl=0.2)
+
+    assert await cache.get("resp:a") == b"1"
+    assert await cache.get("resp:missing") is None
+    assert 0 < await cache.client.ttl("resp:a") <= 60
+    # Меньше секунды Redis не умеет: срок округляется вверх до 1 с
+    assert await cache.client.ttl("resp:b") == 1
+    # Множество тега живёт не меньше самого долгого ключа
+    assert await cache.client.ttl("resp:tag:news") > 1
+
+
+async def test_invalidate_drops_tagged_keys_and_bumps_versions(server):
+    cache = backend(server)
+    await cache.set("resp:a", b"1", {"news"}, ttl=60)
+    await cache.set("resp:b", b"2", {"news", "project"}, ttl=60)
+    await cache.set("resp:c", b"3", {"person"}, ttl=60)
+
+    assert await cache.invalidate({"news"}) == 2
+    assert [await cache.get(k) for k in ("resp:a", "resp:b", "resp:c")] == [None, None, b"3"]
+    assert await cache.versions(["news", "person"]) == (1, 0)
+    assert await cache.invalidate(()) == 0
+
+
+async def test_invalidation_is_shared_between_instances(server):
+    first, second = backend(server), backend(server)
+    await first.set("resp:a", b"1", {"news"}, ttl=60)
+    assert await second.get("resp:a") == b"1"
+
+    await second.invalidate({"news"})
+
+    assert await first.get("resp:a") is None
+    assert await first.versions(["news"]) == (1,)
+
+
+async def test_refresh_lock_is_shared(server):
+    first, second = backend(server), backend(server)
+    assert await first.acquire("resp:a:lock", ttl=30)
+    assert not await second.acquire("resp:a:lock", ttl=30)
+    await first.release("resp:a:lock")
+    assert await second.acquire("resp:a:lock", ttl=30)
+
+
+async def test_clear_keeps_other_prefixes(server):
+    ours, theirs = backend(server), backend(server, prefix="other")
+    await ours.set("resp:a", b"1", {"news"}, ttl=60)
+    await theirs.set("other:a", b"2", {"news"}, ttl=60)
+
+    await ours.clear()
+
+    assert await ours.get("resp:a") is None
+    assert await theirs.get("other:a") == b"2"
+
+
+async def test_response_cache_sees_other_workers_invalidation(server):
+    policy = CachePolicy(max_age=60, stale_while_revalidate=600)
+    first, second = ResponseCache(backend(server), ttl=60), ResponseCache(backend(server), ttl=60)
+    bodies = iter([b"old", b"new"])
+
+    async def produce() -> bytes:
+        return next(bodies)
+
+    assert (await first.get_or_set("news", "ru", None, produce, policy=policy)).body == b"old"
+    await second.invalidate({"news"})
+
+    stale = await first.get_or_set("news", "ru", None, produce, policy=policy)
+    assert (stale.body, stale.stale) == (b"old", True)
+    await first._refreshing[first.key("news", "ru")]
+    fresh = await second.get_or_set("news", "ru", None, produce, policy=policy)
+    assert (fresh.body, fresh.stale) == (b"new", False)
@@ -0,0 +1,86 @@
+import pytest
+import sqlalchemy as sa
+
+from app.core.errors import DomainError
+from app.models.taxonomy import LanguageEnum
+from app.repositories.news import NewsRepository
+from app.repositories.project import ProjectRepository
+from tests.factories import add_news, add_project
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_search_returns_published_rows_of_the_locale(session):
+    house = await add_project(session, "house", names={LanguageEnum.RU: "Дом у реки", LanguageEnum.EN: "River house"})
+    await add_project(session, "draft", names={LanguageEnum.RU: "Дом черновик"}, published=False)
+    await add_project(session, "office", names={LanguageEnum.RU: "Офис"})
+    session.expunge_all()
+    repo = ProjectRepository(session)
+
+    page = await repo.search("дом", LanguageEnum.RU)
+
+    assert [hit.item.id for hit in page.items] == [house.id]
+    assert page.items[0].rank > 0
+    assert [t.locale for t in page.items[0].item.translations] == [LanguageEnum.RU]
+    assert (await repo.search("river", LanguageEnum.RU)).items == []
+    assert [hit.item.id for hit in (await repo.search("river", LanguageEnum.EN)).items] == [house.id]
+
+
+async def test_search_orders_by_rank_then_id(session):
+    for i in range(5):
+        await add_news(session, f"n-{i}", titles={LanguageEnum.RU: "выставка " + "выставка " * i + "архитектура"})
+    repo = NewsRepository(session)
+
+    hits = (await repo.search("выставка", LanguageEnum.RU, limit=10)).items
+
+    keys = [(hit.rank, str(hit.item.id)) for hit in hits]
+    assert len(keys) == 5
+    assert keys == sorted(keys, reverse=True)
+
+
+async def test_search_keyset_pages_both_ways(session):
+    for i in range(5):
+        await add_project(session, f"p-{i}", names={LanguageEnum.RU: f"Вилла {i}"})
+    repo = ProjectRepository(session)
+    expected = [hit.item.id for hit in (await repo.search("вилла", "ru", limit=10)).items]
+
+    seen, page = [], await repo.search("вилла", "ru", limit=2)
+    while True:
+        seen += [hit.item.id for hit in page.items]
+        if page.next_cursor is None:
+            break
+        page = await repo.search("вилла", "ru", limit=2, cursor=page.next_cursor)
+    assert seen == expected
+
+    back = [hit.item.id for hit in page.items]
+    while page.prev_cursor is not None:
+        page = await repo.search("вилла", "ru", limit=2, cursor=page.prev_cursor)
+        back = [hit.item.id for hit in page.items] + back
+    assert back == expected
+
+
+async def test_search_rejects_foreign_cursor(session):
+    for i in range(3):
+        await add_project(session, f"p-{i}", names={LanguageEnum.RU: f"Вилла дом {i}"})
+    repo = ProjectRepository(session)
+    page = await repo.search("вилла", "ru", limit=1)
+
+    with pytest.raises(DomainError) as error:
+        await repo.search("дом", "ru", limit=1, cursor=page.next_cursor)
+    assert error.value.code == "invalid_cursor"
+    assert (await repo.search("   ", "ru")).items == []
+
+
+async def test_search_condition_uses_gin_index(session):
+    await add_project(session, "house", names={LanguageEnum.RU: "Дом"})
+    await session.execute(sa.text("SET LOCAL enable_seqscan = off"))
+    plan = "\n".join(
+        await session.scalars(
+            sa.text(
+                "EXPLAIN SELECT project_id FROM project_i18n "
+                "WHERE search_vector @@ websearch_to_tsquery(search_config('ru'), 'дом')"
+            )
+        )
+    )
+    assert "ix_project_i18n_search" in plan
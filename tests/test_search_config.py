@@ -0,0 +1,47 @@
+import pytest
+import sqlalchemy as sa
+
+from app.models.taxonomy import LanguageEnum
+from app.repositories.news import NewsRepository
+from app.repositories.project import ProjectRepository
+from tests.factories import add_news, add_project
+from tools.reindex_search import batch_statement
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_search_matches_inflected_forms(session):
+    house = await add_project(session, "house", names={LanguageEnum.RU: "Дома у реки", LanguageEnum.EN: "Riverside houses"})
+    repo = ProjectRepository(session)
+
+    assert [hit.item.id for hit in (await repo.search("дом", "ru")).items] == [house.id]
+    assert [hit.item.id for hit in (await repo.search("house", "en")).items] == [house.id]
+
+
+async def test_title_hit_outranks_description_hit(session):
+    in_title = await add_news(session, "title", titles={LanguageEnum.RU: "Выставка"})
+    in_body = await add_news(session, "body", titles={LanguageEnum.RU: "Новости"})
+    in_body.translations[0].full_description = "В среду открылась выставка"
+    await session.flush()
+
+    hits = (await NewsRepository(session).search("выставка", "ru")).items
+
+    assert [hit.item.id for hit in hits] == [in_title.id, in_body.id]
+    assert hits[0].rank > hits[1].rank
+
+
+async def test_reindex_batch_rewrites_only_stale_vectors(session):
+    project = await add_project(session, "house", names={LanguageEnum.RU: "Дом"})
+    await session.execute(
+        sa.text("UPDATE project_i18n SET search_vector = ''::tsvector WHERE project_id = :id"), {"id": project.id}
+    )
+
+    row = (await session.execute(batch_statement("project_i18n", True), {"limit": 10})).one()
+    assert (row.seen, row.updated) == (1, 1)
+    assert [hit.item.id for hit in (await ProjectRepository(session).search("дом", "ru")).items] == [project.id]
+
+    again = (await session.execute(batch_statement("project_i18n", True), {"limit": 10})).one()
+    assert (again.seen, again.updated) == (1, 0)
+    after_last = batch_statement("project_i18n", False)
+    assert (await session.execute(after_last, {"limit": 10, "owner": row.owner, "locale": row.locale})).first() is None
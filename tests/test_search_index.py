@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+import sqlalchemy as sa
+
+from app.core.settings import settings
+from app.models.taxonomy import LanguageEnum
+from app.services import search_index
+from app.services.search_index import CatalogIndex
+from tests.factories import add_news, add_project
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def watched(monkeypatch):
+    """Индекс, которому приходят коммиты сессий, как catalog_index при SEARCH_INDEX_ENABLED."""
+    index = CatalogIndex()
+    monkeypatch.setattr(settings, "SEARCH_INDEX_ENABLED", True)
+    monkeypatch.setattr(search_index, "catalog_index", index)
+    return index
+
+
+async def test_rebuild_indexes_published_rows_per_locale(session, joined_sessions):
+    await add_project(session, "house", names={LanguageEnum.RU: "Дом у реки", LanguageEnum.EN: "River house"})
+    await add_project(session, "draft", names={LanguageEnum.RU: "Дом черновик"}, published=False)
+    await add_news(session, "opening", titles={LanguageEnum.RU: "Открытие дома"})
+    await session.commit()
+    index = CatalogIndex()
+
+    await index.rebuild(joined_sessions)
+
+    assert index.ready
+    assert [(hit.kind, hit.slug) for hit in index.search("дом", "ru", kinds=["project"])] == [("project", "house")]
+    assert {hit.slug for hit in index.search("дом", "ru")} == {"house", "opening"}
+    assert [hit.label for hit in index.search("riv", "en")] == ["River house"]
+
+
+async def test_own_commit_updates_rows_and_version(session, joined_sessions, watched):
+    house = await add_project(session, "house", names={LanguageEnum.RU: "Дом"})
+    await session.commit()
+    index = watched
+    await index.rebuild(joined_sessions)
+    before = index.version
+
+    house.translations[0].name = "Вилла"
+    await add_project(session, "tower", names={LanguageEnum.RU: "Башня"})
+    await session.commit()
+    await index.apply_pending(joined_sessions)
+
+    assert index.version != before
+    # Сверка в run() не увидит чужих изменений: пересборки не будет
+    assert await index.current_version(joined_sessions) == index.version
+    assert index.search("дом", "ru") == []
+    assert [hit.slug for hit in index.search("вилла", "ru")] == ["house"]
+    assert [hit.slug for hit in index.search("башня", "ru")] == ["tower"]
+
+
+async def test_foreign_commit_moves_the_version(session, joined_sessions):
+    await add_project(session, "house", names={LanguageEnum.RU: "Дом"})
+    await session.commit()
+    index = CatalogIndex()
+    await index.rebuild(joined_sessions)
+
+    # Запись без событий этого воркера — как коммит другого процесса
+    await session.execute(sa.text("UPDATE project_i18n SET name = 'Вилла'"))
+    await session.commit()
+
+    assert await index.current_version(joined_sessions) != index.version
+
+
+@pytest.mark.parametrize("foreign_first", [True, False])
+async def test_foreign_commit_next_to_own_is_indexed(session, joined_sessions, watched, foreign_first):
+    house = await add_project(session, "house", names={LanguageEnum.RU: "Дом"})
+    tower = await add_project(session, "tower", names={LanguageEnum.RU: "Башня"})
+    await session.commit()
+    index = watched
+    await index.rebuild(joined_sessions)
+    await index.apply_pending(joined_sessions)
+
+    async def foreign() -> None:
+        # Запись без событий этого воркера — как коммит другого процесса
+        await session.execute(
+            sa.text("UPDATE project_i18n SET name = 'Вилла' WHERE project_id = :id"), {"id": tower.id}
+        )
+        await session.commit()
+
+    if foreign_first:
+        await foreign()
+    house.translations[0].name = "Дворец"
+    await session.commit()
+    if not foreign_first:
+        await foreign()
+
+    task = asyncio.create_task(index.run(joined_sessions, interval=60))
+    try:
+        for _ in range(100):
+            if index.search("вилла", "ru"):
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        task.cancel()
+
+    assert [hit.slug for hit in index.search("вилла", "ru")] == ["tower"]
+    assert [hit.slug for hit in index.search("дворец", "ru")] == ["house"]
+    assert await index.current_version(joined_sessions) == index.version
+
+
+async def test_commit_without_row_keys_forces_rebuild(monkeypatch):
+    index = CatalogIndex()
+    index.version = (1, 1, 1)
+    rebuilt = asyncio.Event()
+
+    async def rebuild(sessions) -> None:
+        rebuilt.set()
+
+    async def current_version(sessions) -> tuple[int, ...]:
+        return index.version
+
+    monkeypatch.setattr(index, "rebuild", rebuild)
+    monkeypatch.setattr(index, "current_version", current_version)
+    task = asyncio.create_task(index.run(sessions=None, interval=60))
+    try:
+        await asyncio.sleep(0.01)
+        assert not rebuilt.is_set()
+        index.request_update({"project"})
+        await asyncio.wait_for(rebuilt.wait(), timeout=1)
+    finally:
+        task.cancel()
@@ -0,0 +1,72 @@
+import json
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel, TypeAdapter
+
+from app.core import serialization
+from app.core.serialization import serializer_for
+from app.models.taxonomy import LanguageEnum
+from app.repositories.news import NewsRepository
+from app.repositories.people import PersonRepository
+from app.repositories.project import ProjectCardRepository, ProjectRepository
+from app.schemas.news import NewsRead
+from app.schemas.people import PersonRead
+from app.schemas.project import ProjectCardRead, ProjectRead
+from tests.factories import add_news, add_person, add_project
+
+
+pytestmark = pytest.mark.anyio
+
+NAMES = {LanguageEnum.RU: "Дом «Север»", LanguageEnum.EN: "North house"}
+
+
+def validated(schema: type[BaseModel], items) -> bytes:
+    return TypeAdapter(list[schema]).dump_json([schema.model_validate(i, from_attributes=True) for i in items])
+
+
+async def seed(session):
+    await add_project(session, "north", names=NAMES, year=2020)
+    await add_project(session, "draft", names=NAMES, published=False)
+    await add_news(session, "opening", titles={LanguageEnum.RU: "Открытие"})
+    await add_person(session, "anna", names={LanguageEnum.EN: "Anna"})
+    session.expunge_all()
+
+
+@pytest.mark.parametrize(
+    "schema, load",
+    [
+        (ProjectRead, lambda s: ProjectRepository(s).list_published_with_relations(profile="list")),
+        (NewsRead, lambda s: NewsRepository(s).list_published_with_relations(profile="list")),
+        (PersonRead, lambda s: PersonRepository(s).list_published_with_relations(profile="list")),
+        (ProjectCardRead, lambda s: ProjectCardRepository(s).list_published("ru")),
+    ],
+)
+async def test_direct_serializer_matches_pydantic(session, schema, load):
+    await seed(session)
+    items = await load(session)
+    assert items
+    assert serializer_for(schema).dump_json(items) == validated(schema, items)
+
+
+async def test_stdlib_json_fallback_matches(session, monkeypatch):
+    await seed(session)
+    items = await ProjectRepository(session).list_published_with_relations(profile="list")
+    expected = serializer_for(ProjectRead).dump_json(items)
+
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert json.loads(serializer_for(ProjectRead).dump_json(items)) == json.loads(expected)
+
+
+def test_defaults_nested_and_decimal():
+    class Item(BaseModel):
+        price: float
+        note: str | None = "n/a"
+
+    class Order(BaseModel):
+        items: list[Item]
+        first: Item | None = None
+
+    order = SimpleNamespace(items=[SimpleNamespace(price=Decimal("1.50"))], first=None)
+    assert serializer_for(Order)(order) == {"items": [{"price": 1.5, "note": "n/a"}], "first": None}
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.db import async_session, read_session
+from app.core.singleflight import SingleFlight
+from app.repositories.project import ProjectRepository
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test")
+    runs = 0
+
+    async def load():
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.01)
+        return runs
+
+    results = await asyncio.gather(*(flight.do("k", load) for _ in range(5)), flight.do("other", load))
+
+    assert results[:5] == [results[0]] * 5
+    assert runs == 2
+    assert flight.snapshot()["coalesced"] == 4
+
+
+async def test_errors_are_shared_and_not_cached():
+    flight = SingleFlight("test")
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+    assert await flight.do("k", lambda: asyncio.sleep(0, "ok")) == "ok"
+
+
+def test_flight_key_includes_the_session_bind():
+    replica = create_async_engine("postgresql+asyncpg://u@replica/db")
+    primary = create_async_engine("postgresql+asyncpg://u@primary/db")
+
+    def key(session):
+        return ProjectRepository(session)._flight_key("published", 10, "ru")
+
+    assert key(read_session(bind=replica)) == key(read_session(bind=replica))
+    assert key(read_session(bind=replica)) != key(read_session(bind=primary))
+    assert key(async_session(bind=primary)) is None
@@ -0,0 +1,39 @@
+import gzip
+import json
+import threading
+
+import pytest
+
+from app.models.taxonomy import LanguageEnum
+from app.services import snapshot
+from app.services.snapshot import SnapshotStore
+from tests.factories import add_news, add_project
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_snapshot_is_built_per_locale_and_compressed_off_loop(session, joined_sessions, monkeypatch):
+    await add_project(session, "house", names={LanguageEnum.RU: "Дом", LanguageEnum.EN: "House"})
+    await add_news(session, "opening")
+    await session.commit()
+
+    threads = set()
+    blob = snapshot._blob
+
+    def tracked(*args):
+        threads.add(threading.current_thread())
+        return blob(*args)
+
+    monkeypatch.setattr(snapshot, "_blob", tracked)
+    store = SnapshotStore()
+    assert await store.refresh(joined_sessions)
+
+    assert threading.main_thread() not in threads
+    en = store.get("en")
+    payload = json.loads(gzip.decompress(en.gzip))
+    assert payload == json.loads(en.body)
+    assert [p["translations"][0]["name"] for p in payload["projects"]] == ["House"]
+    assert [n["slug"] for n in payload["news"]] == ["opening"]
+    assert store.get(LanguageEnum.TK).etag != en.etag
+    assert en.encoded("gzip") == (en.gzip, "gzip")
@@ -0,0 +1,16 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_app_import_configures_all_mappers():
+    # Отдельный процесс: conftest уже импортировал модели и скрыл бы пропущенный импорт
+    code = "import app.main, sqlalchemy.orm; sqlalchemy.orm.configure_mappers()"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, env=os.environ.copy(), capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,45 @@
+import pytest
+
+from app.models.project import Project
+from app.repositories.base import STATEMENT_CACHE_SIZE, ModelMeta, model_meta
+from app.repositories.project import ProjectRepository
+from tests.factories import add_project
+
+
+pytestmark = pytest.mark.anyio
+
+
+def test_model_meta_is_built_once_per_model():
+    meta = model_meta(Project)
+    assert model_meta(Project) is meta
+    assert set(meta.columns) >= {"id", "slug", "year"}
+    assert [c.key for c in meta.primary_key] == ["id"]
+    assert "name" in meta.i18n_columns
+
+
+def test_filter_values_do_not_change_the_shape():
+    repo = ProjectRepository(session=None)
+    first = repo._filter_shape({"slug": "a", "type_id": None, "year": [2001, 2002]})
+    second = repo._filter_shape({"year": [2003], "slug": "b"})
+    assert first[0] == second[0] == (("slug", "eq"), ("year", "in"))
+    assert first[1] != second[1]
+    with pytest.raises(ValueError):
+        repo._filter_shape({"no_such_column": 1})
+
+
+def test_statement_cache_is_bounded():
+    meta = ModelMeta(Project)
+    for i in range(STATEMENT_CACHE_SIZE + 10):
+        meta.statement(("shape", i), lambda: object())
+    assert len(meta.statements) == STATEMENT_CACHE_SIZE
+
+
+async def test_same_shape_reuses_compiled_statement(session):
+    await add_project(session, "a", year=2001)
+    await add_project(session, "b", year=2002)
+    repo = ProjectRepository(session)
+
+    assert [p.slug for p in await repo.list(filters={"year": 2001})] == ["a"]
+    cached = dict(repo.meta.statements)
+    assert [p.slug for p in await repo.list(filters={"year": 2002})] == ["b"]
+    assert repo.meta.statements == cached
@@ -0,0 +1,70 @@
+import pytest
+
+from app.models.location import Location, LocationI18n
+from app.models.taxonomy import LanguageEnum
+from app.repositories.suggest import SuggestRepository, escape_like
+from app.services import suggest as suggest_service
+from tests.factories import add_person, add_project
+
+
+pytestmark = pytest.mark.anyio
+
+
+def test_escape_like():
+    assert escape_like("50%_a\\b") == "50\\%\\_a\\\\b"
+
+
+async def test_suggest_mixes_kinds_of_one_locale(session):
+    house = await add_project(session, "house", names={LanguageEnum.RU: "Дом у моря", LanguageEnum.EN: "Sea house"})
+    await add_project(session, "draft", names={LanguageEnum.RU: "Дом черновик"}, published=False)
+    person = await add_person(session, "ivan", names={LanguageEnum.RU: "Иван Домов"})
+    city = Location(country_code="TM", city_slug="dom")
+    city.translations = [LocationI18n(locale=LanguageEnum.RU, country="Туркменистан", city="Домбай")]
+    session.add(city)
+    await session.flush()
+
+    found = await SuggestRepository(session).suggest("дом", LanguageEnum.RU, limit=10)
+
+    assert {(s.kind, s.id) for s in found} == {("project", house.id), ("person", person.id), ("city", city.id)}
+    assert await SuggestRepository(session).suggest("sea", LanguageEnum.RU, limit=10) == []
+
+
+async def test_prefix_hits_rank_first_and_limit_is_strict(session):
+    for i in range(6):
+        await add_project(session, f"villa-{i}", names={LanguageEnum.RU: f"Вилла {i}"})
+    # "вил" внутри слова — не префикс: может пройти только по близости
+    await add_project(session, "pavilion", names={LanguageEnum.RU: "Павильон"})
+    repo = SuggestRepository(session)
+
+    found = await repo.suggest("вил", LanguageEnum.RU, limit=3)
+    assert len(found) == 3
+    assert all(s.label.startswith("Вилла") for s in found)
+
+    everything = await repo.suggest("вил", LanguageEnum.RU, limit=10)
+    assert [s.label.startswith("Вилла") for s in everything][:6] == [True] * 6
+    assert [s.score for s in everything] == sorted((s.score for s in everything), reverse=True)
+
+
+async def test_like_wildcards_are_literal(session):
+    await add_project(session, "a", names={LanguageEnum.RU: "Дом"})
+    assert await SuggestRepository(session).suggest("%", LanguageEnum.RU, limit=10) == []
+
+
+@pytest.mark.skipif(suggest_service.suggest_lru is None, reason="LRU подсказок выключен")
+async def test_lru_is_cleared_by_commits(session, client):
+    await add_project(session, "house", names={LanguageEnum.RU: "Дом"})
+    await session.commit()
+    await suggest_service.suggest_lru.clear()
+
+    first = await client.get("/public/suggest/ru", params={"q": "Дом"})
+    assert [s["slug"] for s in first.json()] == ["house"]
+    assert first.headers["cache-control"] == "public, max-age=30, s-maxage=300"
+    assert await suggest_service.suggest_lru.get("ru:8:дом") == first.content
+
+    await add_project(session, "home", names={LanguageEnum.RU: "Дом 2"})
+    await session.commit()
+
+    assert await suggest_service.suggest_lru.get("ru:8:дом") is None
+    second = await client.get("/public/suggest/ru", params={"q": "дом"})
+    assert sorted(s["slug"] for s in second.json()) == ["home", "house"]
+    await suggest_service.suggest_lru.clear()
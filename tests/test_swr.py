@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import CachePolicy, MemoryCacheBackend, ResponseCache
+from app.repositories.base import MAX_LIMIT
+from app.repositories.career import CareerRepository
+from app.repositories.news import NewsRepository
+from app.repositories.people import PersonRepository
+from app.repositories.project import ProjectRepository
+
+
+pytestmark = pytest.mark.anyio
+
+SWR = CachePolicy(max_age=60, stale_while_revalidate=600)
+
+
+class Source:
+    def __init__(self) -> None:
+        self.version = 0
+        self.calls = 0
+
+    async def produce(self) -> tuple[bytes, set[str]]:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return f"v{self.version}".encode(), {f"news:{self.version}"}
+
+
+async def settle(cache: ResponseCache) -> None:
+    await asyncio.gather(*cache._refreshing.values())
+
+
+async def test_cold_miss_runs_produce_once():
+    cache, source = ResponseCache(MemoryCacheBackend(), ttl=60), Source()
+    bodies = await asyncio.gather(*(cache.get_or_set("news", "ru", {}, source.produce, policy=SWR) for _ in range(5)))
+    assert {b.body for b in bodies} == {b"v0"}
+    assert source.calls == 1
+    assert bodies[0].keys == ("news:0",)
+
+
+async def test_invalidated_entry_is_served_stale_then_refreshed():
+    cache, source = ResponseCache(MemoryCacheBackend(), ttl=60), Source()
+    await cache.get_or_set("news", "ru", {}, source.produce, policy=SWR)
+
+    source.version = 1
+    await cache.invalidate({"news"})
+    stale = await cache.get_or_set("news", "ru", {}, source.produce, policy=SWR)
+    assert (stale.body, stale.stale) == (b"v0", True)
+
+    await settle(cache)
+    fresh = await cache.get_or_set("news", "ru", {}, source.produce, policy=SWR)
+    assert (fresh.body, fresh.stale) == (b"v1", False)
+    assert source.calls == 2
+
+
+async def test_refresh_failure_keeps_the_stale_copy():
+    cache, source = ResponseCache(MemoryCacheBackend(), ttl=60), Source()
+    await cache.get_or_set("news", "ru", {}, source.produce, policy=SWR)
+    await cache.invalidate({"news"})
+
+    async def broken():
+        raise RuntimeError("db down")
+
+    assert (await cache.get_or_set("news", "ru", {}, broken, policy=SWR)).body == b"v0"
+    await settle(cache)
+    assert (await cache.get_or_set("news", "ru", {}, source.produce, policy=SWR)).body == b"v0"
+
+
+async def test_public_list_limit_is_capped(client):
+    assert (await client.get("/public/news/ru", params={"limit": MAX_LIMIT + 1})).status_code == 422
+    assert (await client.get("/public/news/ru", params={"limit": MAX_LIMIT})).status_code == 200
+
+
+@pytest.mark.parametrize("repo_cls", [NewsRepository, PersonRepository, ProjectRepository, CareerRepository])
+async def test_repositories_share_the_cap(session, repo_cls):
+    with pytest.raises(ValueError):
+        await repo_cls(session).list_published_with_relations(limit=MAX_LIMIT + 1)
@@ -0,0 +1,62 @@
+import pytest
+
+from app.models.project import ProjectStyle, ProjectType, ProjectTypeI18n
+from app.models.taxonomy import LanguageEnum
+from app.services.taxonomy import get_filter_taxonomy, taxonomy_cache
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    taxonomy_cache.invalidate()
+    yield
+    taxonomy_cache.invalidate()
+
+
+async def add_type(session, key: str, order_index: int, titles: dict[LanguageEnum, str]) -> ProjectType:
+    item = ProjectType(key=key, order_index=order_index, visible=True)
+    item.translations = [ProjectTypeI18n(locale=locale, title=title) for locale, title in titles.items()]
+    session.add(item)
+    await session.flush()
+    return item
+
+
+async def test_second_read_hits_the_cache(session, read_sessions, count_queries):
+    await add_type(session, "house", 1, {LanguageEnum.RU: "Дом", LanguageEnum.EN: "House"})
+    await add_type(session, "office", 2, {LanguageEnum.RU: "Офис"})
+    session.add(ProjectStyle(key="hidden", order_index=1, visible=False))
+    await session.commit()
+    count_queries.clear()
+
+    taxonomy = await get_filter_taxonomy("en", "ru")
+    assert [(t["key"], t["title"]) for t in taxonomy["types"]] == [("house", "House"), ("office", "Офис")]
+    assert taxonomy["styles"] == []
+    assert count_queries
+
+    count_queries.clear()
+    assert (await get_filter_taxonomy("ru"))["types"][0]["title"] == "Дом"
+    assert count_queries == []
+
+
+async def test_commit_invalidates_the_snapshot(session, read_sessions):
+    item = await add_type(session, "house", 1, {LanguageEnum.EN: "House"})
+    await session.commit()
+    assert (await get_filter_taxonomy("en"))["types"][0]["title"] == "House"
+
+    item.translations[0].title = "Home"
+    await session.commit()
+
+    assert taxonomy_cache.peek() is None
+    assert (await get_filter_taxonomy("en"))["types"][0]["title"] == "Home"
+
+
+async def test_taxonomy_route(session, client):
+    await add_type(session, "house", 1, {LanguageEnum.RU: "Дом"})
+    await session.commit()
+
+    response = await client.get("/public/taxonomy/en", params={"fallback": "ru"})
+
+    assert response.status_code == 200
+    assert [(t["key"], t["title"]) for t in response.json()["types"]] == [("house", "Дом")]
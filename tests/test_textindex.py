@@ -0,0 +1,106 @@
+import math
+
+import pytest
+
+from app.core.textindex import InvertedIndex, tokenize
+
+
+def bm25(index: InvertedIndex, documents: dict[str, dict[str, str]], term: str, key: str) -> float:
+    """BM25 по определению: взвешенная частота и длина документа по полям."""
+    def weighted(document, token=None):
+        return sum(
+            weight * sum(1 for t in tokenize(document.get(name)) if token is None or t == token)
+            for name, weight in index.fields.items()
+        )
+
+    n = len(documents)
+    containing = sum(1 for d in documents.values() if weighted(d, term))
+    average = sum(weighted(d) for d in documents.values()) / n
+    idf = math.log(1.0 + (n - containing + 0.5) / (containing + 0.5))
+    tf = weighted(documents[key], term)
+    return idf * tf * (index.k1 + 1.0) / (tf + index.k1 * (1.0 - index.b + index.b * weighted(documents[key]) / average))
+
+
+def test_tokenize():
+    assert tokenize("Ёлка, дом-2  A_b") == ["елка", "дом", "2", "a_b"]
+    assert tokenize(None) == []
+
+
+def test_add_replace_and_remove():
+    index = InvertedIndex({"name": 1.0})
+    index.add("a", {"name": "Белый дом"})
+    index.add("b", {"name": "Дом у моря"})
+    assert len(index) == 2
+    assert {key for key, _ in index.search("дом")} == {"a", "b"}
+
+    index.add("a", {"name": "Красная башня"})
+    assert [key for key, _ in index.search("дом")] == ["b"]
+    assert [key for key, _ in index.search("башня")] == ["a"]
+
+    assert index.remove("b")
+    assert not index.remove("b")
+    assert "b" not in index
+    assert index.search("дом") == []
+
+    index.add("empty", {"name": None})
+    assert "empty" not in index
+
+
+def test_renumber_keeps_postings_sorted_and_searchable():
+    index = InvertedIndex({"name": 1.0})
+    for i in range(300):
+        index.add(i, {"name": f"дом номер{i} {'чётный' if i % 2 == 0 else 'нечётный'}"})
+    for i in range(0, 300, 3):
+        index.remove(i)
+    for i in range(1, 300, 3):
+        index.remove(i)
+
+    assert len(index._keys) < 300
+    assert len(index) == 100
+    for docs, tfs in index._postings.values():
+        assert list(docs) == sorted(docs) and len(docs) == len(tfs)
+    alive = set(range(2, 300, 3))
+    assert {key for key, _ in index.search("дом", limit=500)} == alive
+    assert {key for key, _ in index.search("четный", limit=500)} == {i for i in alive if i % 2 == 0}
+    assert [key for key, _ in index.search("номер5", prefix=False)] == [5]
+
+
+def test_last_word_is_a_prefix():
+    index = InvertedIndex({"name": 1.0})
+    index.add("a", {"name": "Архитектурное бюро"})
+    index.add("b", {"name": "Архив города"})
+    index.add("c", {"name": "Бюро переводов"})
+
+    assert {key for key, _ in index.search("арх")} == {"a", "b"}
+    assert [key for key, _ in index.search("архитектурное бю")] == ["a"]
+    # Префиксом разворачивается только последнее слово
+    assert index.search("арх бюро") == []
+    assert index.search("арх", prefix=False) == []
+
+
+def test_scores_follow_bm25():
+    fields = {"title": 5.0, "body": 1.0}
+    documents = {
+        "title": {"title": "Выставка", "body": "Открытие в среду"},
+        "body": {"title": "Новости", "body": "В среду открылась выставка"},
+        "long": {"title": "Обзор", "body": "выставка " + "слово " * 40},
+        "other": {"title": "Лекция", "body": "Об архитектуре"},
+    }
+    index = InvertedIndex(fields)
+    index.update(documents.items())
+
+    hits = index.search("выставка", prefix=False)
+
+    assert [key for key, _ in hits] == ["title", "body", "long"]
+    for key, score in hits:
+        assert score == pytest.approx(bm25(index, documents, "выставка", key), rel=1e-5)
+
+
+def test_all_words_are_required_and_limit_applies():
+    index = InvertedIndex({"name": 1.0})
+    for i in range(20):
+        index.add(i, {"name": f"дом {'сад' if i < 5 else ''}"})
+    assert {key for key, _ in index.search("дом сад", limit=50)} == set(range(5))
+    assert len(index.search("дом", limit=3)) == 3
+    assert index.search("дом", limit=0) == []
+    assert index.memory_bytes() > 0
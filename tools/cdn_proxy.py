@@ -0,0 +1,121 @@
+"""Локальная замена CDN: кэширующий прокси перед приложением с очисткой по суррогатным ключам.
+
+    python -m tools.cdn_proxy --port 8081
+    CDN_PURGE_URL=http://127.0.0.1:8081/purge  (в окружении приложения)
+
+Кэширует GET-ответы 200 с Cache-Control: public по s-maxage (иначе max-age), ключ —
+путь, строка запроса и Accept-Encoding. Заголовок X-Cache: HIT | MISS.
+POST /purge с заголовком Surrogate-Key "k1 k2" снимает все ответы с любым из ключей
+(как пакетная очистка Fastly); ответ — {"purged": <число ответов>}.
+"""
+from dataclasses import dataclass
+import argparse
+import json
+import re
+import time
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+@dataclass(slots=True)
+class Entry:
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    keys: frozenset[str]
+    expires_at: float
+
+
+def _ttl(cache_control: str) -> float | None:
+    directives = {}
+    for part in cache_control.lower().split(","):
+        name, _, value = part.strip().partition("=")
+        directives[name] = value
+    if "public" not in directives or "no-store" in directives or "private" in directives:
+        return None
+    for name in ("s-maxage", "max-age"):
+        if re.fullmatch(r"\d+", directives.get(name, "")):
+            return float(directives[name])
+    return None
+
+
+class CachingProxy:
+    def __init__(self, upstream: ASGIApp) -> None:
+        self.upstream = upstream
+        self.entries: dict[str, Entry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def purge(self, keys: set[str]) -> int:
+        doomed = [k for k, entry in self.entries.items() if entry.keys & keys]
+        for k in doomed:
+            del self.entries[k]
+        return len(doomed)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.upstream(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        if scope["method"] == "POST" and scope["path"] == "/purge":
+            purged = self.purge(set(headers.get("surrogate-key", "").split()))
+            await _reply(send, 200, json.dumps({"purged": purged}).encode())
+            return
+        if scope["method"] != "GET":
+            await self.upstream(scope, receive, send)
+            return
+
+        key = f"{scope['path']}?{scope['query_string'].decode()}|{headers.get('accept-encoding', '')}"
+        entry = self.entries.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self.hits += 1
+            await send({"type": "http.response.start", "status": entry.status, "headers": [*entry.headers, (b"x-cache", b"HIT")]})
+            await send({"type": "http.response.body", "body": entry.body})
+            return
+        self.misses += 1
+
+        start: Message = {}
+        chunks: list[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                message = {**message, "headers": [*message.get("headers", []), (b"x-cache", b"MISS")]}
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.upstream(scope, receive, capture)
+        response_headers = Headers(raw=start.get("headers", []))
+        ttl = _ttl(response_headers.get("cache-control", ""))
+        if start.get("status") == 200 and ttl:
+            self.entries[key] = Entry(
+                status=200,
+                headers=list(start["headers"]),
+                body=b"".join(chunks),
+                keys=frozenset(response_headers.get("surrogate-key", "").split()),
+                expires_at=time.monotonic() + ttl,
+            )
+
+
+async def _reply(send: Send, status: int, body: bytes) -> None:
+    await send({"type": "http.response.start", "status": status, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": body})
+
+
+def main() -> None:
+    import uvicorn
+
+    from app.main import app
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    args = parser.parse_args()
+    uvicorn.run(CachingProxy(app), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Пересчёт search_vector существующих переводов (после смены конфигурации поиска).
+
+    python -m tools.reindex_search --batch-size 500 --pause 0.2
+    python -m tools.reindex_search --table news_i18n
+
+Строки проходятся по первичному ключу пачками; каждая пачка — отдельная короткая
+транзакция с lock_timeout, поэтому строки не держатся заблокированными дольше одной
+пачки, а строку, занятую редактором, пачка ждёт не дольше lock_timeout и повторяется
+позже. Переписываются только строки, чей вектор отличается от вычисленного, —
+повторный запуск почти ничего не пишет. Между пачками — пауза, чтобы не забивать
+диск и реплики WAL.
+
+Пачки ставят arhea.reindex = on: версии контента не сбрасываются (search_vector
+не виден в публичных ответах), карточки project_card не пересобираются — их
+триггеры не слушают search_vector.
+"""
+import argparse
+import asyncio
+import time
+
+import sqlalchemy as sa
+from sqlalchemy.exc import DBAPIError
+
+from app.core.db import engine
+
+
+# Таблица -> (ключ, выражение нового вектора) — совпадает с триггерами set_*_i18n_tsv
+TABLES = {
+    "project_i18n": (
+        "project_id",
+        "project_i18n_search_vector(t.locale, t.name, t.subname, t.client_name, t.short_description, t.full_description)",
+    ),
+    "news_i18n": (
+        "news_id",
+        "news_i18n_search_vector(t.locale, t.title, t.short_description, t.full_description)",
+    ),
+}
+
+LOCK_NOT_AVAILABLE = "55P03"
+
+
+def batch_statement(table: str, first: bool) -> sa.TextClause:
+    owner, vector = TABLES[table]
+    after = "" if first else f"WHERE ({owner}, locale) > (:owner, CAST(:locale AS language_enum))"
+    return sa.text(
+        f"""
+WITH batch AS (
+  SELECT {owner}, locale FROM {table}
+  {after}
+  ORDER BY {owner}, locale
+  LIMIT :limit
+), updated AS (
+  UPDATE {table} t SET search_vector = {vector}
+  FROM batch b
+  WHERE t.{owner} = b.{owner} AND t.locale = b.locale
+    AND t.search_vector IS DISTINCT FROM {vector}
+  RETURNING 1
+)
+SELECT last.{owner} AS owner, CAST(last.locale AS text) AS locale,
+       (SELECT count(*) FROM batch) AS seen, (SELECT count(*) FROM updated) AS updated
+FROM (SELECT {owner}, locale FROM batch ORDER BY {owner} DESC, locale DESC LIMIT 1) last
+"""
+    )
+
+
+async def reindex_table(
+    table: str, batch_size: int, pause: float, lock_timeout_ms: int, retries: int
+) -> tuple[int, int]:
+    """Возвращает (просмотрено, переписано)."""
+    seen = updated = 0
+    position: dict | None = None
+    attempt = 0
+    while True:
+        params = {"limit": batch_size, **(position or {})}
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(sa.text(f"SET LOCAL lock_timeout = {int(lock_timeout_ms)}"))
+                await conn.execute(sa.text("SET LOCAL arhea.reindex = 'on'"))
+                row = (await conn.execute(batch_statement(table, position is None), params)).one_or_none()
+        except DBAPIError as e:
+            if getattr(e.orig, "pgcode", None) != LOCK_NOT_AVAILABLE or attempt >= retries:
+                raise
+            attempt += 1
+            await asyncio.sleep(pause * 2 ** attempt)
+            continue
+        attempt = 0
+        if row is None:
+            return seen, updated
+        seen += row.seen
+        updated += row.updated
+        position = {"owner": row.owner, "locale": row.locale}
+        print(f"{table}: {seen} seen, {updated} rewritten", flush=True)
+        if row.seen < batch_size:
+            return seen, updated
+        await asyncio.sleep(pause)
+
+
+async def run(tables: list[str], batch_size: int, pause: float, lock_timeout_ms: int, retries: int) -> None:
+    try:
+        for table in tables:
+            started = time.perf_counter()
+            seen, updated = await reindex_table(table, batch_size, pause, lock_timeout_ms, retries)
+            print(f"{table}: done, {seen} rows, {updated} rewritten in {time.perf_counter() - started:.1f}s")
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--table", choices=sorted(TABLES), action="append", help="по умолчанию — все")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.2, help="секунд между пачками")
+    parser.add_argument("--lock-timeout", type=int, default=2000, help="мс ожидания блокировки строки")
+    parser.add_argument("--retries", type=int, default=5, help="повторов пачки после lock_timeout")
+    args = parser.parse_args()
+    if args.batch_size < 1:
+        parser.error("--batch-size must be positive")
+    asyncio.run(run(args.table or list(TABLES), args.batch_size, args.pause, args.lock_timeout, args.retries))
+
+
+if __name__ == "__main__":
+    main()